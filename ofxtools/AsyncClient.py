@@ -0,0 +1,785 @@
+# coding: utf-8
+"""
+Asynchronous variant of ``ofxtools.Client.OFXClient`` for downloading OFX from
+many FIs / users concurrently within a single thread.
+
+``AsyncOFXClient`` is configured exactly like ``OFXClient`` and composes the
+same requests; the difference is that the request methods are coroutines.
+HTTP is spoken over ``asyncio`` streams (with stdlib ``ssl``), keeping
+connections alive between requests and limiting the number of concurrent
+requests sent to each host.  CPU-bound parsing of OFX responses (e.g. the
+profile parsed to look up service URLs) is handed off to an executor so it
+doesn't stall the event loop.
+
+For example:
+
+>>> import asyncio
+>>> from ofxtools.AsyncClient import AsyncOFXClient
+>>> async def download(password, *stmtrqs):
+...     async with AsyncOFXClient("https://ofx.chase.com", userid="MoMoney",
+...                               org="B1", fid="10898", version=220,
+...                               bankid="111000614") as client:
+...         response = await client.request_statements(password, *stmtrqs)
+...         return await client.parse(response)
+>>> ofx = asyncio.run(download("t0ps3kr1t", s0, s1, c0))  # doctest: +SKIP
+"""
+
+
+__all__ = ["AsyncHTTPTransport", "AsyncOFXClient"]
+
+
+# stdlib imports
+import asyncio
+import concurrent.futures
+import datetime
+import http.client
+import http.cookiejar
+import logging
+import ssl
+import time
+import urllib.error as urllib_error
+import urllib.parse as urllib_parse
+import urllib.request as urllib_request
+import weakref
+from io import BytesIO
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    BinaryIO,
+    Any,
+    Callable,
+    Sequence,
+    AsyncIterator,
+    Union,
+)
+
+
+# local imports
+from ofxtools.Client import OFXClient, RequestParam, PoolKey
+from ofxtools.models.ofx import OFX
+from ofxtools.Parser import OFXTree
+
+
+logger = logging.getLogger(__name__)
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class _Response:
+    """Minimal response object for ``CookieJar.extract_cookies()``."""
+
+    def __init__(self, msg: http.client.HTTPMessage):
+        self.msg = msg
+
+    def info(self) -> http.client.HTTPMessage:
+        return self.msg
+
+
+class AsyncHTTPTransport:
+    """
+    Keep-alive HTTP/1.1 connection pool built on ``asyncio`` streams.
+
+    ``limit_per_host`` - max # of concurrent requests in flight to each host
+    ``pool_size`` - max # of idle connections kept open per host
+    ``idle_timeout`` - seconds an idle connection is kept before being discarded
+    ``cookiejar`` - ``http.cookiejar.CookieJar`` shared by all requests, or None
+    ``ssl_context`` - ``ssl.SSLContext`` for HTTPS connections
+
+    HTTP errors are raised as ``urllib.error.HTTPError``, and redirects are
+    followed, same as the synchronous ``ofxtools.Client.HTTPClientTransport``.
+
+    Connections and per-host limits belong to the event loop they were created
+    on, so they're kept separately for each running loop; the transport can be
+    reused under successive ``asyncio.run()`` calls.
+    """
+
+    max_redirects = 10
+
+    def __init__(
+        self,
+        limit_per_host: int = 4,
+        pool_size: int = 10,
+        idle_timeout: float = 60.0,
+        cookiejar: Optional[http.cookiejar.CookieJar] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        if limit_per_host < 1:
+            raise ValueError(f"limit_per_host must be positive, not {limit_per_host}")
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be positive, not {pool_size}")
+        self.limit_per_host = limit_per_host
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.cookiejar = cookiejar
+        if ssl_context is None:
+            ssl_context = ssl.create_default_context()
+        self.ssl_context = ssl_context
+        self._idle_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._limits_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def _idle(self) -> Dict[PoolKey, List[Tuple[Connection, float]]]:
+        """Idle connections opened on the running event loop."""
+        return self._idle_by_loop.setdefault(asyncio.get_running_loop(), {})
+
+    @property
+    def _limits(self) -> Dict[PoolKey, asyncio.Semaphore]:
+        """Per-host semaphores for the running event loop."""
+        return self._limits_by_loop.setdefault(asyncio.get_running_loop(), {})
+
+    async def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        POST ``data`` to ``url``; return the response body.
+
+        Redirects are followed like ``urlopen()`` does: 301/302/303 by a GET
+        without the request body, 307/308 by repeating the request.
+        """
+        method: str = "POST"
+        body: Optional[bytes] = data
+        for _ in range(self.max_redirects + 1):
+            status, reason, msg, content = await self._request(
+                method, url, body, headers, timeout
+            )
+            location = msg.get("Location")
+            if status not in (301, 302, 303, 307, 308) or not location:
+                break
+            url = urllib_parse.urljoin(url, location)
+            if status in (301, 302, 303):
+                method, body = "GET", None
+                headers = {
+                    k: v
+                    for k, v in headers.items()
+                    if k.lower() not in ("content-length", "content-type")
+                }
+            logger.info(f"Following HTTP {status} redirect to {method} {url}")
+
+        if status >= 400 or status in (301, 302, 303, 307, 308):
+            raise urllib_error.HTTPError(url, status, reason, msg, BytesIO(content))
+        return content
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        split = urllib_parse.urlsplit(url)
+        scheme = split.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise urllib_error.URLError(f"unknown url type: {scheme!r}")
+        port = split.port or (443 if scheme == "https" else 80)
+        key = (scheme, split.hostname or "", port)
+        target = urllib_parse.urlunsplit(("", "", split.path or "/", split.query, ""))
+
+        request = urllib_request.Request(url, data=data, headers=headers, method=method)
+        if self.cookiejar is not None:
+            self.cookiejar.add_cookie_header(request)
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {split.netloc}"]
+        lines.extend(f"{k}: {v}" for k, v in request.header_items())
+        if data is not None:
+            lines.append(f"Content-Length: {len(data)}")
+        lines.extend(["", ""])
+        message = "\r\n".join(lines).encode("latin-1") + (data or b"")
+
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.limit_per_host)
+
+        async with limit:
+            status, reason, msg, body = await asyncio.wait_for(
+                self._exchange(key, message), timeout
+            )
+
+        if self.cookiejar is not None:
+            self.cookiejar.extract_cookies(_Response(msg), request)  # type: ignore
+
+        return status, reason, msg, body
+
+    async def _exchange(
+        self, key: PoolKey, message: bytes
+    ) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        """Send a serialized HTTP request over a pooled connection; read response"""
+        conn, reused = self._acquire(key)
+        if conn is None:
+            conn = await self._connect(key)
+
+        try:
+            try:
+                response = await self._roundtrip(conn, message)
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionError,
+                asyncio.IncompleteReadError,
+            ):
+                if not reused:
+                    raise
+                # Server closed a pooled keep-alive connection; retry once.
+                logger.debug(f"Stale pooled connection to {key}; reconnecting")
+                conn[1].close()
+                conn = await self._connect(key)
+                response = await self._roundtrip(conn, message)
+        except BaseException:
+            conn[1].close()
+            raise
+
+        status, reason, msg, body, will_close = response
+        self._release(key, conn, will_close)
+        return status, reason, msg, body
+
+    @staticmethod
+    async def _roundtrip(
+        conn: Connection, message: bytes
+    ) -> Tuple[int, str, http.client.HTTPMessage, bytes, bool]:
+        reader, writer = conn
+        writer.write(message)
+        await writer.drain()
+
+        # Skip any informational (1xx) responses
+        while True:
+            statusline = await reader.readline()
+            if not statusline:
+                raise http.client.RemoteDisconnected(
+                    "Remote end closed connection without response"
+                )
+            try:
+                version, status_, *reason_ = statusline.decode("latin-1").split(None, 2)
+                status = int(status_)
+            except ValueError:
+                raise http.client.BadStatusLine(statusline.decode("latin-1"))
+            reason = reason_[0].strip() if reason_ else ""
+
+            headers = BytesIO()
+            while True:
+                line = await reader.readline()
+                headers.write(line)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            headers.seek(0)
+            msg = http.client.parse_headers(headers)
+            if not 100 <= status < 200:
+                break
+
+        connection = msg.get("Connection", "").lower()
+        will_close = connection == "close" or (
+            version == "HTTP/1.0" and connection != "keep-alive"
+        )
+
+        if "chunked" in msg.get("Transfer-Encoding", "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    # Discard trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif msg.get("Content-Length") is not None:
+            body = await reader.readexactly(int(msg["Content-Length"]))
+        elif status in (204, 304):
+            body = b""
+        else:
+            body = await reader.read()
+            will_close = True
+
+        return status, reason, msg, body, will_close
+
+    def _acquire(self, key: PoolKey) -> Tuple[Optional[Connection], bool]:
+        """Return (idle connection or None, whether it was reused from the pool)."""
+        now = time.monotonic()
+        idle = self._idle.get(key, [])
+        while idle:
+            conn, last_used = idle.pop()
+            if now - last_used <= self.idle_timeout and not conn[0].at_eof():
+                return conn, True
+            conn[1].close()
+        return None, False
+
+    async def _connect(self, key: PoolKey) -> Connection:
+        scheme, host, port = key
+        logger.debug(f"Opening new connection to {scheme}://{host}:{port}")
+        if scheme == "https":
+            return await asyncio.open_connection(
+                host, port, ssl=self.ssl_context, server_hostname=host
+            )
+        return await asyncio.open_connection(host, port)
+
+    def _release(self, key: PoolKey, conn: Connection, will_close: bool) -> None:
+        idle = self._idle.setdefault(key, [])
+        if will_close or len(idle) >= self.pool_size:
+            conn[1].close()
+        else:
+            idle.append((conn, time.monotonic()))
+
+    async def close(self) -> None:
+        """Close all connections pooled on the running event loop."""
+        idle = self._idle_by_loop.pop(asyncio.get_running_loop(), {})
+        writers = [writer for conns in idle.values() for (_, writer), _ in conns]
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncOFXClient(OFXClient):
+    """
+    OFX client whose request methods are coroutines.
+
+    Takes the same arguments as ``OFXClient``, plus:
+        ``limit_per_host`` - max # of concurrent requests in flight to each host
+        ``executor`` - ``concurrent.futures.Executor`` used to parse OFX
+            responses (default: the event loop's default executor)
+
+    Use as an async context manager (or await ``close()``) to shut down the
+    connection pool.
+    """
+
+    limit_per_host: int = 4
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        limit_per_host: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        **kwargs,
+    ):
+        super().__init__(url, *args, **kwargs)
+        if limit_per_host is not None:
+            self.limit_per_host = limit_per_host
+        self.executor = executor
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:  # type: ignore[override]
+        """Persistent HTTP connection pool used to POST requests."""
+        if self._transport is None:
+            self._transport = AsyncHTTPTransport(  # type: ignore
+                limit_per_host=self.limit_per_host,
+                pool_size=self.pool_size,
+                idle_timeout=self.idle_timeout,
+                cookiejar=self.cookiejar if self.persist_cookies else None,
+            )
+        return self._transport  # type: ignore
+
+    async def close(self) -> None:  # type: ignore[override]
+        """Close pooled HTTP connections."""
+        if self._transport is not None:
+            await self._transport.close()  # type: ignore
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' for AsyncOFXClient")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _run_in_executor(self, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def parse(self, response: BinaryIO) -> OFX:
+        """Parse & convert an OFX response in the executor."""
+
+        def parse():
+            parser = OFXTree()
+            parser.parse(response)
+            return parser.convert()
+
+        return await self._run_in_executor(parse)
+
+    async def request_statements(  # type: ignore[override]
+        self,
+        password: str,
+        *requests: RequestParam,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+        shard: Optional[Union[str, datetime.timedelta]] = None,
+        max_parallel: Optional[int] = None,
+    ) -> BinaryIO:
+        """
+        Package and send OFX statement requests
+        (STMTRQ/CCSTMTRQ/INVSTMTRQ/STMTENDRQ/CCSTMTENDRQ).
+
+        Responses from several service URLs, or from several date range windows
+        if ``shard`` is given, are merged into a single OFX response, as for
+        ``OFXClient.request_statements()``.
+        """
+        if shard is not None:
+            return await self._request_sharded(
+                password,
+                requests,
+                shard,
+                max_parallel=max_parallel,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+                skip_profile=skip_profile,
+            )
+
+        responses = {
+            url: response
+            async for url, response in self.dispatch_statements(
+                password,
+                *requests,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+                skip_profile=skip_profile,
+            )
+        }
+        if len(responses) == 1:
+            return responses.popitem()[1]
+
+        return await self._run_in_executor(
+            self._merge_responses, [responses[url] for url in sorted(responses)]
+        )
+
+    async def _request_sharded(  # type: ignore[override]
+        self,
+        password: str,
+        requests: Sequence[RequestParam],
+        shard: Union[str, datetime.timedelta],
+        max_parallel: Optional[int] = None,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> BinaryIO:
+        """Send statement requests split into date range windows; merge results."""
+        if dryrun or skip_profile:
+            RqCls2url = None
+        else:
+            RqCls2url = await self._get_service_urls(
+                timeout=timeout,
+                gen_newfileuid=gen_newfileuid,
+            )
+        jobs = self._sharded_jobs(requests, shard, dryrun, RqCls2url)
+        semaphore = asyncio.Semaphore(max_parallel or self.pool_size)
+
+        async def send(url, rqs):
+            async with semaphore:
+                return await self._send_statements(
+                    password,
+                    url,
+                    rqs,
+                    gen_newfileuid=gen_newfileuid,
+                    dryrun=dryrun,
+                    timeout=timeout,
+                )
+
+        # gather() returns responses in chronological order of shards
+        responses = await asyncio.gather(*[send(url, rqs) for url, rqs in jobs])
+        return await self._run_in_executor(self._merge_shards, responses, dryrun)
+
+    async def dispatch_statements(  # type: ignore[override]
+        self,
+        password: str,
+        *requests: RequestParam,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> AsyncIterator[Tuple[str, BinaryIO]]:
+        """
+        Package OFX statement requests into one OFX request per service URL
+        listed in the FI profile, and send them concurrently.
+
+        Asynchronously yields (url, response) pairs in the order the responses
+        arrive.
+        """
+        if dryrun or skip_profile:
+            RqCls2url = None
+        else:
+            logger.info("Requesting OFX profile to extract service URLs")
+            RqCls2url = await self._get_service_urls(
+                timeout=timeout,
+                gen_newfileuid=gen_newfileuid,
+            )
+        groups = self._statement_groups(requests, dryrun, RqCls2url)
+
+        async def send(url, rqs):
+            response = await self._send_statements(
+                password,
+                url,
+                rqs,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+            )
+            return url, response
+
+        tasks = [asyncio.ensure_future(send(url, rqs)) for url, rqs in groups.items()]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send_statements(  # type: ignore[override]
+        self,
+        password: str,
+        url: str,
+        requests: Sequence[RequestParam],
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+    ) -> BinaryIO:
+        """Package statement requests as a single OFX request & POST to url."""
+        ofx = self._statements_ofx(password, *requests)
+
+        if gen_newfileuid:
+            newfileuid = self.uuid
+        else:
+            newfileuid = None
+
+        return await self.download(
+            ofx,
+            newfileuid=newfileuid,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+    async def _resolve_url(
+        self,
+        dryrun: bool,
+        skip_profile: bool,
+        timeout: Optional[float],
+        gen_newfileuid: bool,
+    ) -> str:
+        if dryrun:
+            return ""
+        if skip_profile:
+            return self.url
+
+        logger.info("Requesting OFX profile to extract service URLs")
+        RqCls2url = await self._get_service_urls(
+            timeout=timeout,
+            gen_newfileuid=gen_newfileuid,
+        )
+        url = self._service_url(RqCls2url)
+        logger.info(f"Received service url={url} from OFX profile response")
+        return url
+
+    async def _get_service_urls(  # type: ignore[override]
+        self,
+        timeout: Optional[float] = None,
+        gen_newfileuid: bool = True,
+    ) -> dict:
+        """Query OFX profile endpoint to construct mapping of statement request
+        data container to URL providing that service.
+        """
+        cached = await self._run_in_executor(self._read_profile_cache)
+        if cached is not None and cached.urls is not None and self._is_fresh(cached):
+            logger.info("Using service URLs from cached OFX profile")
+            return dict(cached.urls)
+
+        profile = await self.request_profile(
+            gen_newfileuid=gen_newfileuid,
+            timeout=timeout,
+        )
+        return await self._run_in_executor(self._memoize_service_urls, profile)
+
+    async def request_profile(  # type: ignore[override]
+        self,
+        version: Optional[int] = None,
+        gen_newfileuid: bool = True,
+        prettyprint: Optional[bool] = None,
+        close_elements: Optional[bool] = None,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        url: Optional[str] = None,
+        persist: bool = True,
+    ) -> BinaryIO:
+        """Request/cache OFX profiles (PROFRS).
+
+        See ``OFXClient.request_profile()`` for use of the cache.
+        """
+        cached = await self._run_in_executor(self._read_profile_cache)
+        overrides = (version, prettyprint, close_elements, url)
+        if cached is not None and not dryrun and overrides == (None,) * 4:
+            if self._is_fresh(cached):
+                logger.info("Using cached OFX profile")
+                return BytesIO(cached.profrs)
+
+        response = await self._request_profile(
+            dtprofup=cached.dtprofup if cached else None,
+            version=version,
+            gen_newfileuid=gen_newfileuid,
+            prettyprint=prettyprint,
+            close_elements=close_elements,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+        if dryrun:
+            return response
+
+        return await self._run_in_executor(
+            self._update_profile_cache, response, cached
+        )
+
+    async def _request_profile(  # type: ignore[override]
+        self,
+        dtprofup: Optional[datetime.datetime] = None,
+        version: Optional[int] = None,
+        gen_newfileuid: bool = True,
+        prettyprint: Optional[bool] = None,
+        close_elements: Optional[bool] = None,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        url: Optional[str] = None,
+    ) -> BytesIO:
+        """Package and send OFX profile requests (PROFRQ)."""
+        ofx = self._profile_ofx(dtprofup)
+
+        if gen_newfileuid:
+            newfileuid = self.uuid
+        else:
+            newfileuid = None
+
+        return await self.download(
+            ofx,
+            version=version,
+            newfileuid=newfileuid,
+            prettyprint=prettyprint,
+            close_elements=close_elements,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+    async def request_accounts(  # type: ignore[override]
+        self,
+        password: str,
+        dtacctup: datetime.datetime,
+        dryrun: bool = False,
+        version: Optional[int] = None,
+        gen_newfileuid: bool = True,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> BinaryIO:
+        """
+        Package and send OFX account info requests (ACCTINFORQ)
+        """
+        url = await self._resolve_url(dryrun, skip_profile, timeout, gen_newfileuid)
+        ofx = self._accounts_ofx(password, dtacctup)
+
+        if gen_newfileuid:
+            newfileuid = self.uuid
+        else:
+            newfileuid = None
+
+        return await self.download(
+            ofx,
+            newfileuid=newfileuid,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+    async def request_tax1099(  # type: ignore[override]
+        self,
+        password: str,
+        *taxyears: str,
+        acctnum: Optional[str] = None,
+        recid: Optional[str] = None,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> BinaryIO:
+        """
+        Request US federal income tax form 1099 (TAX1099RQ)
+        """
+        url = await self._resolve_url(dryrun, skip_profile, timeout, gen_newfileuid)
+        ofx = self._tax1099_ofx(password, *taxyears, recid=recid)
+
+        if gen_newfileuid:
+            newfileuid = self.uuid
+        else:
+            newfileuid = None
+
+        return await self.download(
+            ofx,
+            newfileuid=newfileuid,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+    async def download(  # type: ignore[override]
+        self,
+        ofx: OFX,
+        version: Optional[int] = None,
+        oldfileuid: Optional[str] = None,
+        newfileuid: Optional[str] = None,
+        prettyprint: Optional[bool] = None,
+        close_elements: Optional[bool] = None,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        url: Optional[str] = None,
+    ) -> BytesIO:
+        """
+        Package complete OFX tree and POST to server.
+
+        See ``OFXClient.download()`` for optional kwargs.
+        """
+        request = self.serialize(
+            ofx,
+            version=version,
+            oldfileuid=oldfileuid,
+            newfileuid=newfileuid,
+            prettyprint=prettyprint,
+            close_elements=close_elements,
+        )
+        logger.debug(f"Finished request: {request.decode()}")
+
+        if dryrun:
+            return BytesIO(request)
+
+        if url is None:
+            url = self.url
+
+        response = await self.post_request(url, request, timeout)
+        return BytesIO(response)
+
+    async def post_request(  # type: ignore[override]
+        self, url: str, serialized_request: bytes, timeout: Optional[float]
+    ) -> bytes:
+        """Separated out to facilitate mocking in unit tests."""
+        if timeout in (None, False):
+            timeout = 10.0
+
+        return await self.transport.post(
+            url, serialized_request, self.http_headers, timeout
+        )
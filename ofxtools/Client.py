@@ -42,6 +42,9 @@ __all__ = [
     "StmtEndRq",
     "CcStmtEndRq",
     "OFXClient",
+    "HTTPTransport",
+    "HTTPClientTransport",
+    "RequestsTransport",
     "wrap_stmtrq",
 ]
 
@@ -49,12 +52,21 @@ __all__ = [
 # stdlib imports
 import logging
 import datetime
+import re
+import http.client
 import http.cookiejar
 import uuid
 import xml.etree.ElementTree as ET
 import urllib.request as urllib_request
+import urllib.error as urllib_error
+import urllib.parse as urllib_parse
 import socket
+import ssl
+import threading
+import time
+import concurrent.futures
 from io import BytesIO
+from pathlib import Path
 import itertools
 from operator import attrgetter, itemgetter
 from functools import singledispatch
@@ -68,6 +80,10 @@ from typing import (
     BinaryIO,
     Type,
     Callable,
+    List,
+    Sequence,
+    Iterable,
+    Any,
 )
 
 
@@ -122,7 +138,8 @@ from ofxtools.models.email import EMAILMSGSET
 from ofxtools.models.tax1099 import TAX1099MSGSET
 from ofxtools.models.tax1099 import TAX1099RQ, TAX1099TRNRQ, TAX1099MSGSRQV1
 from ofxtools.utils import classproperty, UTC
-from ofxtools import utils, config
+from ofxtools.Types import DateTime
+from ofxtools import config
 from ofxtools.Parser import OFXTree
 
 
@@ -193,6 +210,26 @@ class CcStmtEndRq(NamedTuple):
     dtend: Optional[datetime.datetime] = None
 
 
+class CachedProfile(NamedTuple):
+    """
+    FI profile (PROFRS) cached by ``OFXClient.request_profile()``
+    """
+
+    profrs: bytes
+    dtprofup: datetime.datetime
+    # time.time() the server last confirmed the PROFRS as current (i.e. the
+    # on-disk cache file mtime)
+    checked: float
+    # Service URLs parsed from PROFRS by ``OFXClient._get_service_urls()``
+    urls: Optional[dict] = None
+
+
+# In-process memo of profiles cached on disk, keyed by cache file path
+# (i.e. per DATADIR / org / fid).
+_profile_memo: Dict[Path, CachedProfile] = {}
+_profile_memo_lock = threading.Lock()
+
+
 # TYPE ALIASES
 RequestParam = Union[StmtRq, CcStmtRq, InvStmtRq, StmtEndRq, CcStmtEndRq]
 Request = Union[STMTRQ, CCSTMTRQ, INVSTMTRQ, STMTENDRQ, CCSTMTENDRQ]
@@ -213,6 +250,332 @@ MsgsetClass = Union[
 ]
 
 
+# HTTP transports
+# OFXClient hands every serialized request to a transport, which keeps
+# connections open between POSTs so that a PROFRQ followed by a STMTRQ (or
+# the ~30 requests fired by ``ofxget scan``) only pay for one TCP/TLS handshake.
+class HTTPTransport:
+    """
+    Base class for persistent HTTP connection pools used by ``OFXClient``.
+
+    ``pool_size`` - max # of idle connections kept open per host
+    ``idle_timeout`` - seconds an idle connection is kept before being discarded
+    ``cookiejar`` - ``http.cookiejar.CookieJar`` shared by all requests, or None
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        idle_timeout: float = 60.0,
+        cookiejar: Optional[http.cookiejar.CookieJar] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be positive, not {pool_size}")
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.cookiejar = cookiejar
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """POST ``data`` to ``url``; return the response body."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RequestsTransport(HTTPTransport):
+    """
+    Connection pool built on a long-lived ``requests.Session``.
+
+    ``requests`` doesn't expire idle connections itself; we approximate
+    ``idle_timeout`` by recycling the whole session when it's been idle longer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not USE_REQUESTS:
+            raise ImportError("RequestsTransport requires the requests library")
+        super().__init__(*args, **kwargs)
+        self._session = None
+        self._last_used = 0.0
+
+    @property
+    def session(self) -> "requests.Session":
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and now - self._last_used > self.idle_timeout
+            ):
+                logger.debug("Recycling idle requests session")
+                self._session.close()
+                self._session = None
+
+            if self._session is None:
+                sess = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                )
+                sess.mount("https://", adapter)
+                sess.mount("http://", adapter)
+                if self.cookiejar is not None:
+                    sess.cookies = self.cookiejar  # type: ignore
+                else:
+                    # Don't carry cookies over to the next request.  The session
+                    # is shared between threads, so refuse to store them rather
+                    # than clearing the jar out from under concurrent requests.
+                    sess.cookies.set_policy(
+                        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+                    )
+                self._session = sess
+
+            self._last_used = now
+            return self._session
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        response = self.session.request(
+            method="POST", url=url, headers=headers, data=data, timeout=timeout
+        )
+        return response.content
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """``HTTPSConnection`` that resumes a previously negotiated TLS session."""
+
+    tls_session: Optional[ssl.SSLSession] = None
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host  # type: ignore
+        self.sock = self._context.wrap_socket(  # type: ignore
+            self.sock, server_hostname=server_hostname, session=self.tls_session
+        )
+
+
+# (scheme, host, port)
+PoolKey = Tuple[str, str, int]
+
+
+class HTTPClientTransport(HTTPTransport):
+    """
+    Connection pool built on the stdlib ``http.client``.
+
+    Idle connections are kept per host, and TLS sessions are cached per host
+    so that new connections can resume them instead of a full handshake.
+    HTTP errors are raised as ``urllib.error.HTTPError``, same as ``urlopen()``.
+    """
+
+    max_redirects = 10
+
+    def __init__(
+        self,
+        *args,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if ssl_context is None:
+            ssl_context = ssl.create_default_context()
+        self.ssl_context = ssl_context
+        self._idle: Dict[PoolKey, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._tls_sessions: Dict[PoolKey, ssl.SSLSession] = {}
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        POST data to url.  Redirects are followed like ``urlopen()`` does:
+        301/302/303 by a GET without the request body, 307/308 by repeating
+        the request.
+        """
+        method: str = "POST"
+        body: Optional[bytes] = data
+        for _ in range(self.max_redirects + 1):
+            status, reason, msg, content = self._request(
+                method, url, body, headers, timeout
+            )
+            location = msg.get("Location")
+            if status not in (301, 302, 303, 307, 308) or not location:
+                break
+            url = urllib_parse.urljoin(url, location)
+            if status in (301, 302, 303):
+                method, body = "GET", None
+                headers = {
+                    k: v
+                    for k, v in headers.items()
+                    if k.lower() not in ("content-length", "content-type")
+                }
+            logger.info(f"Following HTTP {status} redirect to {method} {url}")
+
+        if status >= 400 or status in (301, 302, 303, 307, 308):
+            raise urllib_error.HTTPError(url, status, reason, msg, BytesIO(content))
+        return content
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        split = urllib_parse.urlsplit(url)
+        scheme = split.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise urllib_error.URLError(f"unknown url type: {scheme!r}")
+        port = split.port or (443 if scheme == "https" else 80)
+        key = (scheme, split.hostname or "", port)
+        target = urllib_parse.urlunsplit(("", "", split.path or "/", split.query, ""))
+        if scheme == "http" and self._proxy(scheme, key[1]):
+            # Plain HTTP proxies expect the absolute URL as the request target
+            target = urllib_parse.urlunsplit(split._replace(fragment=""))
+
+        request = urllib_request.Request(url, data=data, headers=headers, method=method)
+        if self.cookiejar is not None:
+            self.cookiejar.add_cookie_header(request)
+        headers = dict(request.header_items())
+
+        conn, reused = self._acquire(key, timeout)
+        try:
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                if not reused:
+                    raise
+                # Server closed a pooled keep-alive connection; retry once.
+                logger.debug(f"Stale pooled connection to {key}; reconnecting")
+                conn.close()
+                conn, reused = self._connect(key, timeout), False
+                conn.request(method, target, body=data, headers=headers)
+                response = conn.getresponse()
+
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        if self.cookiejar is not None:
+            self.cookiejar.extract_cookies(response, request)  # type: ignore
+
+        self._release(key, conn, response.will_close)
+        return response.status, response.reason, response.msg, body
+
+    def _acquire(
+        self, key: PoolKey, timeout: Optional[float]
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, whether it was reused from the pool)."""
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn_, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn = conn_
+                    break
+                stale.append(conn_)
+
+        for conn_ in stale:
+            conn_.close()
+
+        if conn is None:
+            return self._connect(key, timeout), False
+
+        conn.timeout = timeout  # type: ignore
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _connect(
+        self, key: PoolKey, timeout: Optional[float]
+    ) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        logger.debug(f"Opening new connection to {scheme}://{host}:{port}")
+        proxy = self._proxy(scheme, host)
+        if proxy:
+            split = urllib_parse.urlsplit(proxy)
+            connhost, connport = split.hostname or "", split.port
+        else:
+            connhost, connport = host, port
+
+        if scheme == "https":
+            conn: http.client.HTTPConnection = _HTTPSConnection(
+                connhost, connport, timeout=timeout, context=self.ssl_context
+            )
+            if proxy:
+                conn.set_tunnel(host, port)
+            with self._lock:
+                conn.tls_session = self._tls_sessions.get(key)  # type: ignore
+        else:
+            conn = http.client.HTTPConnection(connhost, connport, timeout=timeout)
+        return conn
+
+    @staticmethod
+    def _proxy(scheme: str, host: str) -> Optional[str]:
+        """Proxy URL configured in the environment for ``host``, if any."""
+        proxy = urllib_request.getproxies().get(scheme)
+        if not proxy or urllib_request.proxy_bypass(host):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return proxy
+
+    def _release(
+        self, key: PoolKey, conn: http.client.HTTPConnection, will_close: bool
+    ) -> None:
+        sock = conn.sock
+        tls_session = getattr(sock, "session", None)
+        with self._lock:
+            if tls_session is not None:
+                self._tls_sessions[key] = tls_session
+
+            idle = self._idle.setdefault(key, [])
+            if will_close or sock is None or len(idle) >= self.pool_size:
+                conn.close()
+            else:
+                idle.append((conn, time.monotonic()))
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._tls_sessions.clear()
+
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+
 class OFXClient:
     """
     Basic OFX client to download statement and profile requests.
@@ -238,6 +601,14 @@ class OFXClient:
     brokerid: Optional[str] = None
     persist_cookies: bool = True
 
+    # HTTP connection pool
+    pool_size: int = 10
+    idle_timeout: float = 60.0
+
+    # Seconds a cached FI profile is trusted without checking with the server
+    # (None: always send PROFRQ to check)
+    profile_ttl: Optional[float] = None
+
     def __repr__(self) -> str:
         r = (
             "{cls}(url={url!r}, userid={userid!r}, clientuid={clientuid!r}, "
@@ -267,6 +638,10 @@ class OFXClient:
         brokerid: Optional[str] = None,
         useragent: Optional[str] = None,
         persist_cookies: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        transport: Optional[HTTPTransport] = None,
+        profile_ttl: Optional[float] = None,
     ):
         self.url = url
 
@@ -285,6 +660,9 @@ class OFXClient:
             "brokerid",
             "useragent",
             "persist_cookies",
+            "pool_size",
+            "idle_timeout",
+            "profile_ttl",
         ]:
             value = locals()[attr]
             if value is not None:
@@ -297,6 +675,38 @@ class OFXClient:
         # subsequent STMTRQ or what have you.
         self.cookiejar = http.cookiejar.CookieJar()
 
+        # Connection pool is created on first use (see ``transport``), which
+        # may be from several threads at once (see ``dispatch_statements()``)
+        self._transport = transport
+        self._transport_lock = threading.Lock()
+
+    @property
+    def transport(self) -> HTTPTransport:
+        """Persistent HTTP connection pool used to POST requests."""
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    cls: Type[HTTPTransport] = (
+                        RequestsTransport if USE_REQUESTS else HTTPClientTransport
+                    )
+                    self._transport = cls(
+                        pool_size=self.pool_size,
+                        idle_timeout=self.idle_timeout,
+                        cookiejar=self.cookiejar if self.persist_cookies else None,
+                    )
+        return self._transport
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @classproperty
     @classmethod
     def uuid(cls) -> str:
@@ -337,32 +747,259 @@ class OFXClient:
         dryrun: bool = False,
         timeout: Optional[float] = None,
         skip_profile: bool = False,
+        shard: Optional[Union[str, datetime.timedelta]] = None,
+        max_parallel: Optional[int] = None,
     ) -> BinaryIO:
         """
         Package and send OFX statement requests
         (STMTRQ/CCSTMTRQ/INVSTMTRQ/STMTENDRQ/CCSTMTENDRQ).
+
+        If the FI profile assigns the requested services to different URLs,
+        the responses from each URL (see ``dispatch_statements()``) are merged
+        into a single OFX response.
+
+        ``shard`` (e.g. "90d", "12w" or a ``datetime.timedelta``) splits the
+        DTSTART/DTEND range of each STMTRQ/CCSTMTRQ/INVSTMTRQ into windows of
+        that length (see ``shard_requests()``), requested concurrently - at most
+        ``max_parallel`` at a time (default ``pool_size``).  The responses are
+        merged into a single statement per account (see ``merge_trnrs()``).
         """
+        if shard is not None:
+            return self._request_sharded(
+                password,
+                requests,
+                shard,
+                max_parallel=max_parallel,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+                skip_profile=skip_profile,
+            )
+
+        responses = dict(
+            self.dispatch_statements(
+                password,
+                *requests,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+                skip_profile=skip_profile,
+            )
+        )
+        if len(responses) == 1:
+            return responses.popitem()[1]
+
+        return self._merge_responses([responses[url] for url in sorted(responses)])
+
+    def _request_sharded(
+        self,
+        password: str,
+        requests: Sequence[RequestParam],
+        shard: Union[str, datetime.timedelta],
+        max_parallel: Optional[int] = None,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> BinaryIO:
+        """Send statement requests split into date range windows; merge results."""
+        if dryrun or skip_profile:
+            RqCls2url = None
+        else:
+            RqCls2url = self._get_service_urls(
+                timeout=timeout,
+                gen_newfileuid=gen_newfileuid,
+            )
+        jobs = self._sharded_jobs(requests, shard, dryrun, RqCls2url)
+
+        def send(job: Tuple[str, List[RequestParam]]) -> BinaryIO:
+            url, rqs = job
+            return self._send_statements(
+                password,
+                url,
+                rqs,
+                gen_newfileuid=gen_newfileuid,
+                dryrun=dryrun,
+                timeout=timeout,
+            )
+
+        max_workers = max_parallel or self.pool_size
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            # Executor.map() returns responses in chronological order of shards
+            responses = list(executor.map(send, jobs))
+
+        return self._merge_shards(responses, dryrun)
+
+    def _sharded_jobs(
+        self,
+        requests: Sequence[RequestParam],
+        shard: Union[str, datetime.timedelta],
+        dryrun: bool,
+        RqCls2url: Optional[dict],
+    ) -> List[Tuple[str, List[RequestParam]]]:
+        """Split statement requests into (url, requests) for each date range
+        window and service URL, in chronological order.
+        """
+        windows = shard_requests(requests, parse_shard(shard), self.dtclient())
+        logger.info(f"Sharded statement requests into {len(windows)} date ranges")
+        return [
+            job
+            for rqs in windows.values()
+            for job in self._statement_groups(rqs, dryrun, RqCls2url).items()
+        ]
+
+    def _merge_shards(self, responses: Sequence[BinaryIO], dryrun: bool) -> BinaryIO:
         if dryrun:
-            url = ""
-            logger.info("Dry run for statement request")
-        elif skip_profile:
-            url = self.url
-            logger.info(f"Skipping profile request; using url='{url}'")
+            return BytesIO(b"".join(response.read() for response in responses))
+        if len(responses) == 1:
+            return responses[0]
+        return self._merge_responses(responses)
+
+    def dispatch_statements(
+        self,
+        password: str,
+        *requests: RequestParam,
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+        skip_profile: bool = False,
+    ) -> Iterator[Tuple[str, BinaryIO]]:
+        """
+        Package OFX statement requests into one OFX request per service URL
+        listed in the FI profile, and send them concurrently.
+
+        Yields (url, response) pairs in the order the responses arrive.
+        """
+        if dryrun or skip_profile:
+            RqCls2url = None
         else:
             logger.info("Requesting OFX profile to extract service URLs")
             RqCls2url = self._get_service_urls(
                 timeout=timeout,
                 gen_newfileuid=gen_newfileuid,
             )
+        groups = self._statement_groups(requests, dryrun, RqCls2url)
+
+        kwargs = dict(gen_newfileuid=gen_newfileuid, dryrun=dryrun, timeout=timeout)
+        if len(groups) == 1:
+            ((url, rqs),) = groups.items()
+            yield url, self._send_statements(password, url, rqs, **kwargs)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(len(groups)) as executor:
+            futures = {
+                executor.submit(
+                    self._send_statements, password, url, rqs, **kwargs
+                ): url
+                for url, rqs in groups.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+
+    def _statement_groups(
+        self,
+        requests: Sequence[RequestParam],
+        dryrun: bool,
+        RqCls2url: Optional[dict],
+    ) -> Dict[str, List[RequestParam]]:
+        """Group statement requests by the URL providing each service.
+
+        ``RqCls2url`` is the mapping returned by ``_get_service_urls()``, or
+        None if the profile request was skipped.
+        """
+        if dryrun:
+            logger.info("Dry run for statement request")
+            return {"": list(requests)}
+        if RqCls2url is None:
+            logger.info(f"Skipping profile request; using url='{self.url}'")
+            return {self.url: list(requests)}
+
+        default = self._service_url(RqCls2url)
+        # Even without any statement requests, send the signon to the FI.
+        groups: Dict[str, List[RequestParam]] = {} if requests else {default: []}
+        for rq in requests:
+            url = RqCls2url.get(type(rq), default)
+            groups.setdefault(url, []).append(rq)
+
+        logger.info(f"Received service urls={list(groups)} from OFX profile response")
+        return groups
+
+    def _send_statements(
+        self,
+        password: str,
+        url: str,
+        requests: Sequence[RequestParam],
+        gen_newfileuid: bool = True,
+        dryrun: bool = False,
+        timeout: Optional[float] = None,
+    ) -> BinaryIO:
+        """Package statement requests as a single OFX request & POST to url."""
+        ofx = self._statements_ofx(password, *requests)
+
+        if gen_newfileuid:
+            newfileuid = self.uuid
+        else:
+            newfileuid = None
+
+        return self.download(
+            ofx,
+            newfileuid=newfileuid,
+            dryrun=dryrun,
+            timeout=timeout,
+            url=url,
+        )
+
+    def _merge_responses(self, responses: Sequence[BinaryIO]) -> BytesIO:
+        """Combine OFX responses (from several service URLs and/or date range
+        shards, in chronological order) into one OFX response.
+
+        Responses are merged as parsed ``ElementTree`` structures rather than
+        converted models, so tags the models don't know (e.g. proprietary
+        extensions) and values are passed through as the FI sent them.
+
+        Transaction wrappers returned for the same account are merged (see
+        ``merge_trnrs()``); SECLISTs are merged, deduplicating securities.
+        SIGNONMSGSRSV1 is taken from the last response; the transaction
+        wrappers of any other message set are concatenated.
+        """
+        trees = []
+        for response in responses:
+            parser = OFXTree()
+            parser.parse(response)
+            trees.append(parser)
+
+        msgsets: Dict[str, List[ET.Element]] = {}
+        for tree in trees:
+            for msgset in tree.getroot():
+                msgsets.setdefault(msgset.tag, []).append(msgset)
+
+        # Message sets in the order of the OFX spec; any others after those
+        order = [attr.upper() for attr in OFX._schema.stored_names]
+
+        def position(tag: str) -> int:
+            return order.index(tag) if tag in order else len(order)
+
+        root = ET.Element("OFX")
+        for tag in sorted(msgsets, key=position):
+            values = msgsets[tag]
+            if tag == "SIGNONMSGSRSV1" or len(values) == 1:
+                msgset = values[-1]
+            elif tag in ("BANKMSGSRSV1", "CREDITCARDMSGSRSV1", "INVSTMTMSGSRSV1"):
+                msgset = ET.Element(tag)
+                msgset.extend(merge_trnrs(itertools.chain(*values)))
+            elif tag == "SECLISTMSGSRSV1":
+                msgset = merge_seclistmsgs(values)
+            else:
+                msgset = ET.Element(tag)
+                msgset.extend(itertools.chain(*values))
+            root.append(msgset)
 
-            # HACK FIXME
-            # As a simplification, we assume that FIs handle all classes
-            # of statement request from a single URL.
-            urls = set(RqCls2url.values())
-            assert len(urls) == 1
-            url = urls.pop()
-            logger.info(f"Received service url={url} from OFX profile response")
+        header = trees[-1].header
+        body = _tostring(root).encode(header.codec, errors="xmlcharrefreplace")
+        return BytesIO(str(header).encode(header.codec) + body)
 
+    def _statements_ofx(self, password: str, *requests: RequestParam) -> OFX:
+        """Wrap statement request data containers in a complete OFX request."""
         logger.info(f"Creating statement requests for {requests}")
         # Group requests by type and pass to the appropriate *TRNRQ handler
         # function (see singledispatch setup below).
@@ -407,20 +1044,16 @@ class OFXClient:
         logger.debug(f"Wrapped statement request messages: {msgs}")
 
         signon = self.signon(password)
-        ofx = OFX(signonmsgsrqv1=signon, **msgs)
-
-        if gen_newfileuid:
-            newfileuid = self.uuid
-        else:
-            newfileuid = None
+        return OFX(signonmsgsrqv1=signon, **msgs)
 
-        return self.download(
-            ofx,
-            newfileuid=newfileuid,
-            dryrun=dryrun,
-            timeout=timeout,
-            url=url,
-        )
+    def _service_url(self, RqCls2url: dict) -> str:
+        """Single URL serving all services listed in the FI profile, if there is
+        one; else the URL the client was configured with.
+        """
+        urls = set(RqCls2url.values())
+        if len(urls) == 1:
+            return urls.pop()
+        return self.url
 
     def _get_service_urls(
         self,
@@ -430,10 +1063,20 @@ class OFXClient:
         """Query OFX profile endpoint to construct mapping of statement request
         data container to URL providing that service.
         """
+        cached = self._read_profile_cache()
+        if cached is not None and cached.urls is not None and self._is_fresh(cached):
+            logger.info("Using service URLs from cached OFX profile")
+            return dict(cached.urls)
+
         profile = self.request_profile(
             gen_newfileuid=gen_newfileuid,
             timeout=timeout,
         )
+        return self._memoize_service_urls(profile)
+
+    @staticmethod
+    def _parse_service_urls(profile: BinaryIO) -> dict:
+        """Map statement request data containers to service URLs from PROFRS."""
         parser = OFXTree()
         parser.parse(profile)
         ofx = parser.convert()
@@ -482,28 +1125,21 @@ class OFXClient:
     ) -> BinaryIO:
         """Request/cache OFX profiles (PROFRS).
 
-        ofxget.scan_profile() overrides version/prettyprint/close_elements.
-        """
-        filename = f"{self.org}-{self.fid}.profrs"
-        persistdir = config.DATADIR / "fiprofiles"
-        persistpath = persistdir / filename
+        If the cached PROFRS was confirmed by the server less than
+        ``profile_ttl`` seconds ago, it's returned without a PROFRQ round trip.
 
-        if persistpath.exists():
-            with open(persistpath, "rb") as f:
-                profrs: Optional[BytesIO] = BytesIO(f.read())
-
-            parser = OFXTree()
-            parser.parse(profrs)
-            ofx = parser.convert()
-            proftrnrs = ofx.profmsgsrsv1[0]
-            dtprofup = proftrnrs.profrs.dtprofup
-        else:
-            persistdir.mkdir(parents=True, exist_ok=True)
-            profrs = None
-            dtprofup = None
+        ofxget.scan_profile() overrides version/prettyprint/close_elements;
+        such probes (and overridden urls) always go to the server.
+        """
+        cached = self._read_profile_cache()
+        overrides = (version, prettyprint, close_elements, url)
+        if cached is not None and not dryrun and overrides == (None,) * 4:
+            if self._is_fresh(cached):
+                logger.info("Using cached OFX profile")
+                return BytesIO(cached.profrs)
 
         response = self._request_profile(
-            dtprofup=dtprofup,
+            dtprofup=cached.dtprofup if cached else None,
             version=version,
             gen_newfileuid=gen_newfileuid,
             prettyprint=prettyprint,
@@ -516,9 +1152,64 @@ class OFXClient:
         if dryrun:
             return response
 
+        return self._update_profile_cache(response, cached)
+
+    @property
+    def _profile_cache_path(self) -> Path:
+        filename = f"{self.org}-{self.fid}.profrs"
+        return config.DATADIR / "fiprofiles" / filename
+
+    def _is_fresh(self, cached: "CachedProfile") -> bool:
+        """Whether the server confirmed the cached PROFRS within ``profile_ttl``."""
+        if self.profile_ttl is None:
+            return False
+        return time.time() - cached.checked < self.profile_ttl
+
+    def _read_profile_cache(self) -> Optional["CachedProfile"]:
+        """Return cached PROFRS (if any), memoized in-process per (org, fid).
+
+        The memo is keyed by the on-disk cache path, and reloaded if the file
+        has been modified since (e.g. by another process).
+        """
+        persistpath = self._profile_cache_path
+
+        try:
+            mtime = persistpath.stat().st_mtime
+        except FileNotFoundError:
+            persistpath.parent.mkdir(parents=True, exist_ok=True)
+            return None
+
+        with _profile_memo_lock:
+            cached = _profile_memo.get(persistpath)
+        if cached is not None and cached.checked == mtime:
+            return cached
+
+        with open(persistpath, "rb") as f:
+            profrs = f.read()
+
+        parser = OFXTree()
+        parser.parse(BytesIO(profrs))
+        ofx = parser.convert()
+        proftrnrs = ofx.profmsgsrsv1[0]
+        dtprofup = proftrnrs.profrs.dtprofup
+
+        cached = CachedProfile(profrs=profrs, dtprofup=dtprofup, checked=mtime)
+        with _profile_memo_lock:
+            _profile_memo[persistpath] = cached
+        return cached
+
+    def _update_profile_cache(
+        self,
+        response: BinaryIO,
+        cached: Optional["CachedProfile"],
+    ) -> BinaryIO:
+        """Return the current PROFRS, given the server's reply to PROFRQ and the
+        cached PROFRS; cache the PROFRS if the server sent an updated version.
+        """
         parser = OFXTree()
         parser.parse(response)
         ofx = parser.convert()
+        persistpath = self._profile_cache_path
 
         #  If the client has the latest version of the FIs profile, the server returns
         #  status code 1 in the <STATUS> aggregate of the profile-transaction aggregate
@@ -529,23 +1220,52 @@ class OFXClient:
         #  aggregate <PROFTRNRS>.
         proftrnrs = ofx.profmsgsrsv1[0]
         if proftrnrs.status.code == 1:
-            assert profrs is not None
-            response = profrs
+            assert cached is not None
+            # Server confirmed the cached PROFRS is current; restart its TTL.
+            persistpath.touch()
+            cached = cached._replace(checked=persistpath.stat().st_mtime)
+            response = BytesIO(cached.profrs)
         else:
             assert proftrnrs.status.code == 0
             dtprofup_server = proftrnrs.profrs.dtprofup
-            assert dtprofup is None or dtprofup <= dtprofup_server
+            assert cached is None or cached.dtprofup <= dtprofup_server
 
             # Cache the updated PROFRS sent by the server
             response.seek(0)
+            profrs = response.read()
             with open(persistpath, "wb") as f:
-                f.write(response.read())
+                f.write(profrs)
+            cached = CachedProfile(
+                profrs=profrs,
+                dtprofup=dtprofup_server,
+                checked=persistpath.stat().st_mtime,
+            )
+
+        with _profile_memo_lock:
+            _profile_memo[persistpath] = cached
 
         # Rewind PROFRS so it can be returned cleanly after having been parsed.
         response.seek(0)
 
         return response
 
+    def _memoize_service_urls(self, profile: BinaryIO) -> dict:
+        """Parse service URLs from PROFRS, unless already memoized alongside the
+        cached PROFRS (i.e. the server confirmed the cached version is current).
+        """
+        persistpath = self._profile_cache_path
+        with _profile_memo_lock:
+            cached = _profile_memo.get(persistpath)
+        if cached is not None and cached.urls is not None:
+            return dict(cached.urls)
+
+        urls = self._parse_service_urls(profile)
+        with _profile_memo_lock:
+            cached = _profile_memo.get(persistpath)
+            if cached is not None:
+                _profile_memo[persistpath] = cached._replace(urls=dict(urls))
+        return urls
+
     def _request_profile(
         self,
         dtprofup: Optional[datetime.datetime] = None,
@@ -558,19 +1278,7 @@ class OFXClient:
         url: Optional[str] = None,
     ) -> BytesIO:
         """Package and send OFX profile requests (PROFRQ)."""
-        logger.info("Creating profile request")
-
-        if dtprofup is None:
-            dtprofup = datetime.datetime(1990, 1, 1, tzinfo=UTC)
-        profrq = PROFRQ(clientrouting="NONE", dtprofup=dtprofup)
-        proftrnrq = PROFTRNRQ(trnuid=self.uuid, profrq=profrq)
-
-        logger.debug(f"Wrapped profile request: {proftrnrq}")
-
-        user = password = AUTH_PLACEHOLDER
-        signon = self.signon(password, userid=user)
-
-        ofx = OFX(signonmsgsrqv1=signon, profmsgsrqv1=PROFMSGSRQV1(proftrnrq))
+        ofx = self._profile_ofx(dtprofup)
 
         if gen_newfileuid:
             newfileuid = self.uuid
@@ -588,6 +1296,22 @@ class OFXClient:
             url=url,
         )
 
+    def _profile_ofx(self, dtprofup: Optional[datetime.datetime] = None) -> OFX:
+        """Wrap PROFRQ in a complete OFX request."""
+        logger.info("Creating profile request")
+
+        if dtprofup is None:
+            dtprofup = datetime.datetime(1990, 1, 1, tzinfo=UTC)
+        profrq = PROFRQ(clientrouting="NONE", dtprofup=dtprofup)
+        proftrnrq = PROFTRNRQ(trnuid=self.uuid, profrq=profrq)
+
+        logger.debug(f"Wrapped profile request: {proftrnrq}")
+
+        user = password = AUTH_PLACEHOLDER
+        signon = self.signon(password, userid=user)
+
+        return OFX(signonmsgsrqv1=signon, profmsgsrqv1=PROFMSGSRQV1(proftrnrq))
+
     def request_accounts(
         self,
         password: str,
@@ -610,24 +1334,9 @@ class OFXClient:
                 timeout=timeout,
                 gen_newfileuid=gen_newfileuid,
             )
+            url = self._service_url(RqCls2url)
 
-            # HACK FIXME
-            # As a simplification, we assume that FIs handle all classes
-            # of statement request from a single URL.
-            urls = set(RqCls2url.values())
-            assert len(urls) == 1
-            url = urls.pop()
-
-        logger.info("Creating account info request")
-        signon = self.signon(password)
-
-        acctinforq = ACCTINFORQ(dtacctup=dtacctup)
-        acctinfotrnrq = ACCTINFOTRNRQ(trnuid=self.uuid, acctinforq=acctinforq)
-        msgs = SIGNUPMSGSRQV1(acctinfotrnrq)
-
-        logger.debug(f"Wrapped account info request messages: {msgs}")
-
-        ofx = OFX(signonmsgsrqv1=signon, signupmsgsrqv1=msgs)
+        ofx = self._accounts_ofx(password, dtacctup)
 
         if gen_newfileuid:
             newfileuid = self.uuid
@@ -642,6 +1351,19 @@ class OFXClient:
             url=url,
         )
 
+    def _accounts_ofx(self, password: str, dtacctup: datetime.datetime) -> OFX:
+        """Wrap ACCTINFORQ in a complete OFX request."""
+        logger.info("Creating account info request")
+        signon = self.signon(password)
+
+        acctinforq = ACCTINFORQ(dtacctup=dtacctup)
+        acctinfotrnrq = ACCTINFOTRNRQ(trnuid=self.uuid, acctinforq=acctinforq)
+        msgs = SIGNUPMSGSRQV1(acctinfotrnrq)
+
+        logger.debug(f"Wrapped account info request messages: {msgs}")
+
+        return OFX(signonmsgsrqv1=signon, signupmsgsrqv1=msgs)
+
     def request_tax1099(
         self,
         password: str,
@@ -665,23 +1387,9 @@ class OFXClient:
                 timeout=timeout,
                 gen_newfileuid=gen_newfileuid,
             )
+            url = self._service_url(RqCls2url)
 
-            # HACK FIXME
-            # As a simplification, we assume that FIs handle all classes
-            # of statement request from a single URL.
-            urls = set(RqCls2url.values())
-            assert len(urls) == 1
-            url = urls.pop()
-
-        logger.info("Creating tax 1099 request")
-        signon = self.signon(password)
-
-        rq = TAX1099RQ(*taxyears, recid=recid or None)
-        msgs = TAX1099MSGSRQV1(TAX1099TRNRQ(trnuid=self.uuid, tax1099rq=rq))
-
-        logger.debug(f"Wrapped tax 1099 request messages: {msgs}")
-
-        ofx = OFX(signonmsgsrqv1=signon, tax1099msgsrqv1=msgs)
+        ofx = self._tax1099_ofx(password, *taxyears, recid=recid)
 
         if gen_newfileuid:
             newfileuid = self.uuid
@@ -696,6 +1404,20 @@ class OFXClient:
             url=url,
         )
 
+    def _tax1099_ofx(
+        self, password: str, *taxyears: str, recid: Optional[str] = None
+    ) -> OFX:
+        """Wrap TAX1099RQ in a complete OFX request."""
+        logger.info("Creating tax 1099 request")
+        signon = self.signon(password)
+
+        rq = TAX1099RQ(*taxyears, recid=recid or None)
+        msgs = TAX1099MSGSRQV1(TAX1099TRNRQ(trnuid=self.uuid, tax1099rq=rq))
+
+        logger.debug(f"Wrapped tax 1099 request messages: {msgs}")
+
+        return OFX(signonmsgsrqv1=signon, tax1099msgsrqv1=msgs)
+
     def signon(
         self,
         userpass: str,
@@ -875,34 +1597,8 @@ class OFXClient:
             #  timeout = socket._GLOBAL_DEFAULT_TIMEOUT  # type: ignore
             timeout = 10.0
 
-        if USE_REQUESTS:
-            logger.info("Using requests lib to post request")
-            with requests.Session() as sess:
-                if self.persist_cookies:
-                    sess.cookies = self.cookiejar  # type: ignore
-
-                response = sess.request(
-                    method="POST",
-                    url=url,
-                    headers=self.http_headers,
-                    data=serialized_request,
-                    timeout=timeout,
-                )
-            return response.content
-
-        else:
-            logger.info("Using urllib to post request")
-            handlers = []
-            if self.persist_cookies:
-                handlers.append(urllib_request.HTTPCookieProcessor(self.cookiejar))
-            opener = urllib_request.build_opener(*handlers)
-
-            req = urllib_request.Request(
-                url, method="POST", data=serialized_request, headers=self.http_headers
-            )
-
-            response = opener.open(req, timeout=timeout)
-            return response.read()  # type: ignore
+        logger.info(f"Using {self.transport.__class__.__name__} to post request")
+        return self.transport.post(url, serialized_request, self.http_headers, timeout)
 
     def serialize(
         self,
@@ -945,23 +1641,18 @@ class OFXClient:
             "utf_8",
         )
 
-        tree = ofx.to_etree()
-        if prettyprint:
-            utils.indent(tree)
-
         # Some servers choke on OFXv1 requests including ending tags for
-        # elements (which are optional per the spec).
-        if close_elements is False:
-            if version >= 200:
-                raise ValueError(
-                    f"OFX version {version} requires ending tags for elements"
-                )
-            body = utils.tostring_unclosed_elements(tree)
-        else:
-            # ``method="html"`` skips the initial XML declaration
-            body = ET.tostring(tree, encoding="utf_8", method="html")
-
-        return header + body
+        # elements (which are optional per the spec); ``Aggregate.write()``
+        # refuses to omit them for OFXv2.
+        output = BytesIO(header)
+        output.seek(0, 2)
+        ofx.write(
+            output,
+            version=version,
+            prettyprint=prettyprint,
+            close_elements=close_elements,
+        )
+        return output.getvalue()
 
 
 @singledispatch
@@ -1004,3 +1695,201 @@ def wrap_stmtrq_stmtendrq(nt, rqs, client):
 @wrap_stmtrq.register(CcStmtEndRq)
 def wrap_stmtrq_ccstmtendrq(nt, rqs, client):
     return (CREDITCARDMSGSRQV1, [client.ccstmtendtrnrq(**rq._asdict()) for rq in rqs])
+
+
+def parse_shard(shard: Union[str, datetime.timedelta]) -> datetime.timedelta:
+    """Convert a shard length (e.g. "90d" for 90 days, "12w" for 12 weeks)
+    to a ``datetime.timedelta``.
+    """
+    if isinstance(shard, datetime.timedelta):
+        step = shard
+    else:
+        match = re.fullmatch(r"(\d+)([dw])", shard.strip().lower())
+        if match is None:
+            raise ValueError(f"Can't parse shard={shard!r}; use e.g. '90d' or '12w'")
+        count, unit = match.groups()
+        step = datetime.timedelta(days=int(count) * (7 if unit == "w" else 1))
+
+    if step <= datetime.timedelta(0):
+        raise ValueError(f"shard must be a positive length, not {shard!r}")
+    return step
+
+
+def shard_requests(
+    requests: Iterable[RequestParam],
+    step: datetime.timedelta,
+    now: datetime.datetime,
+) -> Dict[Optional[Tuple[datetime.datetime, datetime.datetime]], List[RequestParam]]:
+    """
+    Split the DTSTART/DTEND range of statement requests into windows of length
+    ``step``.  Requests without DTEND run until ``now``.
+
+    Returns requests grouped by (dtstart, dtend) window, in chronological
+    order.  Requests that aren't split - *STMTENDRQ, or those without DTSTART
+    or not including transactions - are grouped first, under None.
+
+    Only the last window of an INVSTMTRQ includes positions, balances and
+    open orders.
+    """
+    windows: Dict[
+        Optional[Tuple[datetime.datetime, datetime.datetime]], List[RequestParam]
+    ] = {}
+    for rq in requests:
+        if not isinstance(rq, (StmtRq, CcStmtRq, InvStmtRq)) or not rq.inctran:
+            windows.setdefault(None, []).append(rq)
+            continue
+        dtend = rq.dtend or now
+        if rq.dtstart is None or rq.dtstart >= dtend:
+            windows.setdefault(None, []).append(rq)
+            continue
+
+        start = rq.dtstart
+        while start < dtend:
+            end = min(start + step, dtend)
+            shard = rq._replace(dtstart=start, dtend=end)
+            if isinstance(shard, InvStmtRq) and end < dtend:
+                shard = shard._replace(incoo=False, incpos=False, incbal=False)
+            windows.setdefault((start, end), []).append(shard)
+            start = end
+
+    def chronological(window):
+        return (0,) if window is None else (1, window[1], window[0])
+
+    return {window: windows[window] for window in sorted(windows, key=chronological)}
+
+
+# Tags of statements within *STMTTRNRS/*STMTENDTRNRS, and of their transaction lists
+STATEMENT_TAGS = ("STMTRS", "CCSTMTRS", "INVSTMTRS", "STMTENDRS", "CCSTMTENDRS")
+TRANLIST_TAGS = ("BANKTRANLIST", "INVTRANLIST")
+
+
+# Fields identifying the account of each *ACCTFROM aggregate
+ACCOUNT_KEYS = {
+    "BANKACCTFROM": ("BANKID", "BRANCHID", "ACCTID", "ACCTTYPE"),
+    "CCACCTFROM": ("ACCTID",),
+    "INVACCTFROM": ("BROKERID", "ACCTID"),
+}
+
+
+def account_key(acct: ET.Element) -> Tuple:
+    """Hashable identity of an account, from the fields of its *ACCTFROM."""
+    return (acct.tag,) + tuple(acct.findtext(field) for field in ACCOUNT_KEYS[acct.tag])
+
+
+def _findchild(elem: ET.Element, tags: Iterable[str]) -> Optional[ET.Element]:
+    """First child of ``elem`` with one of ``tags``, if any."""
+    for child in elem:
+        if child.tag in tags:
+            return child
+    return None
+
+
+def merge_trnrs(trnrss: Iterable[ET.Element]) -> List[ET.Element]:
+    """
+    Merge parsed statement transaction wrappers (*STMTTRNRS), in chronological
+    order, that were returned for the same account (e.g. by date range shards).
+
+    The last wrapper for each account is kept, i.e. its balances/positions as
+    of the latest date range.  Its transaction list is replaced by the
+    transactions from all the wrappers for the account, covering their
+    combined date range, deduplicated by FITID.
+    """
+    accounts: Dict[Any, List[ET.Element]] = {}
+    for trnrs in trnrss:
+        stmt = _findchild(trnrs, STATEMENT_TAGS)
+        acct = None if stmt is None else _findchild(stmt, ACCOUNT_KEYS)
+        key = (trnrs.tag, account_key(acct)) if acct is not None else id(trnrs)
+        accounts.setdefault(key, []).append(trnrs)
+
+    merged = []
+    for trnrss_ in accounts.values():
+        if len(trnrss_) > 1:
+            stmts = [_findchild(trnrs, STATEMENT_TAGS) for trnrs in trnrss_]
+            _merge_tranlists(stmts)  # type: ignore
+        merged.append(trnrss_[-1])
+    return merged
+
+
+def _merge_tranlists(stmts: Sequence[ET.Element]) -> None:
+    """Merge the transaction lists of statements into that of the last one."""
+    tranlists = [tl for stmt in stmts if (tl := _findchild(stmt, TRANLIST_TAGS))]
+    if not tranlists:
+        return
+
+    seen = set()
+    txns = []
+    for tranlist in tranlists:
+        for txn in tranlist:
+            if txn.tag in ("DTSTART", "DTEND"):
+                continue
+            # Investment transactions hold FITID in a nested INVTRAN/STMTTRN
+            fitid = txn.findtext(".//FITID")
+            if fitid is not None:
+                if fitid in seen:
+                    continue
+                seen.add(fitid)
+            txns.append(txn)
+
+    def dt(tranlist: ET.Element, tag: str) -> Tuple[datetime.datetime, ET.Element]:
+        elem = tranlist.find(tag)
+        return DateTime().convert(elem.text), elem  # type: ignore
+
+    merged = ET.Element(tranlists[0].tag)
+    merged.append(min((dt(tl, "DTSTART") for tl in tranlists), key=itemgetter(0))[1])
+    merged.append(max((dt(tl, "DTEND") for tl in tranlists), key=itemgetter(0))[1])
+    merged.extend(txns)
+
+    latest = stmts[-1]
+    children = list(latest)
+    tranlist = _findchild(latest, TRANLIST_TAGS)
+    if tranlist is not None:
+        latest[children.index(tranlist)] = merged
+    else:
+        # Transaction list follows the account in STMTRS/CCSTMTRS/INVSTMTRS
+        acct = _findchild(latest, ACCOUNT_KEYS)
+        latest.insert(children.index(acct) + 1, merged)  # type: ignore
+
+
+def merge_seclistmsgs(msgsets: Sequence[ET.Element]) -> ET.Element:
+    """
+    Merge parsed SECLISTMSGSRSV1 in chronological order, keeping the latest
+    SECINFO for each security (by UNIQUEID/UNIQUEIDTYPE).
+    """
+    securities: Dict[Tuple[Optional[str], Optional[str]], ET.Element] = {}
+    trnrss = []
+    for msgset in msgsets:
+        for child in msgset:
+            if child.tag != "SECLIST":
+                trnrss.append(child)
+                continue
+            for sec in child:
+                secid = sec.find(".//SECID")
+                key = (
+                    None if secid is None else secid.findtext("UNIQUEID"),
+                    None if secid is None else secid.findtext("UNIQUEIDTYPE"),
+                )
+                securities[key] = sec
+
+    merged = ET.Element("SECLISTMSGSRSV1")
+    merged.extend(trnrss)
+    if securities:
+        ET.SubElement(merged, "SECLIST").extend(securities.values())
+    return merged
+
+
+def _tostring(elem: ET.Element) -> str:
+    """
+    Markup for a parsed ``ElementTree.Element``, with end tags.  Text is
+    written as is, since ``OFXTree`` leaves entities escaped as they were read.
+
+    The exception is CDATA content, which ``TreeBuilder`` passes through
+    verbatim; text that would be read as markup is wrapped back up in a CDATA
+    section (``ofxtools.Types.String`` converts it the same either way).
+    ``TreeBuilder`` reads at most one CDATA section per line, so it ends the line.
+    """
+    text = elem.text or ""
+    if len(elem) == 0 and "<" in text:
+        return f"<{elem.tag}><![CDATA[{text}]]></{elem.tag}>\n"
+    if len(elem) == 0:
+        return f"<{elem.tag}>{text}</{elem.tag}>"
+    return "".join([f"<{elem.tag}>", *map(_tostring, elem), f"</{elem.tag}>"])
@@ -15,7 +15,8 @@ Notwithstanding the fact that `ofxtools.TreeBuilder` subclasses the excellent
 methods, the logic is completely different - less efficient and far slower.
 
 If we didn't need to parse OFXv1 (SGML), we'd do better to skip it and
-just feed plain XML to `ElementTree`.
+just feed plain XML to `ElementTree`.  Which is what `OFXTree.parse()` does
+for OFXv2 documents, falling back to `TreeBuilder` for malformed XML.
 
 The implementation employs re.finditer() and Perl extended regular expressions:
 https://docs.python.org/3/howto/regex.html#non-capturing-and-named-groups
@@ -25,19 +26,60 @@ https://stackoverflow.com/questions/1732348/regex-match-open-tags-except-xhtml-s
 """
 
 
-__all__ = ["OFXTree", "TreeBuilder", "ParseError"]
+__all__ = [
+    "OFXTree",
+    "TreeBuilder",
+    "SGMLTreeBuilder",
+    "AggregateBuilder",
+    "StreamingTreeBuilder",
+    "SelectiveTreeBuilder",
+    "ParseError",
+    "ParseResult",
+    "parse_many",
+]
 
 
 # stdlib imports
+import os
 import re
+import codecs
+import mmap
+import concurrent.futures
 import xml.etree.ElementTree as ET
-from typing import Tuple, Optional
+from xml.sax import saxutils
+from collections import deque
+from typing import (
+    Tuple,
+    Optional,
+    Iterable,
+    Iterator,
+    List,
+    Deque,
+    Sequence,
+    Any,
+    NamedTuple,
+)
 import logging
+import warnings
 
 
 # local imports
-from ofxtools.header import parse_header, OFXHeaderType
-from ofxtools.models.base import Aggregate
+from ofxtools.header import (
+    parse_header,
+    parse_bytes,
+    read_header,
+    OFXHeaderType,
+    OFXHeaderV2,
+)
+import ofxtools.models
+from ofxtools.models.base import Aggregate, OFXSpecError, UnknownTagWarning
+from ofxtools.Types import (
+    NUMERIC_MODES,
+    numeric_mode,
+    enum_members,
+    validation,
+    lazy_conversion,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -68,13 +110,28 @@ class OFXTree(ET.ElementTree):
     the root node of the hierarchy.
     """
 
-    def parse(self, source, parser=None) -> ET.Element:
+    # Paths selected by ``parse(include=...)``, if any
+    _include: Optional[Sequence[str]] = None
+
+    def parse(
+        self, source, parser=None, include: Optional[Iterable[str]] = None
+    ) -> ET.Element:
         """
         Deserialize OFX document into tree of `ElementTree.Element` instances.
 
         *source* is a file name or file object, *parser* is an optional parser
         instance that defaults to `ofxtools.Parser.TreeBuilder`.
 
+        If no parser is given and the document has an OFXv2 header, first
+        try parsing the body as XML with `ElementTree.XMLParser`, which is
+        much faster.  Bodies that aren't well-formed XML are handed off to
+        `ofxtools.Parser.TreeBuilder` as usual.
+
+        *include* is an optional sequence of paths of elements to keep, e.g.
+        ``["INVSTMTMSGSRSV1/INVSTMTTRNRS/INVSTMTRS/INVPOSLIST",
+        "SECLISTMSGSRSV1"]``; cf. `SelectiveTreeBuilder`, which parses the
+        document instead of *parser*.
+
         Overrides ElementTree.ElementTree.parse().
         """
         logger.info(f"Parsing OFX from {source}")
@@ -82,6 +139,56 @@ class OFXTree(ET.ElementTree):
         self.header, message = self._read(source)
         logger.debug(f"Parsed OFX header: {self.header}")
 
+        return self._parsemessage(message, parser, include)
+
+    def parse_bytes(
+        self, buffer, parser=None, include: Optional[Iterable[str]] = None
+    ) -> ET.Element:
+        """
+        Deserialize OFX document held in memory into tree of
+        `ElementTree.Element` instances.
+
+        *buffer* is a bytes-like object (`bytes`, `mmap.mmap`, etc.) or a file
+        name, which is memory-mapped rather than read.  Only a small window at
+        the start of the buffer is copied to locate the header, and the message
+        body is decoded only once (cf. `ofxtools.header.parse_bytes()`).
+
+        *parser* and *include* are as for `parse()`.
+        """
+        if isinstance(buffer, (str, os.PathLike)):
+            logger.info(f"Parsing OFX from {buffer}")
+            with open(buffer, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    self.header, message = parse_bytes(mapped)
+        else:
+            logger.info("Parsing OFX from buffer")
+            self.header, message = parse_bytes(buffer)
+        logger.debug(f"Parsed OFX header: {self.header}")
+
+        return self._parsemessage(message, parser, include)
+
+    def _parsemessage(
+        self, message: str, parser, include: Optional[Iterable[str]] = None
+    ) -> ET.Element:
+        """
+        Feed decoded OFX message body to parser; stash the root of the tree.
+
+        Factored out from `parse()` and `parse_bytes()`.
+        """
+        self._include = None
+        if include is not None:
+            if parser is not None:
+                raise ValueError("Can't pass both parser and include")
+            self._include = include = tuple(include)
+            parser = SelectiveTreeBuilder(include)
+
+        if parser is None and isinstance(self.header, OFXHeaderV2):
+            root = self._parsexml(message)
+            if root is not None:
+                self._root = root
+                logger.debug(f"Parsed Element tree root: {self._root}")
+                return self._root
+
         # If no parser specified, create default `ofxtools.Parser.TreeBuilder`
         if parser is None:
             parser = TreeBuilder()
@@ -119,14 +226,169 @@ class OFXTree(ET.ElementTree):
 
         return header, message
 
-    def convert(self) -> Aggregate:
+    @staticmethod
+    def _parsexml(message: str) -> Optional[ET.Element]:
+        """
+        Parse OFXv2 message body with the C-accelerated XML parser.
+
+        Returns the root `ElementTree.Element`, groomed to match the output of
+        `ofxtools.Parser.TreeBuilder` - i.e. whitespace-stripped text, escaped
+        markup characters, no text for aggregates, no tails - or None if the
+        body isn't well-formed XML or needs `TreeBuilder` for some other
+        reason (CDATA sections, mixed content, tail text).
+        """
+        # ``TreeBuilder`` passes CDATA content through verbatim (unescaped);
+        # expat can't tell it apart from regular text.
+        if "<![CDATA[" in message:
+            return None
+
+        try:
+            root = ET.fromstring(message)
+        except ET.ParseError as err:
+            logger.info(f"OFXv2 body isn't well-formed XML ({err}); parsing as SGML")
+            return None
+
+        escape = saxutils.escape
+        for elem in root.iter():
+            tail = elem.tail
+            if tail is not None:
+                if not tail.isspace():
+                    return None
+                elem.tail = None
+
+            text = elem.text
+            if text is not None:
+                text = text.strip()
+                if not text:
+                    elem.text = None
+                elif len(elem):
+                    return None
+                else:
+                    # ``ofxtools.Types.unescape()`` reverses this on conversion,
+                    # yielding what expat decoded - the same as it yields from
+                    # the raw entities and character references TreeBuilder
+                    # keeps.
+                    elem.text = escape(text)
+
+        return root
+
+    def iterparse(
+        self,
+        source,
+        tags: Iterable[str],
+        chunksize: int = 2**16,
+        numeric: str = "decimal",
+        enums: bool = False,
+        validate: bool = True,
+    ) -> Iterator[Aggregate]:
+        """
+        Incrementally deserialize OFX document, yielding each aggregate whose
+        tag is in *tags* (e.g. "STMTTRN", "BUYSTOCK") as soon as its end tag
+        has been parsed, converted to an instance of the corresponding
+        `ofxtools.models` class.
+
+        *source* is a file name or file object opened in binary mode;
+        the message body is read and decoded *chunksize* bytes at a time.
+        *numeric*, *enums* and *validate* are passed through to `convert()`.
+
+        Each yielded subtree is detached from the `ElementTree.Element`
+        hierarchy once it's been converted, so memory use is bounded by the
+        size of the largest yielded aggregate rather than the size of the
+        document.  A selected aggregate nested within another selected
+        aggregate is yielded as part of its parent, not separately.
+
+        After the generator is exhausted, the remainder of the tree (i.e.
+        everything not yielded - signon, balances, etc.) is available as
+        the root of this ElementTree, and the OFX header as `self.header`.
+        N.B. calling `convert()` on that pruned remainder will fail if any
+        of the detached aggregates are required by the OFX spec.
+        """
+        logger.info(f"Streaming OFX aggregates {tags} from {source}")
+        close_source = False
+        if not hasattr(source, "read"):
+            source = open(source, "rb")
+            close_source = True
+
+        if hasattr(source, "mode") and "b" not in source.mode:
+            raise ValueError("Source must be opened in binary mode")
+
+        try:
+            self.header = read_header(source)
+            decoder = codecs.getincrementaldecoder(self.header.codec)()
+            parser = StreamingTreeBuilder(tags)
+            buffer = ""
+            while True:
+                chunk = source.read(chunksize)
+                buffer += decoder.decode(chunk, final=not chunk)
+                if chunk:
+                    boundary = parser.boundary(buffer)
+                else:
+                    boundary = len(buffer)
+                parser.feed(buffer[:boundary])
+                buffer = buffer[boundary:]
+
+                completed = parser.completed
+                while completed:
+                    with numeric_mode(numeric), enum_members(enums), validation(
+                        validate
+                    ):
+                        instance = Aggregate.from_etree(completed.popleft())
+                    yield instance
+
+                if not chunk:
+                    break
+        finally:
+            if close_source and hasattr(source, "close"):
+                source.close()
+
+        self._root = parser.close()
+
+    def convert(
+        self,
+        numeric: str = "decimal",
+        enums: bool = False,
+        validate: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Aggregate:
         """
         Transform tree of `ElementTree.Element` instances into hierarchy of
         `ofxtools.models.base.Aggregate` & `ofxtools.Types.Element` instances.
+
+        ``numeric`` selects the representation of `ofxtools.Types.Decimal`
+        values; one of `ofxtools.Types.NUMERIC_MODES`:
+        "decimal" (exact `decimal.Decimal`, the default), "float", or
+        "scaled" (`ofxtools.Types.MinorUnits` int counts of e.g. cents).
+        If ``enums`` is true, `ofxtools.Types.OneOf` values are converted to
+        ``enum.Enum`` members rather than plain ``str``.
+
+        If ``validate`` is false, input is trusted to be valid (e.g. it's been
+        converted with validation before): values are only type-converted,
+        without checking them against the OFX spec.  Call ``validate()`` on
+        the returned `Aggregate` to perform the checks later on demand.
+        By default, the tree is validated unless it was parsed with
+        ``include``, since it then lacks elements that the OFX spec requires
+        outside the selected paths.
+
+        If ``lazy`` is true, each `ofxtools.Types.SubAggregate` is converted
+        (and validated) only when the attribute is first read, e.g. the
+        ``BANKTRANLIST`` of a statement whose balances alone are wanted.
+        Until then it holds a reference to its `ElementTree.Element`, so
+        the tree is kept in memory.  List members are converted along with
+        the `Aggregate` containing them.
+
+        If the document was parsed by `AggregateBuilder`, it's already been
+        converted (cf. ``AggregateBuilder(numeric=...)``); just return it.
         """
         if not isinstance(self._root, ET.Element):
+            if isinstance(self._root, Aggregate):
+                return self._root
             raise ValueError("Must first call parse() to have data to convert")
-        instance = Aggregate.from_etree(self._root)
+        if validate is None:
+            validate = self._include is None
+        with numeric_mode(numeric), enum_members(enums), validation(
+            validate
+        ), lazy_conversion(lazy):
+            instance = Aggregate.from_etree(self._root)
         return instance
 
 
@@ -233,16 +495,546 @@ class TreeBuilder(ET.TreeBuilder):
         return None
 
 
-def main(*files):
+class SGMLTreeBuilder(TreeBuilder):
+    """
+    OFX parser that tokenizes markup by scanning for tag delimiters with
+    `str.find()`, rather than by running `TreeBuilder.regex`.
+
+    Produces exactly the same trees (and the same errors) as `TreeBuilder`,
+    but skips building a dict of match groups, grooming strings, and
+    formatting log messages for every tag, which adds up for large OFXv1
+    documents.  Pass an instance to `OFXTree.parse()` to use it.
+    """
+
+    # Characters allowed in tag names by ``TreeBuilder.regex``
+    tagchars = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789./_ ")
+
+    def feed(self, data: str) -> None:
+        """
+        Scan markup, sending each tag/text/closetag sequence matched by
+        `TreeBuilder.regex` straight to the `ElementTree.TreeBuilder` methods.
+        """
+        logger.info("Building Element tree from markup body")
+        find = data.find
+        startswith = data.startswith
+        tagchars = self.tagchars
+        start, text_, end = self.start, self.data, self.end
+        attrs: dict = {}
+        length = len(data)
+
+        index = find("<")
+        while index != -1:
+            close = find(">", index + 1)
+            if close == -1:
+                break
+            tag = data[index + 1 : close]
+            if not tag or not tagchars.issuperset(tag):
+                index = find("<", index + 1)
+                continue
+
+            matchstart = index
+            index = close + 1
+            text = None
+
+            # Element value - CDATA must be on a single line; its content is
+            # kept verbatim.  Otherwise, text runs up to the next tag.
+            if startswith("<![CDATA[", index):
+                cdatastart = index + 9
+                lineend = find("\n", cdatastart)
+                if lineend == -1:
+                    lineend = length
+                cdataend = data.rfind("]]>", cdatastart + 1, lineend)
+                if cdataend != -1:
+                    text = data[cdatastart:cdataend]
+                    index = cdataend + 3
+            else:
+                nexttag = find("<", index)
+                if nexttag == -1:
+                    nexttag = length
+                if nexttag > index:
+                    text = data[index:nexttag].strip() or None
+                    index = nexttag
+
+            # Optional closing tag, immediately following
+            closetag = False
+            if (
+                startswith("</", index)
+                and startswith(tag, index + 2)
+                and startswith(">", index + 2 + len(tag))
+            ):
+                closetag = True
+                index += len(tag) + 3
+
+            # Anything other than whitespace between here & the next tag
+            nexttag = find("<", index)
+            if nexttag == -1:
+                nexttag = length
+            if nexttag > index:
+                tail = data[index:nexttag].strip()
+                if tail:
+                    raise ParseError(
+                        f"Tail text '{tail}' in {data}"
+                        f" - position=[{matchstart}:{nexttag}]"
+                    )
+                index = nexttag
+
+            if tag[0] == "/":
+                if text:
+                    raise ParseError(
+                        f"Tail text '{text}' after <{tag}>"
+                        f" - position=[{matchstart}:{index}]"
+                    )
+                end(tag[1:])
+            else:
+                start(tag, attrs)
+                if text:
+                    text_(text)
+                    end(tag)
+                elif closetag:
+                    end(tag)
+
+            if index == length:
+                break
+
+
+class AggregateBuilder(SGMLTreeBuilder):
+    """
+    OFX parser that constructs `ofxtools.models` instances directly from the
+    markup, without building an intermediate tree of `ElementTree.Element`.
+
+    Each Aggregate is instantiated as soon as its end tag is parsed, from the
+    already-converted values of its children.  Validation follows
+    `Aggregate._convert()`: children must appear in ``spec`` order, unknown
+    tags are skipped with an `UnknownTagWarning`, extended tags (e.g.
+    INTU.XXX) and ``unsupported`` aggregates are dropped, and ``tagAliases``
+    are renamed.  Aggregates whose class overrides `Aggregate.groom()` are
+    collected as an `ElementTree` subtree and converted by
+    `Aggregate.from_etree()` as usual.
+
+    Pass an instance to `OFXTree.parse()`; the tree's root will then be the
+    converted `Aggregate` (returned unchanged by `OFXTree.convert()`), so
+    `ElementTree` methods such as ``find()`` aren't available.  ``numeric``
+    and ``enums`` select the representation of `ofxtools.Types.Decimal` and
+    `ofxtools.Types.OneOf` values, and ``validate`` whether the input is
+    checked against the OFX spec, as for `OFXTree.convert()`.
+    """
+
+    class _Frame:
+        """Open Aggregate/Element, accumulating args for instantiation"""
+
+        __slots__ = (
+            "tag",
+            "is_listmember",
+            "text",
+            "cls",
+            "schema",
+            "args",
+            "kwargs",
+            "prev_index",
+            "prev_is_listmember",
+            "deferred",
+        )
+
+        def __init__(self, tag: str, is_listmember: bool):
+            self.tag = tag
+            self.is_listmember = is_listmember
+            self.text: Optional[str] = None
+            self.cls = None
+            self.schema = None
+            self.args: list = []
+            self.kwargs: dict = {}
+            self.prev_index = -1
+            self.prev_is_listmember = False
+            self.deferred: List[str] = []
+
+    def __init__(
+        self, numeric: str = "decimal", enums: bool = False, validate: bool = True
+    ):
+        super().__init__()
+        if numeric not in NUMERIC_MODES:
+            raise ValueError(
+                f"numeric mode must be one of {NUMERIC_MODES}; not {numeric!r}"
+            )
+        self._numeric = numeric
+        self._enums = enums
+        self._validate = validate
+        self._stack: List[AggregateBuilder._Frame] = []
+        self._root: Optional[Aggregate] = None
+        # Depth within an element that's being skipped
+        self._skipping = 0
+        # ElementTree subtree for an Aggregate with custom ``groom()``
+        self._subtree: Optional[ET.TreeBuilder] = None
+        self._subtree_depth = 0
+
+    def feed(self, data: str) -> None:
+        with numeric_mode(self._numeric), enum_members(self._enums), validation(
+            self._validate
+        ):
+            super().feed(data)
+
+    def start(self, tag, attrs):
+        if self._skipping:
+            self._skipping += 1
+            return
+        if self._subtree is not None:
+            self._subtree_depth += 1
+            self._subtree.start(tag, attrs)
+            return
+
+        stack = self._stack
+        if not stack:
+            stack.append(self._Frame(tag, False))
+            return
+
+        parent = stack[-1]
+        if parent.cls is None:
+            parent.cls = self._lookup(parent.tag)
+            if parent.cls.groom is not Aggregate.groom:
+                # Hand off to ElementTree & ``Aggregate.groom()``
+                self._subtree = ET.TreeBuilder()
+                self._subtree.start(parent.tag, {})
+                self._subtree.start(tag, attrs)
+                self._subtree_depth = 2
+                return
+            parent.schema = parent.cls._schema
+
+        if "." in tag:
+            # Cf. ``Aggregate._convert()``
+            logger.debug(f"Removing extended tag <{tag}>")
+            self._skipping = 1
+            return
+
+        schema = parent.schema
+        tag = schema.aliases.get(tag, tag)
+        attrname = tag.lower()
+        index = schema.indices.get(attrname)
+        if index is None:
+            msg = (
+                f"While parsing {parent.cls.__name__}, encountered unknown tag "
+                f"{tag}; skipping."
+            )
+            warnings.warn(msg, category=UnknownTagWarning)
+            self._skipping = 1
+            return
+
+        is_listmember = attrname in schema.listmembers
+        if index <= parent.prev_index and not (
+            is_listmember and parent.prev_is_listmember
+        ):
+            msg = (
+                "Elements out of order: According to the class spec for "
+                f"{parent.cls.__name__}, {attrname.upper()} should occur before "
+                f"{schema.names[parent.prev_index].upper()}, not after it."
+            )
+            if self._validate:
+                raise OFXSpecError(msg)
+            parent.deferred.append(msg)
+        parent.prev_index = index
+        parent.prev_is_listmember = is_listmember
+
+        if attrname in schema.unsupported:
+            self._skipping = 1
+            self._assign(parent, attrname, is_listmember, None)
+            return
+
+        stack.append(self._Frame(tag, is_listmember))
+
+    def data(self, data):
+        if self._skipping:
+            return
+        if self._subtree is not None:
+            self._subtree.data(data)
+            return
+        frame = self._stack[-1]
+        frame.text = data if frame.text is None else frame.text + data
+
+    def end(self, tag):
+        if self._skipping:
+            self._skipping -= 1
+            return
+
+        stack = self._stack
+        if self._subtree is not None:
+            self._subtree.end(tag)
+            self._subtree_depth -= 1
+            if self._subtree_depth:
+                return
+            elem = self._subtree.close()
+            self._subtree = None
+            frame = stack.pop()
+            value = Aggregate.from_etree(elem)
+        else:
+            if not stack:
+                raise IndexError("pop from empty stack")
+            frame = stack.pop()
+            if frame.text:
+                value = frame.text
+            else:
+                cls = frame.cls or self._lookup(frame.tag)
+                value = cls(*frame.args, **frame.kwargs)
+                if frame.deferred:
+                    value._deferred = tuple(frame.deferred)
+
+        if stack:
+            parent = stack[-1]
+            self._assign(parent, frame.tag.lower(), frame.is_listmember, value)
+        else:
+            self._root = value
+
+    def close(self) -> Optional[Aggregate]:
+        # Like ``ElementTree.TreeBuilder``, end any elements left open
+        with numeric_mode(self._numeric), enum_members(self._enums), validation(
+            self._validate
+        ):
+            while self._stack:
+                self.end(self._stack[-1].tag)
+        return self._root
+
+    @staticmethod
+    def _lookup(tag: str):
+        """Cf. ``Aggregate.from_etree()``"""
+        try:
+            return getattr(ofxtools.models, tag)
+        except AttributeError:
+            raise OFXSpecError(f"ofxtools.models doesn't define {tag}")
+
+    @staticmethod
+    def _assign(parent, attrname: str, is_listmember: bool, value) -> None:
+        """Cf. ``Aggregate._convert()``"""
+        if is_listmember:
+            parent.args.append(value)
+        else:
+            if attrname in parent.kwargs:
+                raise OFXSpecError
+            parent.kwargs[attrname] = value
+
+
+class StreamingTreeBuilder(TreeBuilder):
+    """
+    OFX parser that detaches completed subtrees with the given tags from
+    the Element hierarchy as they're parsed, and queues them for consumption.
+
+    Used by `OFXTree.iterparse()` to parse documents too large to hold as a
+    single tree.  Markup may be passed to `feed()` in pieces, as long as each
+    piece ends at a tag boundary (cf. `boundary()`).
+    """
+
+    def __init__(self, tags: Iterable[str]):
+        super().__init__()
+        self.tags = frozenset(tags)
+        # Detached subtrees waiting to be consumed, in document order
+        self.completed: Deque[ET.Element] = deque()
+        # Open elements, so that closed subtrees can be removed from parents
+        self._stack: List[ET.Element] = []
+        # Number of currently open elements whose tags are in ``self.tags``
+        self._depth = 0
+
+    def start(self, tag, attrs):
+        elem = super().start(tag, attrs)
+        self._stack.append(elem)
+        if tag in self.tags:
+            self._depth += 1
+        return elem
+
+    def end(self, tag):
+        elem = super().end(tag)
+        self._stack.pop()
+        if elem.tag in self.tags:
+            self._depth -= 1
+            # Don't detach selected aggregates nested in other selected
+            # aggregates; they go along with their parent.
+            if self._depth == 0:
+                if self._stack:
+                    self._stack[-1].remove(elem)
+                self.completed.append(elem)
+        return elem
+
+    @staticmethod
+    def boundary(markup: str) -> int:
+        """
+        Return the index within ``markup`` of the last start tag that
+        it's safe to split before, i.e. where the preceding markup is
+        guaranteed to be fully matched by ``TreeBuilder.regex``.
+
+        Closing tags aren't safe, because they might turn out to belong to the
+        preceding element (cf. ``TreeBuilder._start()``), nor is anything
+        inside a CDATA section.
+        """
+        index = len(markup)
+        while True:
+            index = markup.rfind("<", 0, index)
+            if index == -1:
+                return 0
+            # A lone trailing "<" might yet turn out to begin a closing tag
+            if index + 1 == len(markup) or markup[index + 1] in "/!":
+                continue
+            cdata = markup.rfind("<![CDATA[", 0, index)
+            if cdata != -1 and markup.find("]]>", cdata, index) == -1:
+                # Still inside the CDATA section; back up in front of its tag
+                index = cdata
+                continue
+            return index
+
+
+class SelectiveTreeBuilder(SGMLTreeBuilder):
+    """
+    OFX parser that builds only the elements on the given paths: those
+    they select, with all their descendants, and the ancestors of those.
+    Everything else is skipped as it's tokenized, without creating
+    `ElementTree.Element` instances for it, except for the elements on
+    a path that turn out not to contain a selected element; those are
+    removed again when they end.
+
+    Paths are sequences of tags separated by "/" like ``ElementTree.find()``
+    paths, relative to the root (a leading root tag e.g. "OFX/" is optional);
+    "*" matches any tag.  Used by `OFXTree.parse(include=...)`.
+    """
+
+    def __init__(self, include: Iterable[str]):
+        super().__init__()
+        self.include = [tuple(path.strip("/").split("/")) for path in include]
+        # For each open element, the remainders of the paths leading through
+        # it, or None if it's selected (or within a selected element)
+        self._paths: List[Optional[List[Tuple[str, ...]]]] = []
+        # Open elements that aren't selected, so they can be removed
+        self._stack: List[ET.Element] = []
+        # Depth within an element that's being skipped
+        self._skipping = 0
+
+    def start(self, tag, attrs):
+        if self._skipping:
+            self._skipping += 1
+            return None
+
+        stack = self._paths
+        if not stack:
+            # Root
+            paths = [p[1:] if p[0] == tag else p for p in self.include]
+        else:
+            parent = stack[-1]
+            if parent is None:
+                stack.append(None)
+                return super().start(tag, attrs)
+            paths = [p[1:] for p in parent if p[0] == tag or p[0] == "*"]
+            if not paths:
+                self._skipping = 1
+                return None
+
+        elem = super().start(tag, attrs)
+        if () in paths:
+            stack.append(None)
+        else:
+            stack.append(paths)
+            self._stack.append(elem)
+        return elem
+
+    def data(self, data):
+        if self._skipping:
+            return
+        super().data(data)
+
+    def end(self, tag):
+        if self._skipping:
+            self._skipping -= 1
+            return None
+        elem = super().end(tag)
+        if self._paths and self._paths.pop() is not None:
+            self._stack.pop()
+            if len(elem) == 0 and self._stack:
+                # Nothing selected within it
+                self._stack[-1].remove(elem)
+        return elem
+
+
+class ParseResult(NamedTuple):
+    """
+    Outcome of parsing one of the sources passed to `parse_many()`: either
+    the converted ``ofx``, or the ``error`` that parsing/conversion raised.
+    """
+
+    source: Any
+    ofx: Optional[Aggregate]
+    error: Optional[Exception]
+
+
+def parse_many(
+    sources: Iterable,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    include: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> Iterator[ParseResult]:
+    """
+    Parse and convert a batch of OFX documents in parallel, spreading them
+    over a pool of *workers* processes (by default, one per CPU).
+
+    *sources* are file names or bytes-like objects holding OFX documents,
+    as for `OFXTree.parse_bytes()`; they're sent to the workers in chunks
+    of *chunksize*.  *include* is passed through to `OFXTree.parse_bytes()`,
+    other keyword args to `OFXTree.convert()`.
+
+    Yield a `ParseResult` for each source, in input order, or in order of
+    completion unless *ordered*.  A source that fails to parse yields
+    a result holding the exception, rather than aborting the batch.
+    With *workers* = 1, documents are parsed in this process instead.
+    """
+    sources = list(sources)
+    include = None if include is None else tuple(include)
+    chunks = [sources[i : i + chunksize] for i in range(0, len(sources), chunksize)]
+
+    if workers == 1:
+        for chunk in chunks:
+            results = _parse_chunk(chunk, include, kwargs)
+            for source, (ofx, error) in zip(chunk, results):
+                yield ParseResult(source, ofx, error)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = {
+            executor.submit(_parse_chunk, chunk, include, kwargs): chunk
+            for chunk in chunks
+        }
+        if ordered:
+            completed: Iterable[concurrent.futures.Future] = futures
+        else:
+            completed = concurrent.futures.as_completed(futures)
+        for future in completed:
+            chunk = futures[future]
+            try:
+                results = future.result()
+            except Exception as err:
+                # E.g. worker died, or result can't be pickled
+                results = [(None, err)] * len(chunk)
+            for source, (ofx, error) in zip(chunk, results):
+                yield ParseResult(source, ofx, error)
+
+
+def _parse_chunk(
+    sources: Sequence, include: Optional[Sequence[str]], kwargs: dict
+) -> List[Tuple[Optional[Aggregate], Optional[Exception]]]:
+    """Parse & convert each of ``sources``; cf. ``parse_many()``"""
+    results: List[Tuple[Optional[Aggregate], Optional[Exception]]] = []
+    for source in sources:
+        try:
+            tree = OFXTree()
+            tree.parse_bytes(source, include=include)
+            results.append((tree.convert(**kwargs), None))
+        except Exception as err:
+            results.append((None, err))
+    return results
+
+
+def main(*files, workers: Optional[int] = None):
     """
     Simple functional test for impatient developers.
     """
-    for file in files:
-        print(f"Parsing {file}..")
-        ofxparser = OFXTree()
-        ofxparser.parse(file)
-        response = ofxparser.convert()
-        print(response)
+    for result in parse_many(files, workers=workers):
+        print(f"Parsing {result.source}..")
+        if result.error is not None:
+            print(f"{type(result.error).__name__}: {result.error}")
+        else:
+            print(result.ofx)
         print("=" * 79)
 
 
@@ -263,7 +1055,13 @@ if __name__ == "__main__":
         default=0,
         help="Give more output (option can be repeated)",
     )
+    argparser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
     args = argparser.parse_args()
     log_level = LOG_LEVELS.get(args.verbose, logging.DEBUG)
     config.configure_logging(log_level)
-    main(*args.file)
+    main(*args.file, workers=args.workers)
@@ -27,17 +27,26 @@ __all__ = [
     "SubAggregate",
     "ListAggregate",
     "Unsupported",
+    "NUMERIC_MODES",
+    "numeric_mode",
+    "enum_members",
+    "validation",
+    "lazy_conversion",
+    "Deferred",
+    "MinorUnits",
 ]
 
 
 # stdlib imports
-from functools import singledispatchmethod
+from functools import singledispatchmethod, lru_cache
+import contextlib
+import contextvars
 import decimal
+import enum
 import datetime
 import re
 import warnings
-from xml.sax import saxutils
-from typing import Any, Optional, Union, Type
+from typing import Any, Optional, Union, Type, Iterator, Callable
 import inspect
 
 
@@ -94,6 +103,52 @@ def call_signature(*args, **kwargs):
     return decorate
 
 
+_validation = contextvars.ContextVar("validation", default=True)
+
+
+@contextlib.contextmanager
+def validation(enabled: bool = True) -> Iterator[None]:
+    """
+    Context manager selecting whether values converted within the current
+    thread/task are validated against the OFX spec.  ``validation(False)`` is
+    for input that's known to be valid (e.g. previously validated): ``Element``
+    converters don't raise for missing required values, overlong strings or
+    invalid enum values, and ``Aggregate`` constraints aren't checked until
+    ``Aggregate.validate()``.  Cf. ``OFXTree.convert(validate=...)``.
+    """
+    token = _validation.set(enabled)
+    try:
+        yield
+    finally:
+        _validation.reset(token)
+
+
+class _Dispatcher:
+    """
+    Single-dispatch ``convert()``/``unconvert()`` of an ``Element`` instance,
+    memoizing the implementation for each value type in a flat dict.
+    """
+
+    __slots__ = ("element", "dispatcher", "table")
+
+    def __init__(self, element: "Element", dispatcher):
+        self.element = element
+        self.dispatcher = dispatcher
+        self.table = {cls: dispatcher.dispatch(cls) for cls in dispatcher.registry}
+
+    def __call__(self, value):
+        cls = value.__class__
+        try:
+            func = self.table[cls]
+        except KeyError:
+            func = self.table[cls] = self.dispatcher.dispatch(cls)
+        return func(self.element, value)
+
+    def __repr__(self) -> str:
+        name = self.dispatcher.__name__
+        return f"<{self.__class__.__name__} {name}() of {self.element!r}>"
+
+
 @call_signature()
 class Element:
     """Python representation of OFX 'element', i.e. *ML leaf node containing text data.
@@ -121,22 +176,52 @@ class Element:
     ``Aggregate`` class remains alive, but the ``Aggregate`` instances can be garbage
     collected when no longer needed.
 
+    By default the value is stored in the instance ``__dict__``.  ``Aggregate``
+    subclasses defined with ``compact=True`` instead store it in a ``__slots__``
+    entry, whose member descriptor is assigned to ``Element.slot``.
+
     A good introductory discussion to this use of descriptors is here:
     https://realpython.com/python-descriptors/#how-to-use-python-descriptors-properly
 
     Prior to setting the data value, each ``Element`` performs validation
     (using the arguments passed to ``__init__()``) and type conversion
     (using the logic implemented in ``convert()``).
+
+    Subclasses implement ``convert()`` and ``unconvert()`` as
+    ``singledispatchmethod``, but each instance shadows them with a
+    ``_Dispatcher`` looking up the implementation for the value type in a
+    flat dict, since ``singledispatchmethod`` builds a new wrapper function
+    every time the method is accessed.
     """
 
     __type__: Any = NotImplemented  # define in subclass
 
+    # Member descriptor of the ``__slots__`` entry holding the value, if any
+    slot: Any = None
+
     def __init__(self, *args, **kwargs):
         """ """
         bound = self.__signature__.bind(*args, **kwargs)
         bound.apply_defaults()
         for name, val in bound.arguments.items():
             setattr(self, name, val)
+        self._install_dispatchers()
+
+    def _install_dispatchers(self) -> None:
+        for name in ("convert", "unconvert"):
+            method = inspect.getattr_static(self, name, None)
+            if isinstance(method, singledispatchmethod):
+                self.__dict__[name] = _Dispatcher(self, method.dispatcher)
+
+    def __getstate__(self) -> dict:
+        # Don't copy/pickle dispatchers bound to this instance
+        return {
+            k: v for k, v in self.__dict__.items() if not isinstance(v, _Dispatcher)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._install_dispatchers()
 
     def __repr__(self) -> str:
         repr = f"<{self.__class__.__name__}"
@@ -164,7 +249,10 @@ class Element:
         #  the code base for tests to run.
         if obj is None:
             return
-        return obj.__dict__[self.name]
+        slot = self.slot
+        if slot is None:
+            return obj.__dict__[self.name]
+        return slot.__get__(obj)
 
     def __set__(self, obj, value) -> None:
         """Perform validation and type conversion before setting value.
@@ -172,7 +260,19 @@ class Element:
         ``self`` is the instance of the descriptor
         ``obj`` is the instance of the object your descriptor is attached to.
         """
-        obj.__dict__[self.name] = self.convert(value)
+        slot = self.slot
+        if slot is None:
+            obj.__dict__[self.name] = self.convert(value)
+        else:
+            slot.__set__(obj, self.convert(value))
+
+    def store(self, obj, value) -> None:
+        """Set value that's already been converted, bypassing ``convert()``"""
+        slot = self.slot
+        if slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            slot.__set__(obj, value)
 
     def convert(self, value):
         """Define in subclass"""
@@ -180,7 +280,7 @@ class Element:
 
     def enforce_required(self, value):
         """Utility used by many subclass converters"""
-        if value is None and self.required:
+        if value is None and self.required and _validation.get():
             raise OFXSpecError(f"{self.__class__.__name__}: Value is required")
 
         return value
@@ -228,6 +328,37 @@ class Bool(Element):
         return self.enforce_required(value)
 
 
+# Unescape '&amp;' '&lt;' '&gt;' '&nbsp;' per OFX section 2.3.
+# Also go ahead and unescape the other XML entities and character references,
+# because FIs tend to mix &amp; match...  N.B. this must agree with what expat
+# does for OFXv2 bodies parsed by ``ofxtools.Parser.OFXTree._parsexml()``.
+ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "nbsp": " ", "apos": "'", "quot": '"'}
+ENTITY_REGEX = re.compile(r"&(?:#([0-9]+)|#[xX]([0-9a-fA-F]+)|([a-z]+));")
+
+
+def _unescape_entity(match: re.Match) -> str:
+    num, hexnum, name = match.groups()
+    if name is not None:
+        return ENTITIES.get(name, match.group())
+    try:
+        return chr(int(num) if num is not None else int(hexnum, 16))
+    except (ValueError, OverflowError):
+        return match.group()
+
+
+def unescape(value: str) -> str:
+    """
+    Replace entities and character references in OFX text with the characters
+    they stand for.  Unknown entities are left alone.
+
+    Entities are replaced in a single pass, so this is the exact inverse of
+    ``xml.sax.saxutils.escape()``, e.g. '&amp;#39;' becomes '&#39;'.
+    """
+    if "&" not in value:
+        return value
+    return ENTITY_REGEX.sub(_unescape_entity, value)
+
+
 @call_signature(length=None)
 class String(Element):
     __type__ = str
@@ -240,7 +371,11 @@ class String(Element):
 
     def enforce_length(self, value: str) -> str:
         # Mypy doesn't understand that ``length`` gets set by ``__init__()``
-        if self.length is not None and len(value) > self.length:  # type: ignore
+        if (
+            self.length is not None
+            and len(value) > self.length  # type: ignore
+            and _validation.get()
+        ):
             msg = f"{type(self).__name__}: {value!r} exceeds max length={self.length}"  # type: ignore
             if self.strict:
                 raise OFXSpecError(msg)
@@ -253,11 +388,7 @@ class String(Element):
         if value == "":
             return self.enforce_required(None)
 
-        # Unescape '&amp;' '&lt;' '&gt;' '&nbsp;' per OFX section 2.3
-        # Also go ahead and unescape other XML control characters,
-        # because FIs tend to mix &amp; match...
-        value = saxutils.unescape(value, {"&nbsp;": " ", "&apos;": "'", "&quot;": '"'})
-        return self.enforce_length(value)
+        return self.enforce_length(unescape(value))
 
     @convert.register
     def _convert_none(self, value: None):
@@ -289,12 +420,35 @@ class NagString(String):
     strict = False
 
 
+_enum_members = contextvars.ContextVar("enum_members", default=False)
+
+
+@contextlib.contextmanager
+def enum_members(enabled: bool = True) -> Iterator[None]:
+    """
+    Context manager selecting whether ``OneOf`` values converted within the
+    current thread/task are ``enum.Enum`` members (cf. ``OneOf.enum``) rather
+    than plain ``str``.  Cf. ``OFXTree.convert(enums=...)``.
+    """
+    token = _enum_members.set(enabled)
+    try:
+        yield
+    finally:
+        _enum_members.reset(token)
+
+
 class OneOf(Element):
     """Enum data type.
 
     Usage example from ``OPTINFO``:
     >> opttype = OneOf("CALL", "PUT", required=True)
 
+    Valid values are looked up in a dict mapping each to its canonical instance,
+    so validating e.g. ISO4217 currency codes doesn't scan hundreds of strings,
+    and all converted occurrences of a value share a single ``str``.
+    Within ``enum_members()``, ``convert()`` instead returns members of
+    ``self.enum``, an ``enum.Enum`` subclass (with ``str`` mixin) of valid values.
+
     N.B. the variable number of positional args used for instantiation violates the
     assumptions of ``call_signature``, so we skip the ``@call_signature`` decorator
     and directly create the ``__signature__`` attribute in the class definition.
@@ -310,14 +464,45 @@ class OneOf(Element):
         )
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Intern table of valid values
+        self.members = {value: value for value in self.valid}
+        self._enum: Optional[Type[enum.Enum]] = None
+
+    @property
+    def enum(self) -> Type[enum.Enum]:
+        """``enum.Enum`` subclass whose members' names & values are ``self.valid``"""
+        if self._enum is None:
+            name = getattr(self, "name", type(self).__name__).upper()
+            self._enum = enum.Enum(  # type: ignore
+                name, [(value, value) for value in self.valid], type=str
+            )
+        return self._enum
+
+    def _lookup(self, value):
+        """Return canonical instance of valid value; else raise OFXSpecError"""
+        try:
+            return self.members[value]
+        except (KeyError, TypeError):
+            raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
+
     @singledispatchmethod
     def convert(self, value):
         return self._convert_default(value)
 
     def _convert_default(self, value):
         value = self.enforce_required(value)
-        if value is not None and value not in self.valid:
-            raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
+        if value is None:
+            return value
+        try:
+            value = self._lookup(value)
+        except OFXSpecError:
+            if _validation.get():
+                raise
+            return value
+        if _enum_members.get():
+            value = self.enum[value]
         return value
 
     @convert.register
@@ -332,8 +517,9 @@ class OneOf(Element):
     @singledispatchmethod
     def unconvert(self, value):
         value = self.enforce_required(value)
-        if value is not None and value not in self.valid:
-            raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
+        if value is not None:
+            # Plain ``str``, even for ``enum`` members
+            value = self._lookup(value)
         return value
 
     @unconvert.register
@@ -349,7 +535,7 @@ class Integer(Element):
     def enforce_length(self, value: int) -> int:
         # Mypy doesn't understand that ``length`` gets set by ``__init__()``
         length = self.length  # type: ignore
-        if length is not None and value >= 10**length:
+        if length is not None and value >= 10**length and _validation.get():
             msg = f"'{value}' has too many digits; max digits={length}"
             raise OFXSpecError(msg)
         return value
@@ -391,14 +577,55 @@ class Integer(Element):
         return str(value)
 
 
+# Representations of ``Decimal`` values converted from strings (cf. ``numeric_mode()``)
+#   "decimal" - ``decimal.Decimal`` (exact)
+#   "float" - ``float`` (approximate)
+#   "scaled" - ``MinorUnits``, i.e. the value * 10**``Decimal.places``, for
+#              Elements declaring ``places``; exact ``decimal.Decimal`` otherwise
+NUMERIC_MODES = ("decimal", "float", "scaled")
+
+_numeric_mode = contextvars.ContextVar("numeric_mode", default="decimal")
+
+
+class MinorUnits(int):
+    """
+    ``int`` count of minor units (e.g. cents) returned by ``Decimal.convert()``
+    in "scaled" numeric mode.  Distinct from plain ``int`` so ``unconvert()``
+    doesn't mistake arbitrary ints for scaled amounts.
+    """
+
+
+@contextlib.contextmanager
+def numeric_mode(mode: str) -> Iterator[None]:
+    """
+    Context manager setting the representation of ``Decimal`` values converted
+    from strings (i.e. parsed) within the current thread/task; one of
+    ``NUMERIC_MODES``.  Cf. ``OFXTree.convert(numeric=...)``.
+    """
+    if mode not in NUMERIC_MODES:
+        raise ValueError(f"numeric mode must be one of {NUMERIC_MODES}; not {mode!r}")
+    token = _numeric_mode.set(mode)
+    try:
+        yield
+    finally:
+        _numeric_mode.reset(token)
+
+
 #  N.B. "scale" here means "decimal places"
 #  i.e. Decimal(2).convert("12345.67890") is Decimal("12345.68")
-@call_signature(scale=None)
+#
+#  "places" is the decimal places of the minor unit (e.g. 2 for cents) counted
+#  by ``MinorUnits`` in "scaled" numeric mode; by default, same as "scale".
+#  Elements declaring neither (e.g. UNITS, UNITPRICE, exchange rates) aren't
+#  scaled.
+@call_signature(scale=None, places=None)
 class Decimal(Element):
     __type__ = decimal.Decimal
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.places is None:
+            self.places = self.scale
         #  Rewrite ``self.scale`` from # of digits to a ``decimal.Decimal`` instance
         #  That can be directly fed into ``decimal.Decimal.quantize()``
         if self.scale is not None:
@@ -419,7 +646,16 @@ class Decimal(Element):
         return value
 
     @convert.register
-    def _convert_str(self, value: str) -> decimal.Decimal:
+    def _convert_str(self, value: str) -> Union[decimal.Decimal, float, MinorUnits]:
+        mode = _numeric_mode.get()
+        if mode == "float":
+            try:
+                return float(value)
+            except ValueError:
+                return float(value.replace(",", "."))
+        elif mode == "scaled" and self.places is not None:
+            return self._convert_scaled(value)
+
         # Handle Euro-style decimal separators (comma)
         try:
             dec = decimal.Decimal(value)
@@ -431,6 +667,39 @@ class Decimal(Element):
 
         return dec
 
+    @convert.register
+    def _convert_minorunits(self, value: MinorUnits) -> MinorUnits:
+        return value
+
+    @convert.register
+    def _convert_float(self, value: float) -> Union[decimal.Decimal, float]:
+        if _numeric_mode.get() == "float":
+            return value
+        return self.__type__(value)
+
+    def _convert_scaled(self, value: str) -> MinorUnits:
+        """
+        Convert to count of minor units, i.e. the value * 10**``places``.
+        Values with more (nonzero) decimal places can't be represented, and
+        raise OFXSpecError rather than being rounded.
+        """
+        places = self.places
+        # Fast path: plain [+-]digits[.digits] that fits ``places``
+        whole, _, fraction = value.replace(",", ".").partition(".")
+        digits = whole[1:] if whole[:1] in ("+", "-") else whole
+        if len(fraction) <= places and _isdigits(digits + fraction):
+            return MinorUnits(whole + fraction.ljust(places, "0"))
+
+        try:
+            dec = decimal.Decimal(value)
+        except decimal.InvalidOperation:
+            dec = decimal.Decimal(value.replace(",", "."))
+        scaled = dec.scaleb(places)
+        integral = scaled.to_integral_value()
+        if integral != scaled:
+            raise OFXSpecError(f"'{value}' has more than {places} decimal places")
+        return MinorUnits(integral)
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -447,6 +716,19 @@ class Decimal(Element):
             raise ValueError(f"'{value}' doesn't match scale={self.scale}")
         return str(value)
 
+    @unconvert.register
+    def _unconvert_float(self, value: float):
+        dec = decimal.Decimal(repr(value))
+        if self.scale is not None:
+            dec = dec.quantize(self.scale)
+        return format(dec, "f")
+
+    @unconvert.register
+    def _unconvert_minorunits(self, value: MinorUnits):
+        if self.places is None:
+            raise TypeError(f"{self.__class__.__name__} doesn't declare places")
+        return str(decimal.Decimal(value).scaleb(-self.places))
+
     @unconvert.register
     def _unconvert_none(self, value: None) -> None:
         # Pass through None, unless value is required
@@ -515,6 +797,16 @@ DT_REGEX = re.compile(
 )
 
 
+def _isdigits(value: str) -> bool:
+    """True if nonempty and all ASCII digits (``str.isdigit()`` allows others)"""
+    return value.isascii() and value.isdigit()
+
+
+# Number of distinct date/time strings whose conversions are memoized
+# by ``DateTime._strptime()``.
+DATETIME_CACHE_SIZE = 4096
+
+
 def format_datetime(format: str, value: datetime.datetime) -> str:
     """
     Format a `datetime` or `time` according to the OFX specification.
@@ -572,29 +864,125 @@ class DateTime(Element):
 
     @convert.register
     def _convert_str(self, value: str):
-        match = self.regex.match(value)
+        return self._strptime(value)
+
+    @classmethod
+    @lru_cache(maxsize=DATETIME_CACHE_SIZE)
+    def _strptime(cls, value: str):
+        """
+        Convert OFX-formatted date/time string to UTC ``__type__`` instance.
+
+        Statements repeat the same DTPOSTED etc. many times over, so recently
+        seen strings are memoized (the results are immutable).
+        """
+        fields = cls._split_fixed(value) or cls._split_regex(value)
+        *intfields, millisecond, hours, minutes, tz_name = fields
+        gmt_offset = cls.parse_gmt_offset(hours, minutes, tz_name)
+        # OFX time formats give milliseconds,
+        # but datetime.datetime wants microseconds
+        try:
+            dt = cls.__type__(*intfields, 1000 * millisecond)  # type: ignore
+        except ValueError as err:
+            # Fields in range for the format, but not a valid date/time,
+            # e.g. Feb 30 or a leap second (SS=60)
+            msg = f"'{value}' is not a valid {cls.__type__.__name__}: {err}"
+            raise OFXSpecError(msg) from err
+        return cls.normalize_to_gmt(dt, gmt_offset)
+
+    @classmethod
+    def _split_regex(cls, value: str) -> tuple:
+        """
+        Parse string with ``regex``, returning the date/time fields as ints
+        (year, month, day, hour, minute, second, millisecond), followed by the
+        GMT offset hours, minutes & TZ name as matched.
+        """
+        match = cls.regex.match(value)
         if match is None:
-            msg = f"'{value}' does not conform to OFX formats for {self.__type__}"
+            msg = f"'{value}' does not conform to OFX formats for {cls.__type__}"
             raise OFXSpecError(msg)
 
         matchdict = match.groupdict()
-
-        gmt_offset = self.parse_gmt_offset(
+        offset = [
             matchdict.pop("gmt_offset_hours"),
             matchdict.pop("gmt_offset_minutes"),
             matchdict.pop("tz_name"),
-        )
+        ]
+        return tuple([int(v or 0) for v in matchdict.values()] + offset)
 
-        intmatches = {k: int(v or 0) for k, v in matchdict.items()}
+    @staticmethod
+    def _split_fixed(value: str) -> Optional[tuple]:
+        """
+        Fast path for ``_split_regex()``, slicing the common fixed-width shapes
+        YYYYMMDD, YYYYMMDDHHMMSS and YYYYMMDDHHMMSS.XXX (the latter two
+        optionally followed by [gmt offset[:tz name]]).
 
-        # OFX time formats give milliseconds,
-        # but datetime.datetime wants microseconds
-        intmatches["microsecond"] = 1000 * intmatches.pop("millisecond")
-        # Mypy doesn't understand passing ``**intmatches`` to instantiate
-        return self.normalize_to_gmt(self.__type__(**intmatches), gmt_offset)  # type: ignore
+        Returns None for anything else, which is left to the regex.
+        """
+        bracket = value.find("[")
+        if bracket < 0:
+            stamp = value
+            hours = minutes = tz_name = None
+        else:
+            stamp = value[:bracket]
+            if len(stamp) < 14 or value[-1] != "]":
+                return None
+            # Accept offsets shaped [+-]H[H][.MM][:TZ], which ``regex`` splits
+            # the same way.  N.B. ``regex`` takes MM after any separator char,
+            # e.g. [-3:30], so leave a TZ starting with digits to the regex.
+            offset, colon, tz_name = value[bracket + 1 : -1].partition(":")
+            if not colon:
+                tz_name = None
+            elif not tz_name.isascii() or "\n" in tz_name or tz_name[:2].isdigit():
+                return None
+            hours, dot, minutes = offset.partition(".")
+            digits = hours[1:] if hours[:1] in ("+", "-") else hours
+            if not (len(digits) <= 2 and _isdigits(digits)):
+                return None
+            if dot and not (len(minutes) == 2 and _isdigits(minutes)):
+                return None
+            minutes = minutes or None
+
+        length = len(stamp)
+        if length == 18 and stamp[14] == ".":
+            stamp = stamp[:14] + stamp[15:]
+        elif length not in (8, 14):
+            return None
+        if not _isdigits(stamp):
+            return None
+
+        year = int(stamp[:4])
+        month = int(stamp[4:6])
+        day = int(stamp[6:8])
+        hour = int(stamp[8:10] or 0)
+        minute = int(stamp[10:12] or 0)
+        second = int(stamp[12:14] or 0)
+        millisecond = int(stamp[14:] or 0)
+        if not (
+            1 <= month <= 12
+            and 1 <= day <= 31
+            and hour <= 23
+            and minute <= 59
+            and second <= 60
+        ):
+            return None
+
+        return (
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            millisecond,
+            hours,
+            minutes,
+            tz_name,
+        )
 
+    @staticmethod
+    @lru_cache(maxsize=128)
     def parse_gmt_offset(
-        self, hours: Optional[str], minutes: Optional[str], tz_name: Optional[str]
+        hours: Optional[str], minutes: Optional[str], tz_name: Optional[str]
     ) -> datetime.timedelta:
         try:
             gmt_offset_hours = int(hours or 0)
@@ -610,9 +998,9 @@ class DateTime(Element):
 
         return utils.gmt_offset(gmt_offset_hours, int(minutes or 0))
 
-    def normalize_to_gmt(self, value, gmt_offset):
+    @staticmethod
+    def normalize_to_gmt(value, gmt_offset):
         # Adjust timezone to GMT/UTC
-        self.unconvert.register(datetime.datetime, self._unconvert_datetime)
         return (value - gmt_offset).replace(tzinfo=utils.UTC)
 
     @convert.register
@@ -690,8 +1078,14 @@ class Time(DateTime):
             raise ValueError(f"{value} is not timezone-aware")
         return value
 
+    @staticmethod
+    def _split_fixed(value: str) -> None:
+        # Times are left to ``regex``
+        return None
+
+    @staticmethod
     def normalize_to_gmt(
-        self, value: datetime.time, gmt_offset: datetime.timedelta
+        value: datetime.time, gmt_offset: datetime.timedelta
     ) -> datetime.time:
         # Adjust timezone to GMT/UTC
         # Can't directly add datetime.time and datetime.timedelta
@@ -762,6 +1156,57 @@ class ListElement(Element):
         return self.converter.unconvert(value)
 
 
+_lazy_conversion = contextvars.ContextVar("lazy_conversion", default=False)
+
+
+@contextlib.contextmanager
+def lazy_conversion(enabled: bool = True) -> Iterator[None]:
+    """
+    Context manager selecting whether ``SubAggregate`` values converted within
+    the current thread/task are left unconverted (as ``Deferred``) until the
+    attribute is first read.  Cf. ``OFXTree.convert(lazy=...)``.
+    """
+    token = _lazy_conversion.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy_conversion.reset(token)
+
+
+class Deferred:
+    """
+    Placeholder for the value of a ``SubAggregate`` whose conversion has been
+    put off (cf. ``lazy_conversion()``).
+
+    ``resolve()`` calls ``func(*args)`` in a copy of the context where the
+    ``Deferred`` was created, so the conversion modes in effect then (e.g.
+    ``numeric_mode()``, ``validation()``) still apply.  ``SubAggregate``
+    replaces the ``Deferred`` with the result when the attribute is first read.
+    """
+
+    __slots__ = ("context", "func", "args")
+
+    def __init__(self, func: Callable, *args):
+        self.context = contextvars.copy_context()
+        self.func = func
+        self.args = args
+
+    def resolve(self) -> Any:
+        return self.context.copy().run(self.func, *self.args)
+
+    def __reduce__(self):
+        # Copy/pickle the converted value
+        return (_resolved, (self.resolve(),))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.func.__qualname__}{self.args!r}>"
+
+
+def _resolved(value):
+    """Unpickle/copy a resolved ``Deferred``"""
+    return value
+
+
 @call_signature("__type__")
 class SubAggregate(Element):
     """
@@ -776,8 +1221,17 @@ class SubAggregate(Element):
     followed by any class attribute constraints, e.g.
 
         ``SubAggregate(BANKACCTFROM, required=True)``
+
+    The value may be a ``Deferred``, converted when the attribute is first read.
     """
 
+    def __get__(self, obj, objtype=None):
+        value = super().__get__(obj, objtype)
+        if value.__class__ is Deferred:
+            value = self.convert(value.resolve())
+            self.store(obj, value)
+        return value
+
     @singledispatchmethod
     def convert(self, value):
         if not isinstance(value, self.__type__):
@@ -789,6 +1243,11 @@ class SubAggregate(Element):
         # Pass through None, unless value is required
         return self.enforce_required(value)
 
+    @convert.register
+    def _convert_deferred(self, value: Deferred):
+        # Type-checked when resolved
+        return value
+
     #  This doesn't get used
     #  def __repr__(self):
     #  return f"<{self.__type__.__name__}>"
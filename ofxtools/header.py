@@ -11,7 +11,8 @@ constructs class instances from strings, which is used in deserialization.
 
 This module provides the `parse_header()` function, which demarcates message
 header from message body in serialized OFX data, and processes the header
-portion.  See `ofxtools.Parser` for the rest of it.
+portion.  `parse_bytes()` does the same for OFX data that's already in memory
+(or memory-mapped).  See `ofxtools.Parser` for the rest of it.
 
 Also provided is the `make_header()` utility function, which routes to the
 appropriate header class based on OFX version #.  It's used by
@@ -24,6 +25,8 @@ __all__ = [
     "OFXHeaderV1",
     "OFXHeaderV2",
     "parse_header",
+    "parse_bytes",
+    "read_header",
     "make_header",
 ]
 
@@ -31,6 +34,7 @@ __all__ = [
 # stdlib imports
 import re
 import logging
+from io import BytesIO
 from typing import Tuple, Union, Optional, BinaryIO, Pattern, Any
 
 
@@ -248,6 +252,22 @@ XML_REGEX = re.compile(
 )
 
 
+# Number of bytes to read ahead at a time while searching for the end of
+# the OFXv2 header.
+HEADER_BLOCKSIZE = 1024
+
+
+# Maximum number of bytes read ahead while searching for the end of the
+# OFXv2 header.  The XML declaration plus OFX declaration are tiny; give up
+# on malformed input rather than reading (and searching) the whole file.
+HEADER_MAXSIZE = 8 * HEADER_BLOCKSIZE
+
+
+# Number of bytes at the beginning of an in-memory buffer that are searched
+# for the OFX header before falling back to the whole buffer.
+HEADER_WINDOWSIZE = 4096
+
+
 def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
     """
     Consume source; feed to appropriate class constructor which performs
@@ -259,6 +279,75 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
         * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
         * decoded text of OFX data body
     """
+    header = read_header(source)
+
+    #  Decode the OFX data body according to the encoding declared
+    #  in the OFX header
+    message = source.read().decode(header.codec)
+    if isinstance(header, OFXHeaderV1):
+        message = message.strip()
+
+    return header, message
+
+
+def parse_bytes(buffer) -> Tuple[OFXHeaderType, str]:
+    """
+    Like `parse_header()`, but for a bytes-like object (e.g. `bytes` or
+    `mmap.mmap`) holding the entire OFX document.
+
+    The header is read from a copy of a small window at the start of the
+    buffer (all of it, for a buffer no bigger than ``HEADER_WINDOWSIZE``),
+    doubled in size until the header fits; only when no header is found does
+    that window grow to the entire buffer.  The OFX data body is
+    decoded once, straight from a `memoryview` of the buffer, without being
+    copied first.
+
+    Returns a 2-tuple of:
+        * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
+        * decoded text of OFX data body
+    """
+    with memoryview(buffer) as view:
+        # Only the header window gets copied; if the header doesn't fit,
+        # try again with a window twice the size.
+        windowsize = HEADER_WINDOWSIZE
+        while True:
+            window = view[:windowsize]
+            complete = len(window) == len(view)
+            source = BytesIO(window)
+            windowsize *= 2
+            try:
+                header = read_header(source)
+            except OFXHeaderError:
+                if complete:
+                    raise
+                continue
+
+            body_start = source.tell()
+            # A header ending right at the edge of the window may be truncated
+            if complete or body_start < len(window):
+                break
+
+        #  Decode the OFX data body according to the encoding declared
+        #  in the OFX header
+        message = str(view[body_start:], header.codec)
+
+    if isinstance(header, OFXHeaderV1):
+        message = message.strip()
+
+    return header, message
+
+
+def read_header(source: BinaryIO) -> OFXHeaderType:
+    """
+    Consume the OFX header from source; feed to appropriate class constructor
+    which performs validation/type conversion on OFX header.
+
+    Leaves the input source stream positioned at the beginning of the OFX data
+    body, which is neither read nor decoded.  This allows the body to be
+    consumed incrementally, e.g. by ``ofxtools.Parser.OFXTree.iterparse()``.
+
+    Returns an instance of OFXHeaderV1/OFXHeaderV2 containing parsed data.
+    """
     logger.info("Parsing OFX header")
 
     # Skip empty lines at the beginning
@@ -268,7 +357,7 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
     for _ in range(8):
         # Remember the position within the file where the header begins
         # We'll need this, plus the offset to the end of the regex, to seek() to the
-        # start of the body tag soup when parsing OFXv1
+        # start of the body tag soup
         header_start = source.tell()
 
         # OFX header is read by nice clean machines, not meatbags -
@@ -289,13 +378,27 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
         # OFX declaration, and data elements; ``line`` may or may not
         # contain the latter two.
         #
-        # Just rewind, read the whole file (it must be UTF-8 encoded per
-        # the spec) and slice the OFX data body from the end of the
-        # OFX declaration
-        source.seek(0)
-        decoded_source = source.read().decode(OFXHeaderV2.codec)
-        header, header_end_index = OFXHeaderV2.parse(decoded_source)
-        message = decoded_source[header_end_index:]
+        # Rewind to the start of the header and read ahead in blocks
+        # until we've seen the end of the OFX declaration (including any
+        # trailing whitespace), rather than reading the whole file.
+        # Stop at HEADER_MAXSIZE, so a missing OFX declaration costs a bounded
+        # read instead of repeatedly searching an ever-growing buffer.
+        source.seek(header_start)
+        rawheader = b""
+        while True:
+            block = source.read(HEADER_BLOCKSIZE)
+            rawheader += block
+            # Block boundaries may split a multibyte UTF-8 character
+            # in the body; the header itself is plain ASCII.
+            decoded = rawheader.decode(OFXHeaderV2.codec, errors="replace")
+            headermatch = OFXHeaderV2.regex.search(decoded)
+            if not block or (headermatch and headermatch.end() < len(decoded)):
+                break
+            if len(rawheader) >= HEADER_MAXSIZE:
+                break
+
+        header, header_end_index = OFXHeaderV2.parse(decoded)
+        header_end_offset = len(decoded[:header_end_index].encode(OFXHeaderV2.codec))
     else:
         logger.debug("No XML declaration - OFX version 1")
         rawheader = line + "\n"
@@ -306,19 +409,15 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
 
         header, header_end_offset = OFXHeaderV1.parse(rawheader)
 
-        #  Input source stream position should have advanced to the beginning of
-        #  the OFX body tag soup, which is where subsequent calls
-        #  to read()/readlines() will pick up.
-        #
-        #  The seek call will correct the position when \r newline character is used
-        #  (Issue #84)
-        source.seek(header_start + header_end_offset)
-
-        #  Decode the OFX data body according to the encoding declared
-        #  in the OFX header
-        message = source.read().decode(header.codec).strip()
+    #  Input source stream position should have advanced to the beginning of
+    #  the OFX body tag soup, which is where subsequent calls
+    #  to read()/readlines() will pick up.
+    #
+    #  The seek call will correct the position when \r newline character is used
+    #  (Issue #84)
+    source.seek(header_start + header_end_offset)
 
-    return header, message
+    return header
 
 
 def make_header(
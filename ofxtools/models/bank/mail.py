@@ -48,7 +48,7 @@ class CHKMAILRS(Aggregate):
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     mail = SubAggregate(MAIL, required=True)
     checknum = String(12, required=True)
-    trnamt = Decimal()
+    trnamt = Decimal(places=2)
     dtuser = DateTime()
     fee = Decimal()
 
@@ -58,7 +58,7 @@ class DEPMAILRS(Aggregate):
 
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     mail = SubAggregate(MAIL, required=True)
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     dtuser = DateTime()
     fee = Decimal()
 
@@ -178,14 +178,14 @@ class PAYEE(Aggregate):
     phone = String(32, required=True)
 
 
-class STMTTRN(Aggregate, Origcurrency):
+class STMTTRN(Aggregate, Origcurrency, compact=True):
     """OFX section 11.4.3"""
 
     trntype = OneOf(*TRNTYPES, required=True)
     dtposted = DateTime(required=True)
     dtuser = DateTime()
     dtavail = DateTime()
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     fitid = String(255, required=True)
     correctfitid = String(255)
     correctaction = OneOf("REPLACE", "DELETE")
@@ -217,18 +217,29 @@ class BANKTRANLIST(TranList):
 
     stmttrn = ListAggregate(STMTTRN)
 
+    defaultColumns = [
+        "fitid",
+        "trntype",
+        "dtposted",
+        "dtuser",
+        "trnamt",
+        "checknum",
+        "name",
+        "memo",
+    ]
+
 
 class LEDGERBAL(Aggregate):
     """OFX section 11.4.2.2"""
 
-    balamt = Decimal(required=True)
+    balamt = Decimal(places=2, required=True)
     dtasof = DateTime(required=True)
 
 
 class AVAILBAL(Aggregate):
     """OFX section 11.4.2.2"""
 
-    balamt = Decimal(required=True)
+    balamt = Decimal(places=2, required=True)
     dtasof = DateTime(required=True)
 
 
@@ -247,7 +258,7 @@ class STMTRS(Aggregate):
     banktranlistp = Unsupported()
     ledgerbal = SubAggregate(LEDGERBAL, required=True)
     availbal = SubAggregate(AVAILBAL)
-    cashadvbalamt = Decimal()
+    cashadvbalamt = Decimal(places=2)
     intrate = Decimal()
     ballist = SubAggregate(BALLIST)
     mktginfo = String(360)
@@ -307,7 +318,7 @@ class CCSTMTRS(Aggregate):
     banktranlistp = Unsupported()
     ledgerbal = SubAggregate(LEDGERBAL, required=True)
     availbal = SubAggregate(AVAILBAL)
-    cashadvbalamt = Decimal()
+    cashadvbalamt = Decimal(places=2)
     intratepurch = Decimal()
     intratecash = Decimal()
     intratexfer = Decimal()
@@ -43,8 +43,8 @@ class CLOSING(Aggregate, Origcurrency):
     dtopen = DateTime()
     dtclose = DateTime(required=True)
     dtnext = DateTime()
-    balopen = Decimal()
-    balclose = Decimal(required=True)
+    balopen = Decimal(places=2)
+    balclose = Decimal(places=2, required=True)
     balmin = Decimal()
     depandcredit = Decimal()
     chkanddebit = Decimal()
@@ -99,8 +99,8 @@ class CCCLOSING(Aggregate):
     dtopen = DateTime()
     dtclose = DateTime(required=True)
     dtnext = DateTime()
-    balopen = Decimal()
-    balclose = Decimal(required=True)
+    balopen = Decimal(places=2)
+    balclose = Decimal(places=2, required=True)
     intytd = Decimal()
     dtpmtdue = DateTime()
     minpmtdue = Decimal()
@@ -36,7 +36,7 @@ class CHKDESC(Aggregate):
     name = String(32, required=True)
     chknum = String(12)
     dtuser = DateTime()
-    trnamt = Decimal()
+    trnamt = Decimal(places=2)
 
 
 class STPCHKRQ(Aggregate):
@@ -55,7 +55,7 @@ class STPCHKNUM(Aggregate, Origcurrency):
     checknum = String(12, required=True)
     name = String(32)
     dtuser = DateTime()
-    trnamt = Decimal()
+    trnamt = Decimal(places=2)
     chkstatus = OneOf("0", "1", "100", "101", required=True)
     chkerror = String(255)
     currency = SubAggregate(CURRENCY)
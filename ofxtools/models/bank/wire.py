@@ -59,7 +59,7 @@ class WIRERQ(Aggregate):
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     wirebeneficiary = SubAggregate(WIREBENEFICIARY, required=True)
     wiredestbank = SubAggregate(WIREDESTBANK)
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     dtdue = DateTime()
     payinstruct = String(255)
 
@@ -72,7 +72,7 @@ class WIRERS(Aggregate):
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     wirebeneficiary = SubAggregate(WIREBENEFICIARY, required=True)
     wiredestbank = SubAggregate(WIREDESTBANK)
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     dtdue = DateTime()
     payinstruct = String(255)
     dtxferprj = DateTime()
@@ -33,7 +33,7 @@ class XFERINFO(Aggregate):
     ccacctfrom = SubAggregate(CCACCTFROM)
     bankacctto = SubAggregate(BANKACCTTO)
     ccacctto = SubAggregate(CCACCTTO)
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     dtdue = DateTime()
 
     requiredMutexes = [["bankacctfrom", "ccacctfrom"], ["bankacctto", "ccacctto"]]
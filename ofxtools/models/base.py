@@ -23,18 +23,24 @@ __all__ = ["Aggregate", "ElementList"]
 
 # stdlib imports
 import xml.etree.ElementTree as ET
-from copy import deepcopy
+from xml.sax import saxutils
 import functools
+import copy
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
     Tuple,
     Callable,
     Sequence,
+    List,
+    BinaryIO,
     Mapping,
     Union,
     Optional,
     ChainMap,
+    NamedTuple,
+    FrozenSet,
 )
 import logging
 import warnings
@@ -74,12 +80,101 @@ class UnknownTagWarning(OFXAggregateWarning):
     """
 
 
-class Aggregate(list):
+class AggregateSchema(NamedTuple):
+    """
+    Class spec of an ``Aggregate`` subclass, compiled when the class is defined.
+
+    Mappings are read-only, ordered as in the class definition (cf.
+    ``Aggregate._superdict()``); see the ``Aggregate`` class properties of the
+    same names for descriptions.
+    """
+
+    spec: Mapping[str, Union[Types.Element, Types.Unsupported]]
+    spec_no_listaggregates: Mapping[str, Union[Types.Element, Types.Unsupported]]
+    elements: Mapping[str, Types.Element]
+    subaggregates: Mapping[str, Types.SubAggregate]
+    unsupported: Mapping[str, Types.Unsupported]
+    listaggregates: Mapping[str, Union[Types.ListAggregate, Types.ListElement]]
+    listelements: Mapping[str, Types.ListElement]
+    # Attribute names in ``spec`` order
+    names: Tuple[str, ...]
+    # Position of each attribute name within ``spec``
+    indices: Mapping[str, int]
+    # Names of ListAggregates/ListElements, which may occur in any order
+    listmembers: FrozenSet[str]
+    # Incoming tag -> tag used for conversion (cf. ``Aggregate.tagAliases``)
+    aliases: Mapping[str, str]
+    # Attribute name -> tag used for serialization
+    tags: Mapping[str, str]
+    # Elements/SubAggregates holding the instance's values, in ``spec`` order
+    # (i.e. ``spec_no_listaggregates`` less ``unsupported``)
+    stored: Tuple[Types.Element, ...]
+    # Attribute names of ``stored``
+    stored_names: Tuple[str, ...]
+    # Whether any of ``stored`` keep their values in ``__slots__``
+    slotted: bool
+    # Attribute name -> paths of SubAggregates proxying it, in lookup order;
+    # filled in lazily by ``Aggregate._proxy_paths()``
+    proxies: Dict[str, Tuple[Tuple[str, ...], ...]]
+
+
+class AggregateMeta(type):
+    """
+    Metaclass of ``Aggregate``, implementing the ``compact`` class keyword.
+
+    Ordinarily the value of each ``Element`` is stored in the instance
+    ``__dict__`` (cf. ``Types.Element.__get__()``).  For leaf-heavy aggregates
+    that occur by the thousands in a statement (e.g. STMTTRN), the per-instance
+    dict accounts for most of their memory footprint.  Defining
+
+        >>> class FOO(Aggregate, compact=True):
+        ...     bar = Types.String(32)
+
+    instead generates ``__slots__`` for the Elements in the class spec, and binds
+    a copy of each ``Element`` to its slot, which then holds the value.  The
+    class spec, attribute access and conversion are otherwise unchanged.
+    Subclasses of a compact class inherit its slots.
+    """
+
+    def __new__(mcls, name, bases, namespace, compact=False, **kwargs):
+        if not compact:
+            return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        # The class MRO doesn't exist yet; look up inherited class attributes
+        # in the MRO of each base class, in order.
+        attrs = ChainMap(namespace, *[vars(b) for base in bases for b in base.mro()])
+        namespace = dict(namespace)
+        slots = {}
+        for attr, value in attrs.items():
+            if (
+                isinstance(value, Types.Element)
+                and not isinstance(value, (Types.ListAggregate, Types.ListElement))
+                and value.slot is None
+            ):
+                namespace[attr] = copy.copy(value)
+                slots[attr] = f"_{attr}"
+
+        namespace["__slots__"] = tuple(slots.values())
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        for attr, slot in slots.items():
+            namespace[attr].slot = cls.__dict__[slot]
+        # Recompile class spec with the slots assigned
+        cls._schema = cls._compile_schema()
+        return cls
+
+
+class Aggregate(list, metaclass=AggregateMeta):
     """
     Base class for Python representation of OFX 'aggregate', i.e. SGML/XML
     parent node that is empty of data text.
     """
 
+    # Compiled class spec; assigned by ``__init_subclass__()``
+    _schema: AggregateSchema
+
+    # Type of class attributes that hold contained list items
+    _listaggregate_type: type = Types.ListAggregate
+
     # Validation constraints used by ``validate_args()``.
 
     # Aggregate MAY have at most child from  `optionalMutexes``
@@ -88,15 +183,28 @@ class Aggregate(list):
     # Aggregate MUST contain exactly one child from ``requiredMutexes``
     requiredMutexes: Sequence[Sequence[str]] = []
 
+    # OFX tags that can't be used as Python attribute names (e.g. reserved
+    # keywords), mapped to the tags of the attributes that stand in for them.
+    # Applied by ``_convert()``, and reversed by ``to_etree()``.
+    tagAliases: Mapping[str, str] = {}
+
+    # Spec violations found by ``_convert()`` within ``Types.validation(False)``,
+    # raised by ``validate()``
+    _deferred: Tuple[str, ...] = ()
+
     def __init__(self, *args, **kwargs):
         """
         Positional args interepreted as list items (of variable #).
         kwargs interpreted as singular sub-elements.
+
+        Within ``Types.validation(False)``, ``validate_args()`` isn't called;
+        cf. ``validate()``.
         """
         list.__init__(self)
-        self.validate_args(*args, **kwargs)
+        if Types._validation.get():
+            self.validate_args(*args, **kwargs)
 
-        for attr in self.spec_no_listaggregates:
+        for attr in self._schema.spec_no_listaggregates:
             value = kwargs.pop(attr, None)
             try:
                 # If attr is an element (i.e. its class is defined in
@@ -155,6 +263,43 @@ class Aggregate(list):
             predicate=lambda x: x == 1,
         )
 
+    def validate(self) -> None:
+        """
+        Check self and children against the OFX spec, as when converting
+        with validation enabled (the default): element values, required
+        attributes, ``validate_args()`` constraints, and the sequence order
+        of the markup they were converted from.
+
+        Aggregates converted within ``Types.validation(False)`` (e.g. by
+        ``OFXTree.convert(validate=False)``) skip these checks; call this
+        to perform them on demand.
+        """
+        if self._deferred:
+            raise OFXSpecError(self._deferred[0])
+
+        schema = self._schema
+        kwargs = {}
+        with Types.validation(True):
+            for attr, type_ in schema.spec_no_listaggregates.items():
+                if attr in schema.unsupported:
+                    continue
+                value = getattr(self, attr)
+                if value is None:
+                    type_.enforce_required(value)
+                    continue
+                kwargs[attr] = value
+                if isinstance(value, Aggregate):
+                    value.validate()
+                else:
+                    # ``unconvert()`` enforces the same constraints as ``convert()``
+                    type_.unconvert(value)
+            self._validate_members()
+            self.validate_args(*self, **kwargs)
+
+    def _validate_members(self) -> None:
+        for member in self:
+            member.validate()
+
     def _apply_args(self, *args) -> None:
         # Interpret positional args as contained list items/elements (of variable #)
         clsnm = self.__class__.__name__
@@ -163,7 +308,7 @@ class Aggregate(list):
             if isinstance(member, Aggregate):
                 # ListAggregate - validate type against spec
                 arg = member.__class__.__name__.lower()
-                if arg not in self.listaggregates:
+                if arg not in self._schema.listaggregates:
                     msg = f"{clsnm} can't contain {arg} as list item: {member}"
                     raise TypeError(msg)
             else:
@@ -180,10 +325,11 @@ class Aggregate(list):
     def _apply_residual_kwargs(self, **kwargs) -> None:
         # Check that all kwargs have been consumed
         if kwargs:
+            schema = self._schema
             args = [
                 k
                 for k in kwargs.keys()
-                if k in self.listaggregates or k in self.listelements
+                if k in schema.listaggregates or k in schema.listelements
             ]
             if args:
                 msg = f"{args}: pass list members as args, not kwargs"
@@ -191,7 +337,7 @@ class Aggregate(list):
             else:
                 cls = self.__class__.__name__
                 kw = str(list(kwargs.keys()))
-                spc = str(list(self.spec.keys()))
+                spc = str(list(schema.names))
                 msg = f"Aggregate {cls} does not define {kw} (spec={spc})"
                 raise OFXSpecError(msg)
 
@@ -207,12 +353,21 @@ class Aggregate(list):
         if not isinstance(elem, ET.Element):
             msg = f"Bad type {type(elem)} - should be xml.etree.ElementTree.Element"
             raise TypeError(msg)
+        return Aggregate._from_etree(elem, elem.tag)
+
+    @staticmethod
+    def _from_etree(elem: ET.Element, tag: str) -> "Aggregate":
+        """
+        Instantiate ``Aggregate`` subclass named ``tag`` from
+        ``xml.etree.ElementTree.Element`` (whose own tag may differ, cf.
+        ``tagAliases``).
+        """
         try:
-            SubClass = getattr(ofxtools.models, elem.tag)
+            SubClass = getattr(ofxtools.models, tag)
         except AttributeError:
-            raise OFXSpecError(f"ofxtools.models doesn't define {elem.tag}")
+            raise OFXSpecError(f"ofxtools.models doesn't define {tag}")
 
-        logger.info(f"Converting <{elem.tag}> to {SubClass.__name__}")
+        logger.info(f"Converting <{tag}> to {SubClass.__name__}")
         instance = SubClass._convert(elem)
         return instance
 
@@ -230,9 +385,16 @@ class Aggregate(list):
         elem = cls.groom(elem)
 
         clsnm = cls.__name__
-        spec = list(cls.spec)
-        listaggregates = cls.listaggregates
-        listelements = cls.listelements
+        schema = cls._schema
+        spec = schema.names
+        indices = schema.indices
+        listmembers = schema.listmembers
+        unsupported = schema.unsupported
+        subaggregates = schema.subaggregates
+        aliases = schema.aliases
+        validating = Types._validation.get()
+        lazy = Types._lazy_conversion.get()
+        deferred: List[str] = []
 
         #  Type alias - accumulator for functools.reduce()
         Accum = Tuple[list, dict, int, bool]
@@ -250,7 +412,17 @@ class Aggregate(list):
             to be used in the next iteration.
             """
             args, kwargs, prev_index, prev_is_listmember = accum
-            attrname = elem.tag.lower()
+            tag = elem.tag
+
+            # Skip extended tags, e.g. INTU.XXX
+            if "." in tag:
+                logger.debug(f"Removing extended tag <{tag}>")
+                return accum
+
+            if tag in aliases:
+                logger.debug(f"Renaming <{tag}> to <{aliases[tag]}>")
+                tag = aliases[tag]
+            attrname = tag.lower()
 
             #  OFX messages have a sequence order defined by the spec.  This order maps
             #  to the order of class attributes defined by ``Aggregate`` subclasses.
@@ -262,35 +434,40 @@ class Aggregate(list):
             #  members.  Other than, we require that the index of an attribute within
             #  the ``Aggregate.spec`` sequence must increase monotonically.
             try:
-                index = spec.index(attrname)
-            except ValueError:
+                index = indices[attrname]
+            except KeyError:
                 #  raise OFXSpecError(f"{clsnm}.spec = {spec}; doesn't contain {attrname}")
                 msg = (
-                    f"While parsing {clsnm}, encountered unknown tag {elem.tag}; "
+                    f"While parsing {clsnm}, encountered unknown tag {tag}; "
                     "skipping."
                 )
                 warnings.warn(msg, category=UnknownTagWarning)
                 return accum
 
-            is_listmember = attrname in listaggregates or attrname in listelements
+            is_listmember = attrname in listmembers
             if index <= prev_index and not (is_listmember and prev_is_listmember):
                 msg = (
                     f"Elements out of order: According to the class spec for {clsnm}, "
                     f"{attrname.upper()} should occur before "
                     f"{spec[prev_index].upper()}, not after it."
                 )
-                raise OFXSpecError(msg)
+                if validating:
+                    raise OFXSpecError(msg)
+                deferred.append(msg)
 
             # Parse attribute value
-            if attrname in cls.unsupported:
-                value: Optional[Union[str, Aggregate]] = None
+            if attrname in unsupported:
+                value: Optional[Union[str, Aggregate, Types.Deferred]] = None
             elif elem.text:
                 # Element - extract as string; value will be type-converted upon
                 # instance initialization by ``ofxtools.Types.Element.__set__()``.
                 value = elem.text
+            elif lazy and not is_listmember and attrname in subaggregates:
+                # SubAggregate - recurse when the attribute is first read
+                value = Types.Deferred(Aggregate._from_etree, elem, tag)
             else:
                 # Aggregate - recurse
-                value = Aggregate.from_etree(elem)
+                value = Aggregate._from_etree(elem, tag)
 
             # Append attr value to args (list members) or kwargs (everything else)
             if is_listmember:
@@ -307,27 +484,25 @@ class Aggregate(list):
         #  https://effbot.org/zone/pythondoc-elementtree-ElementTree.htm#elementtree.ElementTree._ElementInterface-class
         initial: Accum = ([], {}, -1, False)
         args, kwargs = functools.reduce(update_args, elem, initial)[:2]
-        return cls(*args, **kwargs)
+        instance = cls(*args, **kwargs)
+        if deferred:
+            instance._deferred = tuple(deferred)
+        return instance
 
     @staticmethod
     def groom(elem: ET.Element) -> ET.Element:
         """
         Modify incoming ``ET.Element`` to play nice with our Python schema.
 
-        Default action is to remove extended tags, e.g. INTU.XXX
+        Default action is nothing; ``_convert()`` itself skips extended tags
+        (e.g. INTU.XXX) and renames ``tagAliases`` as it iterates over the
+        children, without modifying or copying ``elem``.
 
-        Extend in subclass.
+        Override in subclass.
 
         N.B. make sure to perform modifications on a copy.deepcopy(), in order
         to keep the input free of side effects!
         """
-        elem = deepcopy(elem)
-
-        for child in set(elem):
-            if "." in child.tag:
-                logger.debug(f"Removing extended tag <{child.tag}>")
-                elem.remove(child)
-
         return elem
 
     def to_etree(self) -> ET.Element:
@@ -337,8 +512,9 @@ class Aggregate(list):
         cls = self.__class__
         root = ET.Element(cls.__name__)
         do_list = True  # HACK
+        tags = cls._schema.tags
 
-        for attr, type_ in self.spec.items():
+        for attr, type_ in cls._schema.spec.items():
             if isinstance(type_, (Types.ListAggregate, Types.ListElement)):
                 # HACK - the assumption here is that all list members
                 # occur immediately adjacent to each other in the class
@@ -357,9 +533,8 @@ class Aggregate(list):
                     child = value.to_etree()
                     root.append(child)
                 else:
-                    converter = cls._superdict[attr]
-                    text = converter.unconvert(value)
-                    ET.SubElement(root, attr.upper()).text = text
+                    text = type_.unconvert(value)
+                    ET.SubElement(root, tags[attr]).text = text
 
         # Hook to modify `ET.ElementTree` after conversion
         return cls.ungroom(root)
@@ -379,6 +554,122 @@ class Aggregate(list):
         """
         return elem
 
+    def write(
+        self,
+        fileobj: BinaryIO,
+        version: Optional[int] = None,
+        prettyprint: bool = False,
+        close_elements: bool = True,
+    ) -> None:
+        """
+        Serialize self and children as OFX markup, writing UTF-8 encoded chunks
+        to the binary file object ``fileobj`` as they're generated, without
+        building an ``ElementTree``.
+
+        Optional kwargs:
+            ``version`` - OFX version of the output, if known; OFXv2 (XML)
+                requires ``close_elements``
+            ``prettyprint`` - add newlines between tags and indentation
+            ``close_elements`` - add markup closing tags to leaf elements
+
+        With ``close_elements``, output is the same as
+        ``ET.tostring(self.to_etree(), method="html")`` (after ``utils.indent()``
+        if ``prettyprint``).  Text is escaped either way.
+        """
+        if not close_elements and version is not None and version >= 200:
+            raise ValueError(f"OFX version {version} requires ending tags for elements")
+
+        parts: List[str] = []
+
+        def flush() -> None:
+            fileobj.write("".join(parts).encode("utf_8"))
+            parts.clear()
+
+        self._write(parts, flush, close_elements, "", "\n" if prettyprint else "")
+        flush()
+
+    def _write(
+        self,
+        parts: List[str],
+        flush: Callable[[], None],
+        close_elements: bool,
+        pad: str,
+        newline: str,
+    ) -> None:
+        """
+        Append markup for self and children to ``parts``, calling ``flush()``
+        to write them out once enough have accumulated.
+
+        ``pad`` indents the tags of self; ``newline`` follows each line
+        (both empty unless pretty-printing).
+        """
+        cls = self.__class__
+        if (
+            cls.to_etree is not Aggregate.to_etree
+            or cls.ungroom is not Aggregate.ungroom
+        ):
+            # Subclass customizes its ``ET.Element``; serialize that.
+            _write_etree(self.to_etree(), parts, close_elements, pad, newline)
+            return
+
+        tag = cls.__name__
+        schema = cls._schema
+        tags = schema.tags
+        childpad = pad + "  " if newline else pad
+        append = parts.append
+        escape = saxutils.escape
+
+        start = len(parts)
+        append(f"{pad}<{tag}>{newline}")
+        empty = True
+        do_list = True  # Cf. ``to_etree()``
+
+        for attr, type_ in schema.spec.items():
+            if isinstance(type_, (Types.ListAggregate, Types.ListElement)):
+                if do_list:
+                    for member in self:
+                        self._writeListMember(
+                            member, parts, flush, close_elements, childpad, newline
+                        )
+                        empty = False
+                    do_list = False
+                continue
+
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            elif isinstance(value, Aggregate):
+                value._write(parts, flush, close_elements, childpad, newline)
+            else:
+                text = escape(type_.unconvert(value))
+                subtag = tags[attr]
+                if close_elements:
+                    append(f"{childpad}<{subtag}>{text}</{subtag}>{newline}")
+                else:
+                    append(f"{childpad}<{subtag}>{text}{newline}")
+            empty = False
+
+        if empty:
+            # Nothing has been flushed since the opening tag was appended
+            parts[start] = f"{pad}<{tag}></{tag}>{newline}"
+        else:
+            append(f"{pad}</{tag}>{newline}")
+
+        if len(parts) >= 4096:
+            flush()
+
+    def _writeListMember(
+        self,
+        member,
+        parts: List[str],
+        flush: Callable[[], None],
+        close_elements: bool,
+        pad: str,
+        newline: str,
+    ) -> None:
+        # Cf. ``_listAppend()``
+        member._write(parts, flush, close_elements, pad, newline)
+
     @classproperty
     @classmethod
     def _superdict(cls) -> Mapping[str, Any]:
@@ -432,6 +723,61 @@ class Aggregate(list):
         """
         return {k: v for k, v in cls._superdict.items() if predicate(v)}
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._schema = cls._compile_schema()
+
+    @classmethod
+    def _compile_schema(cls) -> AggregateSchema:
+        """
+        Sort class attributes into the mappings held by ``AggregateSchema``.
+
+        Called once per class, when it's defined; the class spec is
+        looked up from the result thereafter, rather than recomputed.
+        """
+
+        def select(predicate: Callable) -> Mapping[str, Any]:
+            return MappingProxyType({k: v for k, v in spec.items() if predicate(v)})
+
+        spec = cls._filter_attrs(
+            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
+        )
+        listaggregates = select(lambda v: isinstance(v, cls._listaggregate_type))
+        listelements = select(lambda v: isinstance(v, Types.ListElement))
+        names = tuple(spec)
+        stored = {
+            k: v
+            for k, v in spec.items()
+            if isinstance(v, Types.Element)
+            and not isinstance(v, (Types.ListAggregate, Types.ListElement))
+        }
+        tags = {name: name.upper() for name in names}
+        tags.update({alias.lower(): tag for tag, alias in cls.tagAliases.items()})
+
+        return AggregateSchema(
+            spec=MappingProxyType(spec),
+            spec_no_listaggregates=select(
+                lambda v: not isinstance(v, (Types.ListAggregate, Types.ListElement))
+            ),
+            elements=select(
+                lambda v: isinstance(v, Types.Element)
+                and not isinstance(v, Types.SubAggregate)
+            ),
+            subaggregates=select(lambda v: isinstance(v, Types.SubAggregate)),
+            unsupported=select(lambda v: isinstance(v, Types.Unsupported)),
+            listaggregates=listaggregates,
+            listelements=listelements,
+            names=names,
+            indices=MappingProxyType({name: i for i, name in enumerate(names)}),
+            listmembers=frozenset(listaggregates) | frozenset(listelements),
+            aliases=MappingProxyType(dict(cls.tagAliases)),
+            tags=MappingProxyType(tags),
+            stored=tuple(stored.values()),
+            stored_names=tuple(stored),
+            slotted=any(v.slot is not None for v in stored.values()),
+            proxies={},
+        )
+
     @classproperty
     @classmethod
     def spec(cls) -> Mapping[str, Union[Types.Element, Types.Unsupported]]:
@@ -442,9 +788,7 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
-        )
+        return dict(cls._schema.spec)
 
     @classproperty
     @classmethod
@@ -455,10 +799,7 @@ class Aggregate(list):
         Mapping of all class attributes that are
         Elements/SubAggregates/Unsupported, excluding ListAggregates/ListElements.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
-            and not isinstance(v, (Types.ListAggregate, Types.ListElement))
-        )
+        return dict(cls._schema.spec_no_listaggregates)
 
     @classproperty
     @classmethod
@@ -468,10 +809,7 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, Types.Element)
-            and not isinstance(v, Types.SubAggregate)
-        )
+        return dict(cls._schema.elements)
 
     @classproperty
     @classmethod
@@ -479,7 +817,7 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are SubAggregates.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.SubAggregate))
+        return dict(cls._schema.subaggregates)
 
     @classproperty
     @classmethod
@@ -487,7 +825,7 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are Unsupported.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.Unsupported))
+        return dict(cls._schema.unsupported)
 
     @classproperty
     @classmethod
@@ -495,7 +833,7 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are ListAggregates.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListAggregate))
+        return dict(cls._schema.listaggregates)
 
     @classproperty
     @classmethod
@@ -503,7 +841,7 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are ListElements.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+        return dict(cls._schema.listelements)
 
     @property
     def _spec_repr(self) -> Sequence[Tuple[str, Any]]:
@@ -517,7 +855,7 @@ class Aggregate(list):
         # "walrus operator" provided in Python 3.8.
         attrs = [
             (attr, repr(getattr(self, attr)))
-            for attr in self.spec_no_listaggregates.keys()
+            for attr in self._schema.spec_no_listaggregates.keys()
             if getattr(self, attr) is not None
         ]
         return attrs
@@ -537,42 +875,201 @@ class Aggregate(list):
             instance_repr += ", len={}".format(num_list_elements)
         return "<{}>".format(instance_repr)
 
+    @classmethod
+    def _proxy_paths(cls, attr: str) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Paths of SubAggregate attribute names, in the order searched by
+        ``__getattr__()``, leading to a class that defines ``attr``.
+
+        Computed once per class and attribute name, then looked up from
+        ``AggregateSchema.proxies``.
+        """
+        proxies = cls._schema.proxies
+        try:
+            return proxies[attr]
+        except KeyError:
+            pass
+
+        paths: List[Tuple[str, ...]] = []
+        if attr not in cls._schema.spec:
+            for name, subaggregate in cls._schema.subaggregates.items():
+                SubClass = subaggregate.__type__
+                if hasattr(SubClass, attr):
+                    paths.append((name,))
+                else:
+                    paths.extend(
+                        (name,) + path for path in SubClass._proxy_paths(attr)
+                    )
+        proxies[attr] = result = tuple(paths)
+        return result
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle/copy as the class, a tuple of the values of ``stored``
+        Elements/SubAggregates (omitting trailing None values), and any other
+        instance attributes, followed by the list items.  Unpickling sets
+        the values without converting or validating them again.
+        """
+        cls = self.__class__
+        schema = cls._schema
+        state = self.__dict__
+        if schema.slotted:
+            values = [element.__get__(self, cls) for element in schema.stored]
+        else:
+            # N.B. ``Types.Deferred`` values pickle/copy as their converted value
+            values = list(map(state.get, schema.stored_names))
+        while values and values[-1] is None:
+            values.pop()
+
+        extra = state.keys() - schema.stored_names
+        if extra:
+            args: tuple = (cls, tuple(values), {k: state[k] for k in extra})
+        else:
+            args = (cls, tuple(values))
+
+        return (_restore, args, None, iter(self) if self else None)
+
+    def clone(self) -> "Aggregate":
+        """
+        Deep copy of self and children.
+
+        Faster than ``copy.deepcopy()`` (which calls it), since Element
+        values are immutable and Aggregates don't share children.
+        """
+        cls = self.__class__
+        instance = cls.__new__(cls)
+        for element in cls._schema.stored:
+            value = element.__get__(self, cls)
+            if isinstance(value, Aggregate):
+                value = value.clone()
+            element.store(instance, value)
+
+        state = self.__dict__
+        extra = state.keys() - cls._schema.stored_names
+        if extra:
+            instance.__dict__.update({k: state[k] for k in extra})
+
+        list.extend(
+            instance,
+            [
+                member.clone() if isinstance(member, Aggregate) else member
+                for member in self
+            ],
+        )
+        return instance
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
     def __getattr__(self, attr: str):
         """Proxy access to attributes of SubAggregates"""
-        for subaggregate in self.subaggregates:
-            subagg = getattr(self, subaggregate)
+        for path in self._proxy_paths(attr):
+            obj = self
             try:
-                return getattr(subagg, attr)
+                for name in path:
+                    obj = getattr(obj, name)
+                return getattr(obj, attr)
             except (AttributeError, KeyError):
+                # SubAggregate is None, or (compact) its slot isn't set
                 continue
+
         cls = self.__class__.__name__
         raise AttributeError(f"'{cls}' object has no attribute '{attr}'")
 
 
+# ``__init_subclass__()`` isn't called for the base class itself
+Aggregate._schema = Aggregate._compile_schema()
+
+
+def _restore(
+    cls: type, values: tuple, extra: Optional[Dict[str, Any]] = None
+) -> Aggregate:
+    """Unpickle/copy ``Aggregate`` instance; cf. ``Aggregate.__reduce_ex__()``"""
+    instance = cls.__new__(cls)
+    schema = cls._schema
+    if schema.slotted:
+        stored = schema.stored
+        for element, value in zip(stored, values):
+            element.store(instance, value)
+        for element in stored[len(values) :]:
+            element.store(instance, None)
+    else:
+        state = instance.__dict__
+        state.update(zip(schema.stored_names, values))
+        state.update(dict.fromkeys(schema.stored_names[len(values) :]))
+    if extra:
+        instance.__dict__.update(extra)
+    return instance
+
+
+def _write_etree(
+    elem: ET.Element, parts: List[str], close_elements: bool, pad: str, newline: str
+) -> None:
+    """``Aggregate._write()`` for the ``ET.Element`` returned by ``to_etree()``."""
+    tag = elem.tag
+    if len(elem) == 0:
+        text = saxutils.escape(elem.text or "")
+        if close_elements or elem.text is None:
+            parts.append(f"{pad}<{tag}>{text}</{tag}>{newline}")
+        else:
+            parts.append(f"{pad}<{tag}>{text}{newline}")
+        return
+
+    childpad = pad + "  " if newline else pad
+    parts.append(f"{pad}<{tag}>{newline}")
+    for child in elem:
+        _write_etree(child, parts, close_elements, childpad, newline)
+    parts.append(f"{pad}</{tag}>{newline}")
+
+
 class ElementList(Aggregate):
     """
     Aggregate whose sequence contents are ListElements instead of ListAggregates
     """
 
-    @classproperty
-    @classmethod
-    def listaggregates(cls) -> Mapping[str, Types.ListElement]:
-        """
-        ElementList.listaggregates returns ListElements instead of ListAggregates
-        """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+    # ElementList.listaggregates returns ListElements instead of ListAggregates
+    _listaggregate_type = Types.ListElement
 
     def _apply_args(self, *args) -> None:
         # Interpret positional args as contained list items (of variable #)
-        assert len(self.listaggregates) == 1
-        converter = list(self.listaggregates.values())[0]
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        converter = list(listaggregates.values())[0]
         for member in args:
             self.append(converter.convert(member))
 
+    def _validate_members(self) -> None:
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        converter = list(listaggregates.values())[0]
+        for member in self:
+            converter.unconvert(member)
+
     def _listAppend(self, root: ET.Element, member) -> None:
-        assert len(self.listaggregates) == 1
-        spec = list(self.listaggregates.items())[0]
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        spec = list(listaggregates.items())[0]
         attr, converter = spec
 
         text = converter.unconvert(member)
         ET.SubElement(root, attr.upper()).text = text
+
+    def _writeListMember(
+        self,
+        member,
+        parts: List[str],
+        flush: Callable[[], None],
+        close_elements: bool,
+        pad: str,
+        newline: str,
+    ) -> None:
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        attr, converter = list(listaggregates.items())[0]
+
+        tag = attr.upper()
+        text = saxutils.escape(converter.unconvert(member))
+        if close_elements:
+            parts.append(f"{pad}<{tag}>{text}</{tag}>{newline}")
+        else:
+            parts.append(f"{pad}<{tag}>{text}{newline}")
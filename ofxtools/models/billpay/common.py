@@ -119,7 +119,7 @@ class PMTINFO(Aggregate):
     """OFX Section 12.5.2"""
 
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
-    trnamt = Decimal(required=True)
+    trnamt = Decimal(places=2, required=True)
     payeeid = String(12)
     payee = SubAggregate(PAYEE)
     payeelstid = String(12)
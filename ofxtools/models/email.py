@@ -24,7 +24,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -43,6 +42,7 @@ class MAIL(Aggregate):
 
     userid = String(32, required=True)
     dtcreated = DateTime(required=True)
+    # FROM is a reserved Python keyword
     frm = String(32, required=True)
     to = String(32, required=True)
     subject = String(60, required=True)
@@ -50,35 +50,7 @@ class MAIL(Aggregate):
     incimages = Bool(required=True)
     usehtml = Bool(required=True)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged FROM (reserved Python keyword) to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FROM")
-        if frm is not None:
-            logger.debug("Renaming <FROM> to <FRM>")
-            frm.tag = "FRM"
-
-        return super(MAIL, MAIL).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename FRM back to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FRM")
-        if frm is not None:
-            logger.debug("Renaming <FRM> to <FROM>")
-            frm.tag = "FROM"
-
-        return super(MAIL, MAIL).ungroom(elem)
+    tagAliases = {"FROM": "FRM"}
 
 
 class MAILRQ(Aggregate):
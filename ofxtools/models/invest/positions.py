@@ -18,13 +18,14 @@ from ofxtools.Types import (
     ListAggregate,
 )
 from ofxtools.models.base import Aggregate
+from ofxtools.models.wrapperbases import ColumnarList
 from ofxtools.models.invest.acct import INVSUBACCTS
 from ofxtools.models.invest.securities import SECID
 from ofxtools.models.bank import INV401KSOURCES
 from ofxtools.models.i18n import CURRENCY
 
 
-class INVPOS(Aggregate):
+class INVPOS(Aggregate, compact=True):
     """OFX section 13.9.2.6.1"""
 
     secid = SubAggregate(SECID, required=True)
@@ -32,7 +33,7 @@ class INVPOS(Aggregate):
     postype = OneOf("SHORT", "LONG", required=True)
     units = Decimal(required=True)
     unitprice = Decimal(required=True)
-    mktval = Decimal(required=True)
+    mktval = Decimal(places=2, required=True)
     avgcostbasis = Decimal()
     dtpriceasof = DateTime(required=True)
     currency = SubAggregate(CURRENCY)
@@ -78,7 +79,7 @@ class POSSTOCK(Aggregate):
     reinvdiv = Bool()
 
 
-class INVPOSLIST(Aggregate):
+class INVPOSLIST(Aggregate, ColumnarList):
     """OFX section 13.9.2.2"""
 
     posdebt = ListAggregate(POSDEBT)
@@ -86,3 +87,15 @@ class INVPOSLIST(Aggregate):
     posopt = ListAggregate(POSOPT)
     posother = ListAggregate(POSOTHER)
     posstock = ListAggregate(POSSTOCK)
+
+    defaultColumns = [
+        "secid.uniqueid",
+        "secid.uniqueidtype",
+        "heldinacct",
+        "postype",
+        "units",
+        "unitprice",
+        "mktval",
+        "dtpriceasof",
+        "memo",
+    ]
@@ -26,7 +26,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -60,7 +59,7 @@ ASSETCLASSES = (
 )
 
 
-class SECID(Aggregate):
+class SECID(Aggregate, compact=True):
     """OFX section 13.8.1"""
 
     uniqueid = String(32, required=True)
@@ -83,7 +82,7 @@ class SECLISTRQ(Aggregate):
     secrq = ListAggregate(SECRQ)
 
 
-class SECINFO(Aggregate):
+class SECINFO(Aggregate, compact=True):
     """OFX Section 13.8.5.1"""
 
     secid = SubAggregate(SECID, required=True)
@@ -150,40 +149,13 @@ class MFINFO(Aggregate):
 
     secinfo = SubAggregate(SECINFO, required=True)
     mftype = OneOf("OPENEND", "CLOSEEND", "OTHER")
+    # YIELD is a reserved Python keyword
     yld = Decimal()
     dtyieldasof = DateTime()
     mfassetclass = SubAggregate(MFASSETCLASS)
     fimfassetclass = SubAggregate(FIMFASSETCLASS)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(MFINFO, MFINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(MFINFO, MFINFO).ungroom(elem)
+    tagAliases = {"YIELD": "YLD"}
 
 
 class OPTINFO(Aggregate):
@@ -213,41 +185,14 @@ class STOCKINFO(Aggregate):
 
     secinfo = SubAggregate(SECINFO, required=True)
     stocktype = OneOf("COMMON", "PREFERRED", "CONVERTIBLE", "OTHER")
+    # YIELD is a reserved Python keyword
     yld = Decimal()
     dtyieldasof = DateTime()
     typedesc = String(32)
     assetclass = OneOf(*ASSETCLASSES)
     fiassetclass = String(32)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(STOCKINFO, STOCKINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(STOCKINFO, STOCKINFO).ungroom(elem)
+    tagAliases = {"YIELD": "YLD"}
 
 
 class SECLIST(Aggregate):
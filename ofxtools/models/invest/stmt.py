@@ -90,17 +90,17 @@ class INVSTMTRQ(Aggregate):
 class INVBAL(Aggregate):
     """OFX section 13.9.2.7"""
 
-    availcash = Decimal(required=True)
-    marginbalance = Decimal(required=True)
-    shortbalance = Decimal(required=True)
-    buypower = Decimal()
+    availcash = Decimal(places=2, required=True)
+    marginbalance = Decimal(places=2, required=True)
+    shortbalance = Decimal(places=2, required=True)
+    buypower = Decimal(places=2)
     ballist = SubAggregate(BALLIST)
 
 
 class INV401KBAL(Aggregate):
     """OFX section 13.9.2.9"""
 
-    cashbal = Decimal()
+    cashbal = Decimal(places=2)
     pretax = Decimal()
     aftertax = Decimal()
     match = Decimal()
@@ -108,7 +108,7 @@ class INV401KBAL(Aggregate):
     rollover = Decimal()
     othervest = Decimal()
     othernonvest = Decimal()
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     ballist = SubAggregate(BALLIST)
 
 
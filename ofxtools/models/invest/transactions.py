@@ -71,7 +71,7 @@ class INVBANKTRAN(Aggregate):
     subacctfund = OneOf(*INVSUBACCTS, required=True)
 
 
-class INVTRAN(Aggregate):
+class INVTRAN(Aggregate, compact=True):
     """OFX section 13.9.2.4.2"""
 
     fitid = String(255, required=True)
@@ -82,7 +82,7 @@ class INVTRAN(Aggregate):
     memo = String(255)
 
 
-class INVBUY(Aggregate, Origcurrency):
+class INVBUY(Aggregate, Origcurrency, compact=True):
     """OFX section 13.9.2.4.3"""
 
     invtran = SubAggregate(INVTRAN, required=True)
@@ -90,11 +90,11 @@ class INVBUY(Aggregate, Origcurrency):
     units = Decimal(required=True)
     unitprice = Decimal(required=True)
     markup = Decimal()
-    commission = Decimal()
-    taxes = Decimal()
-    fees = Decimal()
-    load = Decimal()
-    total = Decimal(required=True)
+    commission = Decimal(places=2)
+    taxes = Decimal(places=2)
+    fees = Decimal(places=2)
+    load = Decimal(places=2)
+    total = Decimal(places=2, required=True)
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
@@ -107,7 +107,7 @@ class INVBUY(Aggregate, Origcurrency):
     prioryearcontrib = Bool()
 
 
-class INVSELL(Aggregate, Origcurrency):
+class INVSELL(Aggregate, Origcurrency, compact=True):
     """OFX section 13.9.2.4.3"""
 
     invtran = SubAggregate(INVTRAN, required=True)
@@ -115,21 +115,21 @@ class INVSELL(Aggregate, Origcurrency):
     units = Decimal(required=True)
     unitprice = Decimal(required=True)
     markdown = Decimal()
-    commission = Decimal()
-    taxes = Decimal()
-    fees = Decimal()
-    load = Decimal()
-    withholding = Decimal()
+    commission = Decimal(places=2)
+    taxes = Decimal(places=2)
+    fees = Decimal(places=2)
+    load = Decimal(places=2)
+    withholding = Decimal(places=2)
     taxexempt = Bool()
-    total = Decimal(required=True)
-    gain = Decimal()
+    total = Decimal(places=2, required=True)
+    gain = Decimal(places=2)
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     subacctfund = OneOf(*INVSUBACCTS, required=True)
     loanid = String(32)
-    statewithholding = Decimal()
-    penalty = Decimal()
+    statewithholding = Decimal(places=2)
+    penalty = Decimal(places=2)
     inv401ksource = OneOf(*INV401KSOURCES)
 
 
@@ -137,7 +137,7 @@ class BUYDEBT(Aggregate):
     """OFX section 13.9.2.4.4"""
 
     invbuy = SubAggregate(INVBUY, required=True)
-    accrdint = Decimal()
+    accrdint = Decimal(places=2)
 
 
 class BUYMF(Aggregate):
@@ -179,7 +179,7 @@ class CLOSUREOPT(Aggregate):
     shperctrct = Integer(required=True)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     relfitid = String(255)
-    gain = Decimal()
+    gain = Decimal(places=2)
 
 
 class INCOME(Aggregate, Origcurrency):
@@ -188,11 +188,11 @@ class INCOME(Aggregate, Origcurrency):
     invtran = SubAggregate(INVTRAN, required=True)
     secid = SubAggregate(SECID, required=True)
     incometype = OneOf(*INCOMETYPES, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     subacctfund = OneOf(*INVSUBACCTS, required=True)
     taxexempt = Bool()
-    withholding = Decimal()
+    withholding = Decimal(places=2)
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
     inv401ksource = OneOf(*INV401KSOURCES)
@@ -203,7 +203,7 @@ class INVEXPENSE(Aggregate, Origcurrency):
 
     invtran = SubAggregate(INVTRAN, required=True)
     secid = SubAggregate(SECID, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     subacctfund = OneOf(*INVSUBACCTS, required=True)
     currency = SubAggregate(CURRENCY)
@@ -217,7 +217,7 @@ class JRNLFUND(Aggregate):
     invtran = SubAggregate(INVTRAN, required=True)
     subacctto = OneOf(*INVSUBACCTS, required=True)
     subacctfrom = OneOf(*INVSUBACCTS, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
 
 
 class JRNLSEC(Aggregate):
@@ -234,7 +234,7 @@ class MARGININTEREST(Aggregate, Origcurrency):
     """OFX section 13.9.2.4.4"""
 
     invtran = SubAggregate(INVTRAN, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     subacctfund = OneOf(*INVSUBACCTS, required=True)
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
@@ -246,14 +246,14 @@ class REINVEST(Aggregate, Origcurrency):
     invtran = SubAggregate(INVTRAN, required=True)
     secid = SubAggregate(SECID, required=True)
     incometype = OneOf(*INCOMETYPES, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     units = Decimal(required=True)
     unitprice = Decimal(required=True)
-    commission = Decimal()
-    taxes = Decimal()
-    fees = Decimal()
-    load = Decimal()
+    commission = Decimal(places=2)
+    taxes = Decimal(places=2)
+    fees = Decimal(places=2)
+    load = Decimal(places=2)
     taxexempt = Bool()
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
@@ -265,7 +265,7 @@ class RETOFCAP(Aggregate, Origcurrency):
 
     invtran = SubAggregate(INVTRAN, required=True)
     secid = SubAggregate(SECID, required=True)
-    total = Decimal(required=True)
+    total = Decimal(places=2, required=True)
     subacctsec = OneOf(*INVSUBACCTS, required=True)
     subacctfund = OneOf(*INVSUBACCTS, required=True)
     currency = SubAggregate(CURRENCY)
@@ -278,7 +278,7 @@ class SELLDEBT(Aggregate):
 
     invsell = SubAggregate(INVSELL, required=True)
     sellreason = OneOf("CALL", "SELL", "MATURITY", required=True)
-    accrdint = Decimal()
+    accrdint = Decimal(places=2)
 
 
 class SELLMF(Aggregate):
@@ -326,7 +326,7 @@ class SPLIT(Aggregate, Origcurrency):
     denominator = Decimal(required=True)
     currency = SubAggregate(CURRENCY)
     origcurrency = SubAggregate(ORIGCURRENCY)
-    fraccash = Decimal()
+    fraccash = Decimal(places=2)
     subacctfund = OneOf(*INVSUBACCTS)
     inv401ksource = OneOf(*INV401KSOURCES)
 
@@ -371,3 +371,21 @@ class INVTRANLIST(TranList):
     sellstock = ListAggregate(SELLSTOCK)
     split = ListAggregate(SPLIT)
     transfer = ListAggregate(TRANSFER)
+
+    defaultColumns = [
+        "fitid",
+        "dttrade",
+        "dtsettle",
+        "memo",
+        "secid.uniqueid",
+        "secid.uniqueidtype",
+        "units",
+        "unitprice",
+        "commission",
+        "fees",
+        "total",
+        "subacctsec",
+        "subacctfund",
+        "trntype",
+        "trnamt",
+    ]
@@ -90,9 +90,11 @@ class OFX(Aggregate):
 
     def __repr__(self):
         s = "<{} ".format(self.__class__.__name__)
-        signon = self.signon
-        if signon.fi is not None:
-            s += f"fid='{signon.fi.fid}' org='{signon.fi.org}' "
+        # Signon may be missing, e.g. from ``OFXTree.parse(include=...)``
+        if self.signonmsgsrqv1 is not None or self.signonmsgsrsv1 is not None:
+            signon = self.signon
+            if signon is not None and signon.fi is not None:
+                s += f"fid='{signon.fi.fid}' org='{signon.fi.org}' "
         s += f"len(statements)={len(self.statements)} "
         s += f"len(securities)={len(self.securities)}>"
         return s
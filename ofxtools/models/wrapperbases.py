@@ -10,9 +10,26 @@ create circular imports.
 __all__ = ["TrnRq", "TrnRs", "SyncRqList", "SyncRsList"]
 
 
+# stdlib imports
+import datetime
+import decimal
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
 # local imports
-from ofxtools.Types import Bool, String, DateTime, SubAggregate
+import ofxtools.models
+from ofxtools.Types import (
+    Bool,
+    String,
+    DateTime,
+    SubAggregate,
+    ListAggregate,
+    ListElement,
+    Unsupported,
+)
 from ofxtools.models.base import Aggregate
+from ofxtools.utils import UTC
 from ofxtools.models.common import STATUS, OFXEXTENSION
 
 
@@ -42,7 +59,229 @@ class TrnRs(Aggregate):
     ofxextension = SubAggregate(OFXEXTENSION)
 
 
-class TranList(Aggregate):
+class ColumnarList:
+    """
+    Mixin providing columnar export of the items of a list ``Aggregate``
+    (e.g. STMTTRN in BANKTRANLIST), for vectorized queries over transactions
+    and positions.
+
+    Columns are named by attribute paths relative to each list item, with
+    dots separating the levels of SubAggregates, e.g. ``"trnamt"`` or
+    ``"secid.uniqueid"``.  Path components are looked up like attributes,
+    i.e. proxied through SubAggregates, so ``"fitid"`` finds
+    ``BUYSTOCK.invbuy.invtran.fitid``.  Items without the attribute (or with
+    an empty SubAggregate along the path) get None.
+    """
+
+    # Columns exported when none are given; define in subclass
+    defaultColumns: Sequence[str] = []
+
+    def to_columns(self, columns: Optional[Sequence[str]] = None) -> Dict[str, list]:
+        """
+        Mapping of column name -> list of values, one per list item.
+        """
+        columns = columns or self.defaultColumns
+        paths = [column.split(".") for column in columns]
+        data: Dict[str, list] = {column: [] for column in columns}
+        appends = [data[column].append for column in columns]
+
+        for item in self:  # type: ignore
+            for path, append in zip(paths, appends):
+                append(_getpath(item, path))
+
+        return data
+
+    @classmethod
+    def columns_from_etree(
+        cls, elem: ET.Element, columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, list]:
+        """
+        Mapping of column name -> list of values, read straight from the
+        ``xml.etree.ElementTree.Element`` (e.g. as returned by
+        ``OFXTree.find()``) without instantiating list item Aggregates.
+
+        Each value is type-converted as it would be by ``Aggregate.from_etree()``,
+        but the rest of the item isn't validated.
+        """
+        schema = cls._schema  # type: ignore
+        columns = columns or cls.defaultColumns
+        paths = [column.split(".") for column in columns]
+        data: Dict[str, list] = {column: [] for column in columns}
+        appends = [data[column].append for column in columns]
+
+        for child in elem:
+            tag = schema.aliases.get(child.tag, child.tag)
+            if tag.lower() not in schema.listaggregates:
+                continue
+            itemcls = getattr(ofxtools.models, tag)
+            for path, append in zip(paths, appends):
+                append(_findpath(child, itemcls, path))
+
+        return data
+
+    def to_numpy(self, columns: Optional[Sequence[str]] = None) -> Any:
+        """
+        NumPy structured array with a field per column.
+
+        DateTime values become ``datetime64[us]`` (UTC; NaT if missing).
+        Decimal and float values become ``float64`` (NaN if missing).
+        Integers - including ``MinorUnits`` from "scaled" numeric mode - become
+        ``int64`` (``float64`` if any are missing).  Everything else (strings,
+        SubAggregates, ...) is stored as objects, one per item.
+
+        Requires NumPy.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("ofxtools: to_numpy() requires NumPy")
+
+        arrays = []
+        for column, values in self.to_columns(columns).items():
+            arrays.append((column, _numpy_column(numpy, values)))
+
+        dtype = [(column, array.dtype) for column, array in arrays]
+        result = numpy.empty(len(self), dtype=dtype)  # type: ignore
+        for column, array in arrays:
+            result[column] = array
+        return result
+
+    def to_arrow(self, columns: Optional[Sequence[str]] = None) -> Any:
+        """
+        ``pyarrow.Table`` with a column per column.
+
+        DateTime values become ``timestamp[us, tz=UTC]``; other types are inferred
+        by pyarrow (e.g. Decimal -> ``decimal128``).
+
+        Requires pyarrow.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("ofxtools: to_arrow() requires pyarrow")
+
+        arrays = {}
+        for column, values in self.to_columns(columns).items():
+            if _kind(values) is datetime.datetime:
+                arrays[column] = pyarrow.array(
+                    _naive_utc(values), type=pyarrow.timestamp("us", tz="UTC")
+                )
+            else:
+                arrays[column] = pyarrow.array(values)
+        return pyarrow.table(arrays)
+
+
+def _getpath(obj: Any, path: Sequence[str]) -> Any:
+    """Look up dotted attribute path, returning None if it's missing."""
+    for name in path:
+        if obj is None:
+            return None
+        try:
+            obj = getattr(obj, name)
+        except AttributeError:
+            return None
+    return obj
+
+
+def _findchild(elem: ET.Element, cls: type, name: str) -> Tuple[Any, Any]:
+    """
+    Find the child of ``elem`` (a serialized ``cls`` instance) that holds
+    attribute ``name``, proxying through SubAggregates like
+    ``Aggregate.__getattr__()``.
+
+    Return (child ``ET.Element`` or None, class attribute that converts it).
+    Raise AttributeError if ``cls`` has no such attribute.
+    """
+    schema = cls._schema  # type: ignore
+    if name in schema.spec:
+        return elem.find(schema.tags[name]), schema.spec[name]
+
+    for attr, subaggregate in schema.subaggregates.items():
+        child = elem.find(schema.tags[attr])
+        if child is None:
+            continue
+        try:
+            return _findchild(child, subaggregate.__type__, name)
+        except AttributeError:
+            continue
+
+    raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+
+
+def _findpath(elem: ET.Element, cls: type, path: Sequence[str]) -> Any:
+    """ET analog of ``_getpath()``, type-converting the value found."""
+    *parents, leaf = path
+    try:
+        for name in parents:
+            elem, converter = _findchild(elem, cls, name)
+            if (
+                elem is None
+                or not isinstance(converter, SubAggregate)
+                or isinstance(converter, ListAggregate)
+            ):
+                return None
+            cls = converter.__type__
+        child, converter = _findchild(elem, cls, leaf)
+    except AttributeError:
+        return None
+
+    if child is None or isinstance(
+        converter, (ListAggregate, ListElement, Unsupported)
+    ):
+        return None
+    elif isinstance(converter, SubAggregate):
+        return Aggregate.from_etree(child)
+    return converter.convert(child.text)
+
+
+def _kind(values: List[Any]) -> Optional[type]:
+    """Type of the first value that isn't None."""
+    for value in values:
+        if value is not None:
+            return type(value)
+    return None
+
+
+def _numpy_column(numpy: Any, values: List[Any]) -> Any:
+    """Convert a column of values to a NumPy array of the appropriate dtype."""
+    kind = _kind(values)
+    missing = None in values
+    if kind is not None and issubclass(kind, datetime.datetime):
+        return numpy.array(_naive_utc(values), dtype="datetime64[us]")
+    if kind is not None and issubclass(kind, bool):
+        if not missing:
+            return numpy.array(values, dtype="bool")
+    elif kind is not None and issubclass(kind, int):
+        if not missing:
+            return numpy.array([int(value) for value in values], dtype="int64")
+        return _numpy_floats(numpy, values)
+    elif kind is not None and issubclass(kind, (decimal.Decimal, float)):
+        return _numpy_floats(numpy, values)
+
+    # Assign objects one at a time; NumPy would expand sequences (e.g. list
+    # Aggregates) passed to ``numpy.array()`` into extra dimensions.
+    array = numpy.empty(len(values), dtype="object")
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+def _numpy_floats(numpy: Any, values: List[Any]) -> Any:
+    return numpy.array(
+        [numpy.nan if value is None else float(value) for value in values],
+        dtype="float64",
+    )
+
+
+def _naive_utc(values: List[Any]) -> List[Any]:
+    """Convert timezone-aware datetimes to naive UTC, for NumPy/pyarrow."""
+    return [
+        None if value is None else value.astimezone(UTC).replace(tzinfo=None)
+        for value in values
+    ]
+
+
+class TranList(Aggregate, ColumnarList):
     """
     Base class for OFX *TRANLIST
 
@@ -1177,8 +1177,9 @@ def _scan_profile(
             f"max_workers={max_workers} timeout={timeout}"
         )
     )
-    client = OFXClient(url, org=org, fid=fid, useragent=useragent)
-    futures = _queue_scans(client, gen_newfileuid, max_workers, timeout)
+    # All scan requests go to the same host; share pooled connections among them.
+    with OFXClient(url, org=org, fid=fid, useragent=useragent) as client:
+        futures = _queue_scans(client, gen_newfileuid, max_workers, timeout)
 
     # The primary data we keep is actually the metadata (i.e. connection
     # parameters - OFX version; prettyprint; unclosedelements) tagged on
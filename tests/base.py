@@ -5,6 +5,7 @@
 import unittest
 import xml.etree.ElementTree as ET
 from copy import deepcopy
+from io import BytesIO
 import itertools
 from typing import List, Dict, Sequence, Any
 
@@ -156,6 +157,14 @@ class TestAggregate:
     def testToEtree(self):
         self._eqEtree(self.etree, self.aggregate.to_etree())
 
+    def testWrite(self):
+        output = BytesIO()
+        self.aggregate.write(output)
+        root = self.aggregate.to_etree()
+        self.assertEqual(
+            output.getvalue(), ET.tostring(root, encoding="utf_8", method="html")
+        )
+
     def testOneOf(self):
         for tag, choices in self.oneOfs.items():
             self.oneOfTest(tag, choices)
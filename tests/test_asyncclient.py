@@ -0,0 +1,410 @@
+# coding: utf-8
+""" Unit tests for ofxtools.AsyncClient """
+
+# stdlib imports
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock
+from datetime import datetime
+from pathlib import Path
+import tempfile
+from urllib.error import HTTPError
+
+
+# local imports
+from ofxtools.AsyncClient import AsyncOFXClient, AsyncHTTPTransport
+from ofxtools.Client import InvStmtRq, StmtRq, CcStmtRq
+from ofxtools.models.ofx import OFX
+from ofxtools.utils import UTC
+
+
+# test imports
+from test_client import PROFRS, PROFRS_URL
+
+
+class StandInServer:
+    """
+    Local asyncio HTTP/1.1 server standing in for an OFX server.
+
+    Replies to PROFRQ with a canned PROFRS pointing back at itself; echoes
+    anything else.  Records the requests it receives and the number of
+    connections opened / requests handled concurrently.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.connections = 0
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def start(self, port=0):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", port)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/ofx"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                requestline = await reader.readline()
+                if not requestline:
+                    break
+                method, path = requestline.decode().split()[:2]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    k, v = line.decode().split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((path, headers, body, method))
+
+                self.inflight += 1
+                self.max_inflight = max(self.max_inflight, self.inflight)
+                try:
+                    await self.respond(writer, path, body)
+                finally:
+                    self.inflight -= 1
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, path, body):
+        if path == "/slow":
+            await asyncio.sleep(1)
+        elif path.startswith("/busy"):
+            await asyncio.sleep(0.05)
+
+        if path == "/error":
+            writer.write(b"HTTP/1.1 500 Server Error\r\nContent-Length: 0\r\n\r\n")
+        elif path.startswith("/redirect"):
+            # "/redirect/<status>"; bare "/redirect" is a 307
+            status = path[len("/redirect/") :] or "307"
+            writer.write(
+                b"HTTP/1.1 %s Redirect\r\n"
+                b"Location: /ofx\r\nContent-Length: 0\r\n\r\n" % status.encode()
+            )
+        elif path == "/chunked":
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"3\r\nfoo\r\n3;ext=1\r\nbar\r\n0\r\n\r\n"
+            )
+        else:
+            if b"<PROFRQ>" in body:
+                body = PROFRS.replace(PROFRS_URL, self.url.encode())
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nSet-Cookie: session=DEADBEEF\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+        await writer.drain()
+
+
+class StandInServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StandInServer()
+        await self.server.start()
+        self.addAsyncCleanup(self.server.stop)
+
+
+class AsyncHTTPTransportTestCase(StandInServerTestCase):
+    async def testPost(self):
+        async with AsyncHTTPTransport() as transport:
+            response = await transport.post(self.server.url, b"foo", {"X-Foo": "1"})
+        self.assertEqual(response, b"foo")
+        path, headers, body, method = self.server.requests[0]
+        self.assertEqual(method, "POST")
+        self.assertEqual(path, "/ofx")
+        self.assertEqual(headers["x-foo"], "1")
+        self.assertEqual(body, b"foo")
+
+    async def testKeepAlive(self):
+        async with AsyncHTTPTransport() as transport:
+            for data in (b"foo", b"bar", b"baz"):
+                self.assertEqual(await transport.post(self.server.url, data, {}), data)
+        self.assertEqual(self.server.connections, 1)
+
+    async def testIdleTimeout(self):
+        async with AsyncHTTPTransport(idle_timeout=0) as transport:
+            await transport.post(self.server.url, b"foo", {})
+            await asyncio.sleep(0.01)
+            await transport.post(self.server.url, b"bar", {})
+        self.assertEqual(self.server.connections, 2)
+
+    async def testLimitPerHost(self):
+        url = self.server.url.replace("/ofx", "/busy")
+        async with AsyncHTTPTransport(limit_per_host=2) as transport:
+            responses = await asyncio.gather(
+                *[transport.post(url, b"%d" % i, {}) for i in range(6)]
+            )
+        self.assertEqual(responses, [b"%d" % i for i in range(6)])
+        self.assertEqual(self.server.max_inflight, 2)
+        self.assertEqual(self.server.connections, 2)
+
+    async def testTimeout(self):
+        url = self.server.url.replace("/ofx", "/slow")
+        async with AsyncHTTPTransport() as transport:
+            with self.assertRaises(asyncio.TimeoutError):
+                await transport.post(url, b"foo", {}, timeout=0.05)
+            self.assertEqual(transport._idle, {})
+
+    async def testStaleConnection(self):
+        async with AsyncHTTPTransport() as transport:
+            await transport.post(self.server.url, b"foo", {})
+            # Connection dropped behind our back
+            for conns in transport._idle.values():
+                for (_, writer), _ in conns:
+                    writer.transport.abort()
+            self.assertEqual(await transport.post(self.server.url, b"bar", {}), b"bar")
+        self.assertEqual(self.server.connections, 2)
+
+    async def testChunked(self):
+        url = self.server.url.replace("/ofx", "/chunked")
+        async with AsyncHTTPTransport() as transport:
+            self.assertEqual(await transport.post(url, b"", {}), b"foobar")
+
+    async def testRedirect(self):
+        url = self.server.url.replace("/ofx", "/redirect")
+        async with AsyncHTTPTransport() as transport:
+            self.assertEqual(await transport.post(url, b"foo", {}), b"foo")
+        self.assertEqual([rq[0] for rq in self.server.requests], ["/redirect", "/ofx"])
+
+    async def testRedirectMethod(self):
+        # Same as urlopen(): 301/302/303 are followed by a GET without body;
+        # 307/308 repeat the POST.
+        expected = {
+            301: ("GET", b""),
+            302: ("GET", b""),
+            303: ("GET", b""),
+            307: ("POST", b"foo"),
+            308: ("POST", b"foo"),
+        }
+        headers = {"Content-Type": "application/x-ofx"}
+        for status, (method, data) in expected.items():
+            with self.subTest(status=status):
+                url = self.server.url.replace("/ofx", "/redirect/%d" % status)
+                del self.server.requests[:]
+                async with AsyncHTTPTransport() as transport:
+                    self.assertEqual(await transport.post(url, b"foo", headers), data)
+                self.assertEqual(
+                    [(rq[3], rq[0], rq[2]) for rq in self.server.requests],
+                    [("POST", f"/redirect/{status}", b"foo"), (method, "/ofx", data)],
+                )
+                headers1 = self.server.requests[1][1]
+                self.assertEqual("content-type" in headers1, method == "POST")
+
+    async def testHTTPError(self):
+        url = self.server.url.replace("/ofx", "/error")
+        async with AsyncHTTPTransport() as transport:
+            with self.assertRaises(HTTPError) as cm:
+                await transport.post(url, b"foo", {})
+        self.assertEqual(cm.exception.code, 500)
+
+    async def testValidation(self):
+        with self.assertRaises(ValueError):
+            AsyncHTTPTransport(limit_per_host=0)
+        with self.assertRaises(ValueError):
+            AsyncHTTPTransport(pool_size=0)
+
+
+class AsyncHTTPTransportEventLoopTestCase(unittest.TestCase):
+    def testReuse(self):
+        # Same transport used under successive ``asyncio.run()`` calls
+        transport = AsyncHTTPTransport(limit_per_host=1)
+        port = 0
+
+        async def post():
+            nonlocal port
+            server = StandInServer()
+            await server.start(port)
+            port = server.server.sockets[0].getsockname()[1]
+            url = server.url.replace("/ofx", "/busy")
+            try:
+                # Contend for the per-host limit
+                return await asyncio.gather(
+                    *[transport.post(url, b"%d" % i, {}) for i in range(3)]
+                )
+            finally:
+                await transport.close()
+                await server.stop()
+
+        for _ in range(2):
+            self.assertEqual(asyncio.run(post()), [b"0", b"1", b"2"])
+
+
+class AsyncOFXClientTestCase(StandInServerTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = patch("ofxtools.config.DATADIR", new=Path(tmpdir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @property
+    def client(self):
+        return AsyncOFXClient(
+            self.server.url,
+            userid="elmerfudd",
+            org="FIORG",
+            fid="FID",
+            version=203,
+            brokerid="example.com",
+            limit_per_host=2,
+        )
+
+    @property
+    def invStmtRq(self):
+        return InvStmtRq(
+            acctid="111111",
+            dtstart=datetime(2017, 1, 1, tzinfo=UTC),
+            dtend=datetime(2017, 3, 31, tzinfo=UTC),
+        )
+
+    async def testRequestStatements(self):
+        async with self.client as client:
+            self.assertEqual(client.transport.limit_per_host, 2)
+            response = await client.request_statements("t0ps3kr1t", self.invStmtRq)
+
+        # PROFRQ to look up the service URL, then INVSTMTRQ; same connection
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.connections, 1)
+        self.assertIn(b"<PROFRQ>", self.server.requests[0][2])
+        self.assertIn(b"<INVSTMTRQ>", self.server.requests[1][2])
+        # Cookie set by PROFRS persisted
+        self.assertEqual(self.server.requests[1][1]["cookie"], "session=DEADBEEF")
+        # Stand-in server echoes requests
+        self.assertEqual(response.read(), self.server.requests[1][2])
+
+    async def testRequestStatementsProfileTTL(self):
+        client = self.client
+        client.profile_ttl = 3600
+        async with client:
+            await client.request_statements("t0ps3kr1t", self.invStmtRq)
+            await client.request_statements("t0ps3kr1t", self.invStmtRq)
+
+        # Fresh cached profile; second request skipped PROFRQ
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertIn(b"<PROFRQ>", self.server.requests[0][2])
+        self.assertIn(b"<INVSTMTRQ>", self.server.requests[2][2])
+
+    async def testDispatchStatements(self):
+        bankurl = self.server.url.replace("/ofx", "/busy/bank")
+        ccurl = self.server.url.replace("/ofx", "/busy/cc")
+        client = self.client
+        client.bankid = "123456789"
+        client._get_service_urls = AsyncMock(
+            return_value={StmtRq: bankurl, CcStmtRq: ccurl}
+        )
+        async with client:
+            responses = {
+                url: response
+                async for url, response in client.dispatch_statements(
+                    "t0ps3kr1t",
+                    StmtRq(acctid="111111", accttype="CHECKING"),
+                    CcStmtRq(acctid="222222"),
+                )
+            }
+
+        self.assertEqual(set(responses), {bankurl, ccurl})
+        # Stand-in server echoes requests
+        self.assertIn(b"<STMTRQ>", responses[bankurl].read())
+        self.assertIn(b"<CCSTMTRQ>", responses[ccurl].read())
+        # Requests to both service URLs were sent concurrently
+        self.assertEqual(self.server.max_inflight, 2)
+
+    async def testRequestStatementsSkipProfile(self):
+        async with self.client as client:
+            await client.request_statements(
+                "t0ps3kr1t", self.invStmtRq, skip_profile=True
+            )
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertIn(b"<INVSTMTRQ>", self.server.requests[0][2])
+
+    async def testRequestStatementsDryrun(self):
+        client = self.client
+        response = await client.request_statements(
+            "t0ps3kr1t", self.invStmtRq, dryrun=True
+        )
+        self.assertIn(b"<INVSTMTRQ>", response.read())
+        self.assertEqual(self.server.requests, [])
+
+    async def testRequestStatementsSharded(self):
+        url = self.server.url.replace("/ofx", "/busy")
+        client = self.client
+        client.url = url
+        async with client:
+            response = await client.request_statements(
+                "t0ps3kr1t",
+                self.invStmtRq,
+                skip_profile=True,
+                dryrun=True,
+                shard="30d",
+            )
+        self.assertEqual(response.read().count(b"<INVSTMTRQ>"), 3)
+
+        with patch.object(
+            AsyncOFXClient, "_merge_shards", side_effect=lambda rs, dryrun: rs
+        ):
+            async with client:
+                responses = await client.request_statements(
+                    "t0ps3kr1t",
+                    self.invStmtRq,
+                    skip_profile=True,
+                    shard="30d",
+                    max_parallel=2,
+                )
+        # Windows sent concurrently, no more than max_parallel at a time;
+        # responses in chronological order
+        self.assertEqual(len(responses), 3)
+        self.assertEqual(self.server.max_inflight, 2)
+        self.assertIn(b"<DTEND>20170331", responses[-1].read())
+
+    async def testRequestProfile(self):
+        async with self.client as client:
+            response = await client.request_profile()
+            ofx = await client.parse(response)
+        self.assertIsInstance(ofx, OFX)
+        self.assertEqual(ofx.profmsgsrsv1[0].profrs.msgsetlist[0].url, self.server.url)
+        self.assertTrue(client._profile_cache_path.exists())
+
+    async def testRequestAccounts(self):
+        async with self.client as client:
+            response = await client.request_accounts(
+                "t0ps3kr1t", datetime(2017, 1, 1, tzinfo=UTC), skip_profile=True
+            )
+        self.assertIn(b"<ACCTINFORQ>", response.read())
+
+    async def testRequestTax1099(self):
+        async with self.client as client:
+            response = await client.request_tax1099(
+                "t0ps3kr1t", "2017", skip_profile=True
+            )
+        self.assertIn(b"<TAX1099RQ>", response.read())
+
+    async def testConcurrentRequests(self):
+        async with self.client as client:
+            responses = await asyncio.gather(
+                *[
+                    client.request_statements(
+                        "t0ps3kr1t", self.invStmtRq, skip_profile=True
+                    )
+                    for i in range(5)
+                ]
+            )
+        self.assertEqual(len(responses), 5)
+        self.assertLessEqual(self.server.max_inflight, 2)
+
+    def testSyncContextManager(self):
+        with self.assertRaises(TypeError):
+            with self.client:
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
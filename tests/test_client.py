@@ -4,10 +4,20 @@
 # stdlib imports
 import unittest
 from unittest.mock import patch, DEFAULT, sentinel, Mock
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 import xml.etree.ElementTree as ET
 import socket
 from io import BytesIO
+import http.cookiejar
+import http.server
+import threading
+import time
+import concurrent.futures
+from urllib.error import HTTPError
+from pathlib import Path
+import tempfile
+import os
 
 
 # local imports
@@ -18,16 +28,77 @@ from ofxtools.Client import (
     InvStmtRq,
     StmtEndRq,
     CcStmtEndRq,
+    HTTPClientTransport,
+    RequestsTransport,
+    USE_REQUESTS,
+    parse_shard,
+    shard_requests,
+    merge_seclistmsgs,
+    merge_trnrs,
+    account_key,
 )
-from ofxtools.models.signon import SIGNONMSGSRQV1
+from ofxtools.models.signon import SIGNONMSGSRQV1, SIGNONMSGSRSV1
+from ofxtools.models.bank import (
+    BANKMSGSRSV1,
+    CREDITCARDMSGSRSV1,
+    CCSTMTTRNRS,
+    STMTTRNRS,
+    STMTRS,
+    BANKACCTFROM,
+    LEDGERBAL,
+    BANKTRANLIST,
+    STMTTRN,
+)
+from ofxtools.models.common import STATUS
+from ofxtools.models.invest import SECLISTMSGSRSV1, SECLIST, STOCKINFO, SECINFO, SECID
+from ofxtools.models.ofx import OFX
+from ofxtools.models.base import Aggregate
 from ofxtools.utils import UTC, indent, tostring_unclosed_elements
 from ofxtools.models.signon import SONRQ
+from ofxtools.Parser import OFXTree
+
+
+# test imports
+import test_models_signon
+import test_models_bank_stmt
 
 
 DEFAULT_APPID = "QWIN"
 DEFAULT_APPVER = "2700"
 
 
+def _profrs():
+    # Sample PROFRS has SIGNONMSGSRSV1 out of order; move it before PROFMSGSRSV1.
+    profrs = (Path(__file__).parent / "data" / "profrs.ofx").read_bytes()
+    head, profmsgs = profrs.split(b"<PROFMSGSRSV1>")
+    profmsgs, signonmsgs = profmsgs.split(b"</PROFMSGSRSV1>")
+    signonmsgs, tail = signonmsgs.split(b"</SIGNONMSGSRSV1>")
+    return b"".join(
+        [
+            head,
+            signonmsgs.strip(),
+            b"</SIGNONMSGSRSV1><PROFMSGSRSV1>",
+            profmsgs,
+            b"</PROFMSGSRSV1>",
+            tail,
+        ]
+    )
+
+
+PROFRS = _profrs()
+PROFRS_URL = b"https://ofxs.ameritrade.com/cgi-bin/apps/OFX"
+
+
+def _profrs_uptodate():
+    # PROFRS with STATUS code 1 - client has the latest version of the profile.
+    head, tail = PROFRS.split(b"<PROFRS>")
+    _, tail = tail.split(b"</PROFRS>")
+    return head.replace(b"<CODE>0</CODE>", b"<CODE>1</CODE>", 1) + tail
+
+
+PROFRS_UPTODATE = _profrs_uptodate()
+
+
 class OFXClientV1TestCase(unittest.TestCase):
     @property
     def client(self):
@@ -844,6 +915,733 @@ class OFXClientV2TestCase(unittest.TestCase):
             )
 
 
+class DispatchStatementsTestCase(unittest.TestCase):
+    """Statement requests for services the FI profile assigns to different URLs"""
+
+    bankurl = "https://example.com/bank"
+    ccurl = "https://example.com/cc"
+
+    @property
+    def client(self):
+        client = OFXClient(
+            "https://example.com/ofx",
+            userid="elmerfudd",
+            org="FIORG",
+            fid="FID",
+            version=203,
+            bankid="123456789",
+            brokerid="example.com",
+        )
+        # Mock out OFXClient._get_service_urls(), which hits the Internet.
+        client._get_service_urls = Mock(
+            return_value={
+                StmtRq: self.bankurl,
+                StmtEndRq: self.bankurl,
+                CcStmtRq: self.ccurl,
+            }
+        )
+        return client
+
+    @staticmethod
+    def response(**msgsets):
+        signon = SIGNONMSGSRSV1(sonrs=test_models_signon.SonrsTestCase.aggregate)
+        ofx = OFX(signonmsgsrsv1=signon, **msgsets)
+        return OFXClient("", version=203).serialize(ofx)
+
+    def post_request(self, url, serialized_request, timeout):
+        if url == self.bankurl:
+            self.assertIn(b"<STMTRQ>", serialized_request)
+            self.assertNotIn(b"<CCSTMTRQ>", serialized_request)
+            stmttrnrs = test_models_bank_stmt.StmttrnrsTestCase.aggregate
+            return self.response(bankmsgsrsv1=BANKMSGSRSV1(stmttrnrs))
+        self.assertEqual(url, self.ccurl)
+        self.assertIn(b"<CCSTMTRQ>", serialized_request)
+        self.assertNotIn(b"<STMTRQ>", serialized_request)
+        ccstmttrnrs = test_models_bank_stmt.CcstmttrnrsTestCase.aggregate
+        return self.response(creditcardmsgsrsv1=CREDITCARDMSGSRSV1(ccstmttrnrs))
+
+    @property
+    def requests(self):
+        return (
+            StmtRq(acctid="111111", accttype="CHECKING"),
+            CcStmtRq(acctid="222222"),
+        )
+
+    def testDispatchStatements(self):
+        with patch.object(OFXClient, "post_request", side_effect=self.post_request):
+            responses = dict(
+                self.client.dispatch_statements("t0ps3kr1t", *self.requests)
+            )
+        self.assertEqual(set(responses), {self.bankurl, self.ccurl})
+        for url, response in responses.items():
+            parser = OFXTree()
+            parser.parse(response)
+            ofx = parser.convert()
+            if url == self.bankurl:
+                self.assertIsNotNone(ofx.bankmsgsrsv1)
+                self.assertIsNone(ofx.creditcardmsgsrsv1)
+            else:
+                self.assertIsNone(ofx.bankmsgsrsv1)
+                self.assertIsNotNone(ofx.creditcardmsgsrsv1)
+
+    def testTransportCreatedOnce(self):
+        # Worker threads of dispatch_statements() share one connection pool
+        client = self.client
+        barrier = threading.Barrier(8)
+
+        def transport():
+            barrier.wait()
+            return client.transport
+
+        with patch("ofxtools.Client.USE_REQUESTS", False), patch(
+            "ofxtools.Client.HTTPClientTransport"
+        ) as mock_transport:
+            mock_transport.side_effect = lambda **kwargs: time.sleep(0.01) or Mock()
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                transports = list(executor.map(lambda _: transport(), range(8)))
+        mock_transport.assert_called_once()
+        self.assertTrue(all(t is transports[0] for t in transports))
+
+    def testRequestStatementsMerged(self):
+        with patch.object(OFXClient, "post_request", side_effect=self.post_request):
+            response = self.client.request_statements("t0ps3kr1t", *self.requests)
+        parser = OFXTree()
+        parser.parse(response)
+        ofx = parser.convert()
+        self.assertEqual(len(ofx.statements), 2)
+        stmtrs = ofx.bankmsgsrsv1[0].stmtrs
+        self.assertEqual(stmtrs.account.acctid, "123456789123456789")
+        self.assertIsInstance(ofx.creditcardmsgsrsv1[0], CCSTMTTRNRS)
+
+    def testRequestStatementsMergedCDATA(self):
+        # TreeBuilder keeps CDATA content verbatim; it must be written back
+        # as CDATA, not as markup.  N.B. one CDATA section per line, as
+        # TreeBuilder requires
+        def post_request(url, serialized_request, timeout):
+            response = self.post_request(url, serialized_request, timeout)
+            response = response.replace(
+                b"<NAME>Porky Pig</NAME>", b"<NAME><![CDATA[AT&T <b>]]></NAME>\n"
+            )
+            return response.replace(
+                b"<MEMO>Th-th-th-that's all folks!</MEMO>",
+                b"<MEMO><![CDATA[AT&amp;T]]></MEMO>\n",
+            )
+
+        with patch.object(OFXClient, "post_request", side_effect=post_request):
+            response = self.client.request_statements("t0ps3kr1t", *self.requests)
+        parser = OFXTree()
+        parser.parse(response)
+        ofx = parser.convert()
+        self.assertEqual(len(ofx.statements), 2)
+        for stmt in ofx.statements:
+            txn = stmt.transactions[0]
+            self.assertEqual(txn.name, "AT&T <b>")
+            self.assertEqual(txn.memo, "AT&T")
+
+    def testRequestStatementsSingleUrl(self):
+        # All requested services at one URL; response passed through as-is
+        with patch.object(
+            OFXClient, "post_request", return_value=b"Some OFX Response"
+        ) as mock_post:
+            response = self.client.request_statements(
+                "t0ps3kr1t",
+                StmtRq(acctid="111111", accttype="CHECKING"),
+                StmtEndRq(acctid="111111", accttype="CHECKING"),
+            )
+        self.assertEqual(response.read(), b"Some OFX Response")
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args[0][0], self.bankurl)
+
+    def testRequestStatementsUnlistedService(self):
+        # Services missing from the profile go to the client URL
+        with patch.object(
+            OFXClient, "post_request", return_value=b"Some OFX Response"
+        ) as mock_post:
+            self.client.request_statements("t0ps3kr1t", InvStmtRq(acctid="333333"))
+        self.assertEqual(mock_post.call_args[0][0], "https://example.com/ofx")
+
+
+class ShardStatementsTestCase(unittest.TestCase):
+    """Statement requests split into date range windows"""
+
+    dtstart = datetime(2017, 1, 1, tzinfo=UTC)
+    dtend = datetime(2017, 7, 1, tzinfo=UTC)
+
+    @property
+    def client(self):
+        return OFXClient(
+            "https://example.com/ofx",
+            userid="elmerfudd",
+            org="FIORG",
+            fid="FID",
+            version=203,
+            bankid="123456789",
+            brokerid="example.com",
+        )
+
+    def post_request(self, url, serialized_request, timeout):
+        # Each window returns a transaction posted at its start and one posted
+        # at its end (i.e. also returned by the following window), with the
+        # ledger balance as of its end.
+        parser = OFXTree()
+        parser.parse(BytesIO(serialized_request))
+        inctran = parser.convert().bankmsgsrqv1[0].stmtrq.inctran
+        start, end = inctran.dtstart, inctran.dtend
+        stmtrs = STMTRS(
+            curdef="USD",
+            bankacctfrom=BANKACCTFROM(
+                bankid="123456789", acctid="111111", accttype="CHECKING"
+            ),
+            ledgerbal=LEDGERBAL(balamt=Decimal(end.month), dtasof=end),
+            banktranlist=BANKTRANLIST(
+                *[
+                    STMTTRN(
+                        trntype="DEBIT",
+                        dtposted=dt,
+                        trnamt=Decimal("-1"),
+                        fitid=dt.strftime("%Y%m%d"),
+                    )
+                    for dt in (start, end)
+                ],
+                dtstart=start,
+                dtend=end,
+            ),
+        )
+        stmttrnrs = STMTTRNRS(
+            trnuid="DEADBEEF", status=STATUS(code=0, severity="INFO"), stmtrs=stmtrs
+        )
+        return DispatchStatementsTestCase.response(
+            bankmsgsrsv1=BANKMSGSRSV1(stmttrnrs)
+        )
+
+    @property
+    def stmtRq(self):
+        return StmtRq(
+            acctid="111111",
+            accttype="CHECKING",
+            dtstart=self.dtstart,
+            dtend=self.dtend,
+        )
+
+    def testParseShard(self):
+        self.assertEqual(parse_shard("90d"), timedelta(days=90))
+        self.assertEqual(parse_shard("12W"), timedelta(weeks=12))
+        self.assertEqual(parse_shard(timedelta(days=30)), timedelta(days=30))
+        for shard in ("90", "3m", "-1d", "0d", timedelta(0)):
+            with self.assertRaises(ValueError):
+                parse_shard(shard)
+
+    def testShardRequests(self):
+        stmtendrq = StmtEndRq(acctid="111111", accttype="CHECKING")
+        windows = shard_requests(
+            [self.stmtRq, stmtendrq], timedelta(days=90), self.dtend
+        )
+        self.assertEqual(
+            list(windows),
+            [
+                None,
+                (self.dtstart, datetime(2017, 4, 1, tzinfo=UTC)),
+                (datetime(2017, 4, 1, tzinfo=UTC), datetime(2017, 6, 30, tzinfo=UTC)),
+                (datetime(2017, 6, 30, tzinfo=UTC), self.dtend),
+            ],
+        )
+        self.assertEqual(windows[None], [stmtendrq])
+        for (start, end), rqs in list(windows.items())[1:]:
+            self.assertEqual(rqs, [self.stmtRq._replace(dtstart=start, dtend=end)])
+
+    def testShardRequestsOpenEnded(self):
+        # No DTEND; last window ends now.  No DTSTART; not split.
+        now = datetime(2017, 2, 15, tzinfo=UTC)
+        rq = self.stmtRq._replace(dtend=None)
+        unbounded = self.stmtRq._replace(dtstart=None)
+        windows = shard_requests([rq, unbounded], timedelta(days=31), now)
+        self.assertEqual(windows[None], [unbounded])
+        self.assertEqual(list(windows)[-1], (datetime(2017, 2, 1, tzinfo=UTC), now))
+
+    def testShardRequestsInvestment(self):
+        # Only the latest window requests positions, balances & open orders
+        invstmtrq = InvStmtRq(acctid="333333", dtstart=self.dtstart, dtend=self.dtend)
+        windows = shard_requests([invstmtrq], timedelta(weeks=12), self.dtend)
+        rqs = [rq for rqs in windows.values() for rq in rqs]
+        self.assertEqual(len(rqs), 3)
+        for rq in rqs[:-1]:
+            self.assertEqual((rq.incpos, rq.incbal, rq.incoo), (False, False, False))
+        self.assertEqual((rqs[-1].incpos, rqs[-1].incbal), (True, True))
+
+    def testRequestStatementsSharded(self):
+        with patch.object(
+            OFXClient, "post_request", side_effect=self.post_request
+        ) as mock_post:
+            response = self.client.request_statements(
+                "t0ps3kr1t",
+                self.stmtRq,
+                skip_profile=True,
+                shard="60d",
+                max_parallel=2,
+            )
+        self.assertEqual(mock_post.call_count, 4)
+
+        parser = OFXTree()
+        parser.parse(response)
+        ofx = parser.convert()
+        # Merged into a single statement
+        self.assertEqual(len(ofx.statements), 1)
+        stmt = ofx.statements[0]
+        # Transactions from all windows, deduplicated by FITID
+        self.assertEqual(
+            [txn.fitid for txn in stmt.transactions],
+            ["20170101", "20170302", "20170501", "20170630", "20170701"],
+        )
+        self.assertEqual(stmt.transactions.dtstart, self.dtstart)
+        self.assertEqual(stmt.transactions.dtend, self.dtend)
+        # Balance from the latest window
+        self.assertEqual(stmt.balance.balamt, Decimal("7"))
+        self.assertEqual(stmt.balance.dtasof, self.dtend)
+
+    def testRequestStatementsShardedCDATA(self):
+        # CDATA values in every window survive the merge
+        def post_request(url, serialized_request, timeout):
+            response = self.post_request(url, serialized_request, timeout)
+            return response.replace(
+                b"</STMTTRN>", b"<MEMO><![CDATA[AT&T <b>]]></MEMO>\n</STMTTRN>"
+            )
+
+        with patch.object(OFXClient, "post_request", side_effect=post_request):
+            response = self.client.request_statements(
+                "t0ps3kr1t", self.stmtRq, skip_profile=True, shard="60d"
+            )
+
+        parser = OFXTree()
+        parser.parse(response)
+        ofx = parser.convert()
+        transactions = ofx.statements[0].transactions
+        self.assertEqual(len(transactions), 5)
+        self.assertEqual([txn.memo for txn in transactions], ["AT&T <b>"] * 5)
+
+    def testRequestStatementsShardedDryrun(self):
+        response = self.client.request_statements(
+            "t0ps3kr1t", self.stmtRq, dryrun=True, shard="90d"
+        )
+        self.assertEqual(response.read().count(b"<STMTRQ>"), 3)
+
+    def testAccountKey(self):
+        acct = BANKACCTFROM(bankid="123456789", acctid="111111", accttype="CHECKING")
+        self.assertEqual(
+            account_key(acct.to_etree()),
+            ("BANKACCTFROM", "123456789", None, "111111", "CHECKING"),
+        )
+
+    def testMergeTrnrsByAccount(self):
+        def stmttrnrs(acctid, fitid):
+            return STMTTRNRS(
+                trnuid="DEADBEEF",
+                status=STATUS(code=0, severity="INFO"),
+                stmtrs=STMTRS(
+                    curdef="USD",
+                    bankacctfrom=BANKACCTFROM(
+                        bankid="123456789", acctid=acctid, accttype="CHECKING"
+                    ),
+                    ledgerbal=LEDGERBAL(balamt=Decimal("1"), dtasof=self.dtend),
+                    banktranlist=BANKTRANLIST(
+                        STMTTRN(
+                            trntype="DEBIT",
+                            dtposted=self.dtstart,
+                            trnamt=Decimal("-1"),
+                            fitid=fitid,
+                        ),
+                        dtstart=self.dtstart,
+                        dtend=self.dtend,
+                    ),
+                ),
+            )
+
+        merged = merge_trnrs(
+            [
+                stmttrnrs("111111", "1").to_etree(),
+                stmttrnrs("222222", "2").to_etree(),
+                stmttrnrs("111111", "3").to_etree(),
+            ]
+        )
+        merged = [Aggregate.from_etree(trnrs) for trnrs in merged]
+        acctids = [trnrs.stmtrs.acctid for trnrs in merged]
+        self.assertEqual(acctids, ["111111", "222222"])
+        fitids = [[txn.fitid for txn in trnrs.stmtrs.banktranlist] for trnrs in merged]
+        self.assertEqual(fitids, [["1", "3"], ["2"]])
+
+    def testRequestStatementsShardedPassthrough(self):
+        # Merged as parsed, so proprietary tags & values are kept as sent
+        def post_request(url, serialized_request, timeout):
+            response = self.post_request(url, serialized_request, timeout)
+            response = response.replace(
+                b"<TRNAMT>-1</TRNAMT>", b"<TRNAMT>-1.000</TRNAMT>"
+            )
+            return response.replace(
+                b"</STMTTRN>",
+                b"<MEMO>AT&amp;T</MEMO><X.PROPRIETARY>foo</X.PROPRIETARY></STMTTRN>",
+            )
+
+        with patch.object(OFXClient, "post_request", side_effect=post_request):
+            response = self.client.request_statements(
+                "t0ps3kr1t", self.stmtRq, skip_profile=True, shard="60d"
+            ).read()
+        self.assertEqual(response.count(b"<TRNAMT>-1.000</TRNAMT>"), 5)
+        self.assertEqual(response.count(b"<X.PROPRIETARY>foo</X.PROPRIETARY>"), 5)
+
+        parser = OFXTree()
+        parser.parse(BytesIO(response))
+        ofx = parser.convert()
+        txn = ofx.statements[0].transactions[0]
+        self.assertEqual(txn.memo, "AT&T")
+        self.assertEqual(str(txn.trnamt), "-1.000")
+
+    def testMergeSeclistmsgs(self):
+        def seclistmsgs(*tickers):
+            return SECLISTMSGSRSV1(
+                SECLIST(
+                    *[
+                        STOCKINFO(
+                            secinfo=SECINFO(
+                                secid=SECID(uniqueid=cusip, uniqueidtype="CUSIP"),
+                                secname=name,
+                            )
+                        )
+                        for cusip, name in tickers
+                    ]
+                )
+            ).to_etree()
+
+        merged = merge_seclistmsgs(
+            [
+                seclistmsgs(("084670108", "Berkshire"), ("123456789", "Old Name")),
+                seclistmsgs(("123456789", "New Name")),
+            ]
+        )
+        merged = Aggregate.from_etree(merged)
+        self.assertEqual(
+            [(sec.uniqueid, sec.secname) for sec in merged.securities],
+            [("084670108", "Berkshire"), ("123456789", "New Name")],
+        )
+
+
+class ProfileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = patch("ofxtools.config.DATADIR", new=Path(tmpdir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Mock out OFXClient._request_profile(), which hits the Internet.
+        # Serve the full PROFRS if the client doesn't have it, else tell the
+        # client it's up to date.
+        def request_profile(dtprofup=None, **kwargs):
+            if dtprofup is None:
+                return BytesIO(PROFRS)
+            return BytesIO(PROFRS_UPTODATE)
+
+        patcher = patch.object(
+            OFXClient, "_request_profile", side_effect=request_profile
+        )
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def client(self, **kwargs):
+        return OFXClient("https://example.com/ofx", org="FIORG", fid="FID", **kwargs)
+
+    def testRequestProfile(self):
+        client = self.client()
+        self.assertEqual(client.request_profile().read(), PROFRS)
+        self.assertTrue(client._profile_cache_path.exists())
+        self.assertIsNone(self.mock_request.call_args[1]["dtprofup"])
+
+        # No profile_ttl - check with the server whether cached PROFRS is current
+        self.assertEqual(client.request_profile().read(), PROFRS)
+        self.assertEqual(self.mock_request.call_count, 2)
+        self.assertEqual(
+            self.mock_request.call_args[1]["dtprofup"],
+            datetime(2004, 7, 31, 12, tzinfo=UTC),
+        )
+
+    def testProfileTTL(self):
+        client = self.client(profile_ttl=3600)
+        self.assertEqual(client.request_profile().read(), PROFRS)
+        self.assertEqual(client.request_profile().read(), PROFRS)
+        self.assertEqual(self.mock_request.call_count, 1)
+
+        # Cache is shared by clients for the same FI
+        self.assertEqual(self.client(profile_ttl=3600).request_profile().read(), PROFRS)
+        self.assertEqual(self.mock_request.call_count, 1)
+
+        # Profile probes (e.g. ofxget scan) and dry runs always skip the cache
+        client.request_profile(version=102)
+        self.assertEqual(self.mock_request.call_count, 2)
+        client.request_profile(dryrun=True)
+        self.assertEqual(self.mock_request.call_count, 3)
+
+    def testProfileTTLExpired(self):
+        client = self.client(profile_ttl=3600)
+        client.request_profile()
+        # Age the cached PROFRS beyond the TTL
+        path = client._profile_cache_path
+        checked = time.time() - 7200
+        os.utime(path, (checked, checked))
+
+        self.assertEqual(client.request_profile().read(), PROFRS)
+        self.assertEqual(self.mock_request.call_count, 2)
+        # Server confirmed the cached PROFRS is current; TTL restarts
+        self.assertGreater(path.stat().st_mtime, checked)
+        client.request_profile()
+        self.assertEqual(self.mock_request.call_count, 2)
+
+    def testServiceUrls(self):
+        client = self.client(profile_ttl=3600)
+        with patch.object(
+            OFXClient, "_parse_service_urls", wraps=OFXClient._parse_service_urls
+        ) as mock_parse:
+            urls = client._get_service_urls()
+            self.assertEqual(urls, {InvStmtRq: PROFRS_URL.decode()})
+            self.assertEqual(client._get_service_urls(), urls)
+            self.assertEqual(self.client()._get_service_urls(), urls)
+
+        # Only the client without a TTL went back to the server
+        self.assertEqual(self.mock_request.call_count, 2)
+        # PROFRS was only parsed once
+        self.assertEqual(mock_parse.call_count, 1)
+
+    def testRequestStatementsSkipsProfrq(self):
+        client = self.client(profile_ttl=3600, brokerid="example.com")
+        client.request_profile()
+        with patch.object(OFXClient, "download") as mock_download:
+            client.request_statements("t0ps3kr1t", InvStmtRq(acctid="111111"))
+        self.assertEqual(self.mock_request.call_count, 1)
+        self.assertEqual(mock_download.call_args[1]["url"], PROFRS_URL.decode())
+
+
+class OFXHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Echo POSTed data back, tagged with the client port (i.e. connection).
+    Requests are logged to ``server.requests`` as (method, path, data).
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append((self.command, self.path, data))  # type: ignore
+        if self.path.startswith("/redirect"):
+            # "/redirect/<status>"; bare "/redirect" is a 307
+            status = self.path[len("/redirect/") :] or "307"
+            self.send_response(int(status))
+            self.send_header("Location", "/ofx")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/error":
+            self.send_error(500)
+            return
+
+        body = b"%d:%s:%s" % (
+            self.client_address[1],
+            self.headers.get("Cookie", "").encode(),
+            data,
+        )
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=DEADBEEF")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTPClientTransportTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), OFXHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []  # type: ignore
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:{}/ofx".format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        # Don't route requests to the test server through an environment proxy.
+        patcher = patch.object(HTTPClientTransport, "_proxy", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, transport, url=None, data=b"data"):
+        response = transport.post(url or self.url, data, {}, timeout=5)
+        port, cookie, body = response.split(b":", 2)
+        return port, cookie, body
+
+    def testKeepAlive(self):
+        with HTTPClientTransport() as transport:
+            port0, _, body0 = self.post(transport, data=b"foo")
+            port1, _, body1 = self.post(transport, data=b"bar")
+        self.assertEqual(body0, b"foo")
+        self.assertEqual(body1, b"bar")
+        # Both requests went over the same connection
+        self.assertEqual(port0, port1)
+
+    def testIdleTimeout(self):
+        with HTTPClientTransport(idle_timeout=0) as transport:
+            port0, _, _ = self.post(transport)
+            time.sleep(0.01)
+            port1, _, _ = self.post(transport)
+        self.assertNotEqual(port0, port1)
+
+    def testClose(self):
+        transport = HTTPClientTransport()
+        port0, _, _ = self.post(transport)
+        transport.close()
+        port1, _, _ = self.post(transport)
+        transport.close()
+        self.assertNotEqual(port0, port1)
+
+    def testPoolSize(self):
+        with self.assertRaises(ValueError):
+            HTTPClientTransport(pool_size=0)
+
+    def testStaleConnection(self):
+        with HTTPClientTransport() as transport:
+            port0, _, _ = self.post(transport)
+            # Server drops the keep-alive connection behind our back
+            for conns in transport._idle.values():
+                for conn, _ in conns:
+                    conn.sock.shutdown(socket.SHUT_RDWR)
+            port1, _, body = self.post(transport)
+        self.assertNotEqual(port0, port1)
+        self.assertEqual(body, b"data")
+
+    def testCookies(self):
+        with HTTPClientTransport(cookiejar=http.cookiejar.CookieJar()) as transport:
+            _, cookie0, _ = self.post(transport)
+            _, cookie1, _ = self.post(transport)
+        self.assertEqual(cookie0, b"")
+        self.assertEqual(cookie1, b"session=DEADBEEF")
+
+        with HTTPClientTransport() as transport:
+            self.post(transport)
+            _, cookie, _ = self.post(transport)
+        self.assertEqual(cookie, b"")
+
+    def testRedirect(self):
+        url = self.url.replace("/ofx", "/redirect")
+        with HTTPClientTransport() as transport:
+            _, _, body = self.post(transport, url=url)
+        self.assertEqual(body, b"data")
+
+    def testRedirectMethod(self):
+        # Same as urlopen(): 301/302/303 are followed by a GET without body;
+        # 307/308 repeat the POST.
+        expected = {
+            301: ("GET", b""),
+            302: ("GET", b""),
+            303: ("GET", b""),
+            307: ("POST", b"data"),
+            308: ("POST", b"data"),
+        }
+        headers = {"Content-Type": "application/x-ofx", "Content-Length": "4"}
+        for status, (method, data) in expected.items():
+            with self.subTest(status=status):
+                url = self.url.replace("/ofx", "/redirect/%d" % status)
+                del self.server.requests[:]
+                with HTTPClientTransport() as transport:
+                    response = transport.post(url, b"data", headers, timeout=5)
+                _, _, body = response.split(b":", 2)
+                self.assertEqual(body, data)
+                self.assertEqual(
+                    self.server.requests,
+                    [
+                        ("POST", "/redirect/%d" % status, b"data"),
+                        (method, "/ofx", data),
+                    ],
+                )
+
+    def testHTTPError(self):
+        url = self.url.replace("/ofx", "/error")
+        with HTTPClientTransport() as transport:
+            with self.assertRaises(HTTPError) as cm:
+                transport.post(url, b"data", {}, timeout=5)
+        self.assertEqual(cm.exception.code, 500)
+
+    def testOFXClient(self):
+        with patch("ofxtools.Client.USE_REQUESTS", new=False):
+            with OFXClient(self.url, pool_size=2, idle_timeout=30) as client:
+                transport = client.transport
+                self.assertIsInstance(transport, HTTPClientTransport)
+                self.assertEqual(transport.pool_size, 2)
+                self.assertEqual(transport.idle_timeout, 30)
+                self.assertIs(transport.cookiejar, client.cookiejar)
+                port0, _, _ = client.post_request(self.url, b"foo", None).split(b":", 2)
+                port1, _, _ = client.post_request(self.url, b"bar", None).split(b":", 2)
+                self.assertEqual(port0, port1)
+            self.assertEqual(transport._idle, {})
+
+    def testOFXClientTransport(self):
+        transport = Mock()
+        with OFXClient(self.url, transport=transport) as client:
+            self.assertIs(client.transport, transport)
+        transport.close.assert_called_once_with()
+
+
+@unittest.skipUnless(USE_REQUESTS, "requires requests")
+class RequestsTransportTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), OFXHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []  # type: ignore
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:{}/ofx".format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def post(self, transport, data=b"data"):
+        response = transport.post(self.url, data, {}, timeout=5)
+        port, cookie, body = response.split(b":", 2)
+        return port, cookie, body
+
+    def testCookies(self):
+        with RequestsTransport(cookiejar=http.cookiejar.CookieJar()) as transport:
+            _, cookie0, _ = self.post(transport)
+            _, cookie1, _ = self.post(transport)
+        self.assertEqual(cookie0, b"")
+        self.assertEqual(cookie1, b"session=DEADBEEF")
+
+    def testNoCookies(self):
+        with RequestsTransport() as transport:
+            self.post(transport)
+            # Cookies are refused, not stored and cleared afterward
+            self.assertEqual(len(transport.session.cookies), 0)
+            _, cookie, _ = self.post(transport)
+        self.assertEqual(cookie, b"")
+
+    def testThreads(self):
+        def post(data):
+            _, cookie, body = self.post(transport, data)
+            return cookie, body
+
+        data = [str(n).encode() for n in range(32)]
+        with RequestsTransport(pool_size=4) as transport:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(post, data))
+        self.assertEqual(results, [(b"", d) for d in data])
+
+
 class UtilitiesTestCase(unittest.TestCase):
     @property
     def root(self):
@@ -159,6 +159,41 @@ class OFXHeaderV1TestCase(unittest.TestCase, OFXHeaderTestMixin):
 
         self.assertEqual(body, self.body)
 
+    def testReadHeader(self):
+        # read_header() consumes the header, leaving the stream at the body
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = BytesIO((header + self.body).encode("utf8"))
+        ofxheader = ofxtools.header.read_header(ofx)
+
+        self.assertEqual(ofxheader.ofxheader, 100)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(ofx.read().decode("utf8").strip(), self.body.strip())
+
+    def testParseBytes(self):
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = (header + self.body).encode("utf8")
+        ofxheader, body = ofxtools.header.parse_bytes(ofx)
+
+        self.assertEqual(str(ofxheader), header)
+        self.assertEqual(body, self.body.strip())
+
+    def testParseBytesHeaderExceedsWindow(self):
+        # Header that doesn't fit in the search window is found anyway
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = bytearray(("\r\n" * 7 + header + self.body * 100).encode("utf8"))
+        windowsize = len(header) // 4
+        with patch("ofxtools.header.HEADER_WINDOWSIZE", windowsize), patch(
+            "ofxtools.header.BytesIO", wraps=BytesIO
+        ) as mock_bytesio:
+            ofxheader, body = ofxtools.header.parse_bytes(ofx)
+
+        self.assertEqual(str(ofxheader), header)
+        self.assertEqual(body, (self.body * 100).strip())
+        # The window grows until the header fits; the buffer isn't copied whole
+        windows = [len(c.args[0]) for c in mock_bytesio.call_args_list]
+        self.assertEqual(windows, [windowsize * 2**n for n in range(len(windows))])
+        self.assertLess(windows[-1], len(ofx) // 2)
+
     def testParseHeaderLatin1(self):
         """Test parse_header() with ISO-8859-1 charset"""
         header = str(
@@ -518,6 +553,53 @@ class OFXHeaderV2TestCase(unittest.TestCase, OFXHeaderTestMixin):
 
         self.assertEqual(body, self.body)
 
+    def testReadHeader(self):
+        # read_header() consumes the header, leaving the stream at the body
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = BytesIO((header + self.body).encode("utf8"))
+        ofxheader = ofxtools.header.read_header(ofx)
+
+        self.assertEqual(ofxheader.ofxheader, 200)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(ofx.read().decode("utf8"), self.body)
+
+    def testReadHeaderMultibyte(self):
+        # Stream position is counted in bytes, not decoded characters
+        header = str(self.headerClass(self.defaultVersion))
+        body = self.body.replace("<OFX>", "<OFX><!-- é -->" * 200)
+        ofx = BytesIO((header + body).encode("utf8"))
+        ofxtools.header.read_header(ofx)
+
+        self.assertEqual(ofx.read().decode("utf8"), body)
+
+    def testParseBytes(self):
+        header = str(self.headerClass(self.defaultVersion))
+        body = self.body.replace("<OFX>", "<OFX><!-- é -->")
+        ofx = memoryview((header + body).encode("utf8"))
+        ofxheader, message = ofxtools.header.parse_bytes(ofx)
+
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(message, body)
+
+    def testReadHeaderMissingOFXDeclaration(self):
+        # XML declaration without OFX declaration; don't read the whole file
+        ofx = BytesIO(
+            b'<?xml version="1.0" encoding="UTF-8"?>\r\n'
+            + self.body.encode("utf8") * 10000
+        )
+        with self.assertRaises(ofxtools.header.OFXHeaderError):
+            ofxtools.header.read_header(ofx)
+        self.assertLessEqual(ofx.tell(), ofxtools.header.HEADER_MAXSIZE)
+
+        with self.assertRaises(ofxtools.header.OFXHeaderError):
+            ofxtools.header.parse_bytes(ofx.getvalue())
+
+    def testReadHeaderMalformedOFXDeclaration(self):
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = BytesIO((header.replace("SECURITY", "SECRECY") + self.body).encode())
+        with self.assertRaises(ofxtools.header.OFXHeaderError):
+            ofxtools.header.read_header(ofx)
+
     def testParseHeaderSingleQuotedDeclarationData(self):
         # The XML spec allows data to be quoted within either single or double quotes
         # Make sure that single-quoted data in the XML declaration is captured by
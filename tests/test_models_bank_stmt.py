@@ -4,6 +4,9 @@ Unit tests for models.bank.stmt
 """
 # stdlib imports
 import unittest
+from unittest.mock import patch
+import importlib.util
+import sys
 from xml.etree.ElementTree import Element, SubElement
 from datetime import datetime
 from decimal import Decimal
@@ -545,6 +548,52 @@ class BanktranlistTestCase(unittest.TestCase, base.TranlistTestCase):
                 root.append(StmttrnTestCase.etree)
                 yield root
 
+    def testToColumns(self):
+        columns = self.aggregate.to_columns(["fitid", "trnamt", "currency.cursym"])
+        self.assertEqual(
+            columns,
+            {
+                "fitid": ["DEADBEEF", "DEADBEEF"],
+                "trnamt": [Decimal("-433.25"), Decimal("-433.25")],
+                "currency.cursym": ["EUR", "EUR"],
+            },
+        )
+
+        columns = self.aggregate.to_columns()
+        self.assertEqual(list(columns), BANKTRANLIST.defaultColumns)
+        self.assertEqual(columns["dtposted"], [datetime(2013, 6, 15, tzinfo=UTC)] * 2)
+
+        # Missing attributes are None
+        columns = self.aggregate.to_columns(["payee.name", "bogus", "fitid.bogus"])
+        self.assertEqual(
+            columns,
+            {"payee.name": [None] * 2, "bogus": [None] * 2, "fitid.bogus": [None] * 2},
+        )
+
+    def testColumnsFromEtree(self):
+        root = self.etree
+        for columns in (None, ["currency", "payee.name", "bogus", "fitid.bogus"]):
+            self.assertEqual(
+                BANKTRANLIST.columns_from_etree(root, columns),
+                self.aggregate.to_columns(columns),
+            )
+
+    def testToNumpyArrowMissing(self):
+        with patch.dict(sys.modules, {"numpy": None, "pyarrow": None}):
+            with self.assertRaises(ImportError):
+                self.aggregate.to_numpy()
+            with self.assertRaises(ImportError):
+                self.aggregate.to_arrow()
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def testToNumpy(self):
+        array = self.aggregate.to_numpy(["dtposted", "trnamt", "sic", "fitid"])
+        self.assertEqual(len(array), 2)
+        self.assertEqual(str(array["dtposted"][0]), "2013-06-15T00:00:00.000000")
+        self.assertEqual(array["trnamt"].sum(), -866.5)
+        self.assertEqual(array["sic"].dtype.name, "int64")
+        self.assertEqual(list(array["fitid"]), ["DEADBEEF", "DEADBEEF"])
+
 
 class LedgerbalTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
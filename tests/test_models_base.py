@@ -2,6 +2,9 @@
 """ Unit tests for models/base.py """
 # stdlib imports
 import unittest
+import copy
+import pickle
+from io import BytesIO
 import xml.etree.ElementTree as ET
 
 
@@ -47,6 +50,19 @@ class TESTAGGREGATE2(Aggregate):
     metadata = String(32, required=True)
 
 
+class TESTALIASES(Aggregate):
+    frm = String(32)
+    testsubaggregate = SubAggregate(TESTSUBAGGREGATE)
+
+    tagAliases = {"FROM": "FRM", "SUBAGG": "TESTSUBAGGREGATE"}
+
+
+class TESTCOMPACT(TESTAGGREGATE2, compact=True):
+    flag = Bool()
+    testsubaggregate = SubAggregate(TESTSUBAGGREGATE)
+    dontuse = Unsupported()
+
+
 class TESTLIST(Aggregate):
     metadata = String(32)
     testaggregate = ListAggregate(TESTAGGREGATE)
@@ -158,6 +174,30 @@ class AggregateTestCase(unittest.TestCase):
         self.assertEqual(instance.testsubaggregate.data, "data")
         self.assertIsNone(instance.dontuse)
 
+    def testFromEtreeLazy(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        sub = ET.SubElement(root, "TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "data" * 10
+
+        # SubAggregate is converted (& validated) when first read
+        with Types.lazy_conversion():
+            instance = Aggregate.from_etree(root)
+        self.assertIsInstance(instance.__dict__["testsubaggregate"], Types.Deferred)
+        with self.assertRaises(Types.OFXSpecError):
+            instance.testsubaggregate
+
+        sub[0].text = "data"
+        for copied in (pickle.loads(pickle.dumps(instance)), copy.deepcopy(instance)):
+            self.assertEqual(copied.testsubaggregate.data, "data")
+        subagg = instance.testsubaggregate
+        self.assertIsInstance(subagg, TESTSUBAGGREGATE)
+        self.assertEqual(subagg.data, "data")
+        self.assertIs(instance.__dict__["testsubaggregate"], subagg)
+        self.assertEqual(instance.data, "data")
+
     def testFromEtreeMissingRequired(self):
         root = ET.Element("TESTAGGREGATE")
         ET.SubElement(root, "REQ00").text = "Y"
@@ -170,6 +210,48 @@ class AggregateTestCase(unittest.TestCase):
         with self.assertRaises(Types.OFXSpecError):
             Aggregate.from_etree(root)
 
+    def testFromEtreeNoValidation(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ01").text = "N"
+        sub = ET.Element("TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "data" * 10
+        root.append(sub)
+
+        with Types.validation(False):
+            instance = Aggregate.from_etree(root)
+        self.assertIsNone(instance.metadata)
+        self.assertEqual(instance.req00, True)
+        self.assertEqual(instance.req01, False)
+        self.assertEqual(instance.testsubaggregate.data, "data" * 10)
+
+        # Checks are performed on demand
+        with self.assertRaises(Types.OFXSpecError):
+            instance.validate()
+        instance.metadata = "metadata"
+        with self.assertRaises(Types.OFXSpecError):
+            instance.validate()
+        instance.testsubaggregate.data = "data"
+        with self.assertRaises(OFXSpecError):
+            instance.validate()
+        instance.req01 = None
+        instance.req11 = False
+        instance.validate()
+
+    def testFromEtreeNoValidationWrongOrder(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ11").text = "N"
+
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(root)
+        with Types.validation(False):
+            instance = Aggregate.from_etree(root)
+        self.assertEqual(instance.metadata, "metadata")
+        with self.assertRaises(OFXSpecError):
+            instance.validate()
+
     def testFromEtreeMissingUnrequired(self):
         root = ET.Element("TESTAGGREGATE")
         ET.SubElement(root, "METADATA").text = "metadata"
@@ -300,10 +382,109 @@ class AggregateTestCase(unittest.TestCase):
             Aggregate.from_etree(None)
 
     def testGroom(self):
-        pass
+        # Extended tags are skipped, without modifying the input
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "INTU.BID").text = "12345"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        intu = ET.SubElement(root, "INTU.USERID")
+        ET.SubElement(intu, "FOO").text = "bar"
+        markup = ET.tostring(root)
+
+        instance = Aggregate.from_etree(root)
+        self.assertEqual(instance.metadata, "metadata")
+        self.assertEqual(instance.req00, True)
+        self.assertEqual(instance.req11, False)
+        self.assertEqual(ET.tostring(root), markup)
+
+    def testTagAliases(self):
+        # Aliased tags are renamed, without modifying the input
+        root = ET.Element("TESTALIASES")
+        ET.SubElement(root, "FROM").text = "Joe"
+        sub = ET.SubElement(root, "SUBAGG")
+        ET.SubElement(sub, "DATA").text = "data"
+        markup = ET.tostring(root)
+
+        instance = TESTALIASES._convert(root)
+        self.assertEqual(instance.frm, "Joe")
+        self.assertEqual(instance.testsubaggregate.data, "data")
+        self.assertEqual(ET.tostring(root), markup)
+
+    def testWrite(self):
+        instance = self.instance_with_subagg
+        instance.metadata = "foo & <bar>"
+
+        output = BytesIO()
+        instance.write(output)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTAGGREGATE><METADATA>foo &amp; &lt;bar&gt;</METADATA>"
+            "<REQ00>Y</REQ00><REQ11>N</REQ11>"
+            "<TESTSUBAGGREGATE><DATA>bar</DATA></TESTSUBAGGREGATE>"
+            "</TESTAGGREGATE>",
+        )
+
+        output = BytesIO()
+        instance.write(output, prettyprint=True, close_elements=False)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTAGGREGATE>\n"
+            "  <METADATA>foo &amp; &lt;bar&gt;\n"
+            "  <REQ00>Y\n"
+            "  <REQ11>N\n"
+            "  <TESTSUBAGGREGATE>\n"
+            "    <DATA>bar\n"
+            "  </TESTSUBAGGREGATE>\n"
+            "</TESTAGGREGATE>\n",
+        )
+
+        # OFXv2 requires closing tags
+        with self.assertRaises(ValueError):
+            instance.write(BytesIO(), version=203, close_elements=False)
+
+    def testWriteEmpty(self):
+        # Empty aggregates are always closed
+        output = BytesIO()
+        TESTLIST().write(output, close_elements=False)
+        self.assertEqual(output.getvalue(), b"<TESTLIST></TESTLIST>")
+
+    def testWriteCustomEtree(self):
+        # Subclasses that customize ``to_etree()`` are written from its output
+        class TESTCUSTOM(TESTSUBAGGREGATE):
+            @staticmethod
+            def ungroom(elem):
+                elem = copy.deepcopy(elem)
+                ET.SubElement(elem, "EXTRA").text = "1 < 2"
+                return elem
+
+        instance = TESTAGGREGATE(
+            metadata="foo",
+            req00=True,
+            req11=False,
+            testsubaggregate=TESTCUSTOM(data="bar"),
+        )
+        output = BytesIO()
+        instance.write(output, prettyprint=True)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTAGGREGATE>\n"
+            "  <METADATA>foo</METADATA>\n"
+            "  <REQ00>Y</REQ00>\n"
+            "  <REQ11>N</REQ11>\n"
+            "  <TESTCUSTOM>\n"
+            "    <DATA>bar</DATA>\n"
+            "    <EXTRA>1 &lt; 2</EXTRA>\n"
+            "  </TESTCUSTOM>\n"
+            "</TESTAGGREGATE>\n",
+        )
 
     def testUngroom(self):
-        pass
+        # Aliases are reversed for Elements; SubAggregates are tagged by class
+        root = TESTALIASES(
+            frm="Joe", testsubaggregate=TESTSUBAGGREGATE(data="data")
+        ).to_etree()
+        self.assertEqual([child.tag for child in root], ["FROM", "TESTSUBAGGREGATE"])
 
     def testFilterAttrs(self):
         """
@@ -446,6 +627,34 @@ class AggregateTestCase(unittest.TestCase):
         self.assertEqual(name, "dontuse")
         self.assertIsInstance(instance, Unsupported)
 
+    def testSchema(self):
+        # Class spec is compiled when the class is defined
+        schema = TESTAGGREGATE._schema
+        self.assertEqual(list(schema.spec.items()), list(TESTAGGREGATE.spec.items()))
+        self.assertEqual(schema.names, tuple(TESTAGGREGATE.spec))
+        self.assertEqual(schema.indices["metadata"], 0)
+        self.assertEqual(schema.indices["dontuse"], 10)
+        self.assertEqual(list(schema.subaggregates), ["testsubaggregate"])
+        self.assertEqual(list(schema.unsupported), ["dontuse"])
+        self.assertEqual(schema.listmembers, frozenset())
+
+        # Compiled mappings are read-only; class properties return copies
+        with self.assertRaises(TypeError):
+            schema.spec["foo"] = String()
+        spec = TESTAGGREGATE.spec
+        spec.popitem()
+        self.assertEqual(len(TESTAGGREGATE.spec), 11)
+
+    def testSchemaSubclass(self):
+        class TESTSUBCLASS(TESTAGGREGATE2):
+            metadata = Bool()
+            extra = String(32)
+
+        schema = TESTSUBCLASS._schema
+        self.assertEqual(schema.names, ("metadata", "extra"))
+        self.assertIsInstance(schema.spec["metadata"], Bool)
+        self.assertEqual(TESTAGGREGATE2._schema.names, ("metadata",))
+
     def testSpecRepr(self):
         #  Sequence of (name, repr()) for each non-empty attribute in ``_spec``
         spec_repr = self.instance_no_subagg._spec_repr
@@ -490,7 +699,140 @@ class AggregateTestCase(unittest.TestCase):
         )
 
     def testGetattr(self):
-        pass
+        # Proxy access to attributes of SubAggregates
+        instance = self.instance_with_subagg
+        self.assertEqual(instance.data, "bar")
+        proxies = TESTAGGREGATE._schema.proxies
+        self.assertEqual(proxies["data"], (("testsubaggregate",),))
+        with self.assertRaises(AttributeError):
+            self.instance_no_subagg.data
+        with self.assertRaises(AttributeError):
+            instance.bogus
+        self.assertEqual(proxies["bogus"], ())
+
+    def testGetattrNested(self):
+        class TESTOUTER(Aggregate):
+            testaggregate2 = SubAggregate(TESTAGGREGATE2)
+            testaggregate = SubAggregate(TESTAGGREGATE)
+
+        # Search SubAggregates in order, skipping those that are empty
+        instance = TESTOUTER(testaggregate=self.instance_with_subagg)
+        self.assertEqual(instance.data, "bar")
+        self.assertEqual(instance.metadata, "foo")
+        self.assertEqual(
+            TESTOUTER._proxy_paths("metadata"),
+            (("testaggregate2",), ("testaggregate",)),
+        )
+        self.assertEqual(
+            TESTOUTER._proxy_paths("data"), (("testaggregate", "testsubaggregate"),)
+        )
+        instance = TESTOUTER(testaggregate2=TESTAGGREGATE2(metadata="baz"))
+        self.assertEqual(instance.metadata, "baz")
+        with self.assertRaises(AttributeError):
+            instance.data
+
+
+class CompactAggregateTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        models.TESTSUBAGGREGATE = TESTSUBAGGREGATE
+        models.TESTCOMPACT = TESTCOMPACT
+
+    @classmethod
+    def tearDownClass(cls):
+        del models.TESTSUBAGGREGATE
+        del models.TESTCOMPACT
+
+    @property
+    def instance(self):
+        subagg = TESTSUBAGGREGATE(data="bar")
+        return TESTCOMPACT(metadata="foo", flag=True, testsubaggregate=subagg)
+
+    def testSlots(self):
+        # Slots are generated for Elements, including inherited ones
+        self.assertEqual(
+            TESTCOMPACT.__slots__, ("_metadata", "_flag", "_testsubaggregate")
+        )
+        self.assertEqual(
+            TESTCOMPACT._schema.names,
+            ("metadata", "flag", "testsubaggregate", "dontuse"),
+        )
+
+        # Inherited Elements are copied, not shared with the base class
+        metadata = TESTCOMPACT._schema.spec["metadata"]
+        self.assertIsInstance(metadata, String)
+        self.assertIsNot(metadata, TESTAGGREGATE2._schema.spec["metadata"])
+        self.assertIsNone(TESTAGGREGATE2._schema.spec["metadata"].slot)
+        self.assertIsNotNone(metadata.slot)
+
+    def testInit(self):
+        instance = self.instance
+        self.assertEqual(instance.metadata, "foo")
+        self.assertIs(instance.flag, True)
+        self.assertEqual(instance.testsubaggregate.data, "bar")
+        self.assertIsNone(instance.dontuse)
+        # Values are held in slots, not the instance __dict__
+        self.assertEqual(instance._metadata, "foo")
+        self.assertEqual(instance.__dict__, {})
+
+        instance.flag = "N"
+        self.assertIs(instance.flag, False)
+        with self.assertRaises(Types.OFXSpecError):
+            instance.metadata = None
+
+        # Instances of the base class are unaffected
+        self.assertEqual(TESTAGGREGATE2(metadata="baz").__dict__, {"metadata": "baz"})
+
+    def testGetattr(self):
+        # Proxy access to attributes of SubAggregates
+        self.assertEqual(self.instance.data, "bar")
+        with self.assertRaises(AttributeError):
+            self.instance.bogus
+
+    def testFromEtreeLazy(self):
+        root = ET.Element("TESTCOMPACT")
+        ET.SubElement(root, "METADATA").text = "foo"
+        sub = ET.SubElement(root, "TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "bar"
+        with Types.lazy_conversion():
+            instance = Aggregate.from_etree(root)
+        self.assertIsInstance(instance._testsubaggregate, Types.Deferred)
+        self.assertEqual(instance.data, "bar")
+        self.assertIsInstance(instance._testsubaggregate, TESTSUBAGGREGATE)
+
+    def testSubclass(self):
+        class TESTCOMPACTSUBCLASS(TESTCOMPACT):
+            extra = String(32)
+
+        # Slots are inherited
+        self.assertEqual(TESTCOMPACTSUBCLASS.__dict__.get("__slots__"), None)
+        instance = TESTCOMPACTSUBCLASS(metadata="foo", extra="bar")
+        self.assertEqual(instance.metadata, "foo")
+        self.assertEqual(instance.extra, "bar")
+        self.assertEqual(instance.__dict__, {"extra": "bar"})
+
+    def testCopy(self):
+        instance = self.instance
+        for clone in (
+            copy.copy(instance),
+            copy.deepcopy(instance),
+            instance.clone(),
+            pickle.loads(pickle.dumps(instance)),
+        ):
+            self.assertIsInstance(clone, TESTCOMPACT)
+            self.assertEqual(repr(clone), repr(instance))
+            self.assertEqual(clone.__dict__, {})
+
+    def testEtree(self):
+        elem = self.instance.to_etree()
+        self.assertEqual(
+            ET.tostring(elem).decode(),
+            "<TESTCOMPACT><METADATA>foo</METADATA><FLAG>Y</FLAG>"
+            "<TESTSUBAGGREGATE><DATA>bar</DATA></TESTSUBAGGREGATE></TESTCOMPACT>",
+        )
+        instance = Aggregate.from_etree(elem)
+        self.assertIsInstance(instance, TESTCOMPACT)
+        self.assertEqual(repr(instance), repr(self.instance))
 
 
 class SubAggregateTestCase(unittest.TestCase):
@@ -590,6 +932,13 @@ class ListTestCase(unittest.TestCase):
         self.assertIsInstance(agg1, TESTAGGREGATE)
         self.assertIsInstance(agg2, TESTAGGREGATE2)
 
+    def testValidate(self):
+        instance = self.instance
+        instance.validate()
+        instance[0].req01 = True
+        with self.assertRaises(OFXSpecError):
+            instance.validate()
+
     def testFromEtreeWrongOrder(self):
         root = ET.Element("TESTLIST")
         agg = ET.SubElement(root, "TESTAGGREGATE2")
@@ -699,6 +1048,34 @@ class ListTestCase(unittest.TestCase):
         rep = repr(self.instance)
         self.assertEqual(rep, "<TESTLIST(metadata='foo'), len=3>")
 
+    def testPickle(self):
+        instance = self.instance
+        instance[2]._deferred = ("Elements out of order",)
+        for clone in (
+            pickle.loads(pickle.dumps(instance)),
+            copy.deepcopy(instance),
+            instance.clone(),
+        ):
+            self.assertIsInstance(clone, TESTLIST)
+            self.assertEqual(repr(clone), repr(instance))
+            self.assertEqual(repr(clone[:]), repr(instance[:]))
+            self.assertEqual(clone[0].data, "quux")
+            self.assertIsNot(clone[0], instance[0])
+            self.assertIsNot(clone[0].testsubaggregate, instance[0].testsubaggregate)
+            self.assertEqual(clone[2]._deferred, ("Elements out of order",))
+
+    def testReduce(self):
+        # Values in spec order, less trailing None
+        reduced = self.instance[0].__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        cls, values = reduced[1]
+        self.assertIs(cls, TESTAGGREGATE)
+        self.assertEqual(values[:2], ("foo", None))
+        self.assertEqual(len(values), 10)
+        self.assertEqual(
+            TESTAGGREGATE2(metadata="dumbo").__reduce_ex__(2)[1],
+            (TESTAGGREGATE2, ("dumbo",)),
+        )
+
 
 class ElementListTestCase(unittest.TestCase):
     __test__ = True
@@ -783,6 +1160,14 @@ class ElementListTestCase(unittest.TestCase):
         with self.assertRaises(OFXSpecError):
             Aggregate.from_etree(root)
 
+    def testSchema(self):
+        # ElementList.listaggregates returns ListElements
+        schema = TESTELEMENTLIST._schema
+        self.assertEqual(list(schema.listaggregates), ["tag"])
+        self.assertEqual(list(schema.listelements), ["tag"])
+        self.assertEqual(schema.listmembers, frozenset(["tag"]))
+        self.assertEqual(list(TESTELEMENTLIST.listaggregates), ["tag"])
+
     def testToEtree(self):
         root = self.instance.to_etree()
         self.assertElement(root, tag="TESTELEMENTLIST", text=None, len=3)
@@ -792,6 +1177,21 @@ class ElementListTestCase(unittest.TestCase):
         self.assertElement(tag0, tag="TAG", text="N", len=0)
         self.assertElement(tag1, tag="TAG", text="Y", len=0)
 
+    def testPickle(self):
+        instance = self.instance
+        for clone in (pickle.loads(pickle.dumps(instance)), instance.clone()):
+            self.assertIsInstance(clone, TESTELEMENTLIST)
+            self.assertEqual(clone.metadata, "something")
+            self.assertEqual(clone[:], [False, True])
+
+    def testWrite(self):
+        output = BytesIO()
+        self.instance.write(output, close_elements=False)
+        self.assertEqual(
+            output.getvalue(),
+            b"<TESTELEMENTLIST><METADATA>something<TAG>N<TAG>Y</TESTELEMENTLIST>",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 """ Unit tests for models.invest """
 # stdlib imports
 import unittest
+import importlib.util
 from xml.etree.ElementTree import Element, SubElement
 from decimal import Decimal
 from datetime import datetime
@@ -48,6 +49,8 @@ from ofxtools.models.invest import (
     INVSTMTTRNRQ,
     INVSTMTTRNRS,
 )
+from ofxtools.models.invest.securities import SECID
+from ofxtools.Types import MinorUnits, numeric_mode
 from ofxtools.utils import UTC, classproperty
 
 
@@ -189,6 +192,43 @@ class InvposlistTestCase(unittest.TestCase, base.TestAggregate):
         with cls.assertWarns(UnknownTagWarning):
             Aggregate.from_etree(root)
 
+    def testToColumns(self):
+        columns = self.aggregate.to_columns(["secid.uniqueid", "postype", "mktval"])
+        self.assertEqual(
+            columns,
+            {
+                "secid.uniqueid": ["084670108"] * 5,
+                "postype": ["LONG"] * 5,
+                "mktval": [Decimal("9000")] * 5,
+            },
+        )
+
+    def testColumnsFromEtree(self):
+        self.assertEqual(
+            INVPOSLIST.columns_from_etree(self.etree), self.aggregate.to_columns()
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def testToNumpy(self):
+        array = self.aggregate.to_numpy(["secid", "units", "mktval", "dtpriceasof"])
+        self.assertEqual(len(array), 5)
+        # SubAggregates are stored whole, not expanded by NumPy
+        self.assertEqual(array["secid"].dtype.name, "object")
+        self.assertIsInstance(array["secid"][0], SECID)
+        self.assertEqual(array["secid"][0].uniqueid, "084670108")
+        self.assertEqual(array["units"].dtype.name, "float64")
+        self.assertEqual(array["mktval"].sum(), 45000)
+        self.assertEqual(array["dtpriceasof"].dtype.name, "datetime64[us]")
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def testToNumpyScaled(self):
+        with numeric_mode("scaled"):
+            invposlist = Aggregate.from_etree(self.etree)
+        self.assertIsInstance(invposlist[0].mktval, MinorUnits)
+        array = invposlist.to_numpy(["mktval"])
+        self.assertEqual(array["mktval"].dtype.name, "int64")
+        self.assertEqual(array["mktval"].sum(), 4500000)
+
 
 class InvbalTestCase(unittest.TestCase, base.TestAggregate):
     __test__ = True
@@ -1297,6 +1337,47 @@ class InvtranlistTestCase(unittest.TestCase, base.TranlistTestCase):
                 root.append(transaction.etree)
                 yield root
 
+    def testToColumns(self):
+        columns = self.aggregate.to_columns(
+            ["fitid", "trntype", "secid.uniqueid", "units", "total"]
+        )
+        # INVBANKTRAN, then BUYDEBT
+        self.assertEqual(columns["fitid"][:2], ["DEADBEEF", "1001"])
+        self.assertEqual(columns["trntype"][:2], ["CHECK", None])
+        self.assertEqual(columns["secid.uniqueid"][:2], [None, "084670108"])
+        self.assertEqual(columns["units"][:2], [None, Decimal("100")])
+        self.assertEqual(columns["total"][:2], [None, Decimal("-161.49")])
+        for values in columns.values():
+            self.assertEqual(len(values), len(self.transactions))
+
+    def testColumnsFromEtree(self):
+        self.assertEqual(
+            INVTRANLIST.columns_from_etree(self.etree), self.aggregate.to_columns()
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires NumPy")
+    def testToNumpy(self):
+        import numpy
+
+        array = self.aggregate.to_numpy(["fitid", "dttrade", "secid", "total"])
+        self.assertEqual(len(array), len(self.transactions))
+        self.assertEqual(list(array["fitid"][:2]), ["DEADBEEF", "1001"])
+        self.assertEqual(array["dttrade"].dtype.name, "datetime64[us]")
+        # INVBANKTRAN has no SECID or TOTAL
+        self.assertEqual(array["secid"].dtype.name, "object")
+        self.assertIsNone(array["secid"][0])
+        self.assertIsInstance(array["secid"][1], SECID)
+        self.assertEqual(array["total"].dtype.name, "float64")
+        self.assertTrue(numpy.isnan(array["total"][0]))
+        self.assertEqual(array["total"][1], -161.49)
+
+        # Scaled amounts become floats when any are missing
+        with numeric_mode("scaled"):
+            invtranlist = Aggregate.from_etree(self.etree)
+        array = invtranlist.to_numpy(["total"])
+        self.assertEqual(array["total"].dtype.name, "float64")
+        self.assertEqual(array["total"][1], -16149)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,16 +3,33 @@
 
 # stdlib imports
 import unittest
+import decimal
+from enum import Enum
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch, sentinel
-from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import Element, SubElement, tostring
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from collections import namedtuple
+from copy import deepcopy
 
 
 # local imports
-from ofxtools.Parser import OFXTree, TreeBuilder, ParseError
+from ofxtools.Parser import (
+    OFXTree,
+    TreeBuilder,
+    SGMLTreeBuilder,
+    AggregateBuilder,
+    StreamingTreeBuilder,
+    SelectiveTreeBuilder,
+    ParseError,
+    ParseResult,
+    parse_many,
+)
+from ofxtools.header import make_header, OFXHeaderError
+from ofxtools.Types import MinorUnits
+import ofxtools.Types
+from ofxtools.models.base import Aggregate, OFXSpecError, UnknownTagWarning
 
 
 # Container for results of TreeBuilderRegexTestCase._parsetag()
@@ -263,6 +280,8 @@ class TreeBuilderUnitTestCase(TestCase):
 class TreeBuilderUnitFunctionalTestCase(TestCase):
     """Functional tests for ofxtools.Parser.Treebuilder"""
 
+    builderClass = TreeBuilder
+
     def _testElement(self, element, tag, text, length):
         self.assertIsInstance(element, Element)
         self.assertEqual(element.tag, tag)
@@ -274,7 +293,7 @@ class TreeBuilderUnitFunctionalTestCase(TestCase):
         str -> Element tests reused to test responses with identical content
         but different formatting.
         """
-        builder = TreeBuilder()
+        builder = self.builderClass()
         builder.feed(body)
         root = builder.close()
 
@@ -442,7 +461,7 @@ class TreeBuilderUnitFunctionalTestCase(TestCase):
             "</MAILRS>"
             "</MAILTRNRS>"
         )
-        builder = TreeBuilder()
+        builder = self.builderClass()
         builder.feed(body)
         root = builder.close()
 
@@ -485,6 +504,323 @@ class TreeBuilderUnitFunctionalTestCase(TestCase):
         self._testElement(usehtml, tag="USEHTML", text="Y", length=0)
 
 
+class SGMLTreeBuilderFunctionalTestCase(TreeBuilderUnitFunctionalTestCase):
+    """Functional tests for ofxtools.Parser.SGMLTreeBuilder"""
+
+    builderClass = SGMLTreeBuilder
+
+    def _testSameAsTreeBuilder(self, markup):
+        results = []
+        for builder in (TreeBuilder(), SGMLTreeBuilder()):
+            try:
+                builder.feed(markup)
+                results.append(tostring(builder.close()))
+            except ParseError as err:
+                results.append(err.args)
+        self.assertEqual(*results)
+        return results[0]
+
+    def testCdataMultiline(self):
+        # CDATA isn't matched across lines, nor when it's empty
+        self._testSameAsTreeBuilder(
+            "<MAIL><MSGBODY><![CDATA[]]>\n<![CDATA[<A>]]>\n<FOO>]]></MAIL>"
+        )
+        self._testSameAsTreeBuilder("<MSGBODY><![CDATA[one]]>two]]></MSGBODY>")
+
+    def testUnmatchedTags(self):
+        # Anything not matching the tag pattern is skipped
+        self._testSameAsTreeBuilder(
+            "<OFX><!-- comment --><lower>text</lower><A B>foo</A B></OFX>"
+        )
+
+    def testTail(self):
+        error = self._testSameAsTreeBuilder("<FOO>bar</FOO>illegal<BAZ>")
+        self.assertEqual(
+            error[0],
+            "Tail text 'illegal' in <FOO>bar</FOO>illegal<BAZ> - position=[0:21]",
+        )
+
+    def testEndTagText(self):
+        error = self._testSameAsTreeBuilder("<FOO></FOO>\n</FOO><![CDATA[bar]]>")
+        self.assertEqual(error[0], "Tail text 'bar' after </FOO> - position=[12:33]")
+
+
+class AggregateBuilderTestCase(TestCase):
+    """Functional tests for ofxtools.Parser.AggregateBuilder"""
+
+    sonrs = (
+        "<SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS>"
+        "<DTSERVER>20051029101003<LANGUAGE>ENG"
+        "<FI><ORG>NCH<FID>1001</FI><INTU.BID>00000</SONRS>"
+    )
+
+    def _build(self, markup):
+        builder = AggregateBuilder()
+        builder.feed(markup)
+        return builder.close()
+
+    def _convert(self, markup):
+        builder = TreeBuilder()
+        builder.feed(markup)
+        return Aggregate.from_etree(builder.close())
+
+    def _testSameAsConvert(self, markup):
+        instance = self._build(markup)
+        expected = self._convert(markup)
+        self.assertEqual(repr(instance), repr(expected))
+        self.assertEqual(tostring(instance.to_etree()), tostring(expected.to_etree()))
+        return instance
+
+    def testAggregate(self):
+        sonrs = self._testSameAsConvert(self.sonrs)
+        self.assertEqual(sonrs.org, "NCH")
+        self.assertEqual(sonrs.status.code, 0)
+
+    def testListAggregate(self):
+        stmttrn = (
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20051004<TRNAMT>-{0}<FITID>{0}"
+            "</STMTTRN>"
+        )
+        markup = (
+            "<BANKTRANLIST><DTSTART>20051001<DTEND>20051028"
+            + "".join(stmttrn.format(n) for n in range(1, 4))
+            + "</BANKTRANLIST>"
+        )
+        tranlist = self._testSameAsConvert(markup)
+        self.assertEqual([tx.fitid for tx in tranlist], ["1", "2", "3"])
+
+    def testTagAliases(self):
+        markup = (
+            "<MAIL><USERID>12345<DTCREATED>20051029<FROM>Joe<TO>Bank"
+            "<SUBJECT>Hi<MSGBODY>Hello<INCIMAGES>N<USEHTML>N</MAIL>"
+        )
+        mail = self._testSameAsConvert(markup)
+        self.assertEqual(mail.frm, "Joe")
+
+    def testGroom(self):
+        # Aggregates with custom groom() are converted from ElementTree
+        def groom(elem):
+            elem = deepcopy(elem)
+            elem.find("CODE").text = "2000"
+            return elem
+
+        markup = "<STATUS><CODE>0<SEVERITY>INFO</STATUS>"
+        with patch("ofxtools.models.STATUS.groom", groom):
+            status = self._testSameAsConvert(markup)
+        self.assertEqual(status.code, 2000)
+
+    def testUnsupported(self):
+        markup = "<OFX>" + self.sonrs.replace("SONRS>", "SIGNONMSGSRSV1><SONRS>", 1)
+        markup = markup.replace("</SONRS>", "</SONRS></SIGNONMSGSRSV1>")
+        markup += "<PRESDIRMSGSRSV1><FOO>bar</PRESDIRMSGSRSV1></OFX>"
+        ofx = self._testSameAsConvert(markup)
+        self.assertIsNone(ofx.presdirmsgsrsv1)
+
+    def testUnknownTag(self):
+        markup = self.sonrs.replace("<LANGUAGE>", "<FAKE><GARBAGE>1</FAKE><LANGUAGE>")
+        with self.assertWarns(UnknownTagWarning):
+            sonrs = self._build(markup)
+        self.assertEqual(sonrs.language, "ENG")
+
+    def testOutOfOrder(self):
+        markup = "<STATUS><SEVERITY>INFO<CODE>0</STATUS>"
+        with self.assertRaises(OFXSpecError) as err:
+            self._build(markup)
+        with self.assertRaises(OFXSpecError) as expected:
+            self._convert(markup)
+        self.assertEqual(err.exception.args, expected.exception.args)
+
+    def testUnknownRoot(self):
+        with self.assertRaises(OFXSpecError):
+            self._build("<NOTAREALOFXTAG><FOO>bar</NOTAREALOFXTAG>")
+
+    def testOFXTree(self):
+        # OFXTree.convert() passes through AggregateBuilder output
+        header = str(make_header(version=102))
+        source = BytesIO((header + self.sonrs).encode("ascii"))
+        tree = OFXTree()
+        tree.parse(source, parser=AggregateBuilder())
+        sonrs = tree.convert()
+        self.assertEqual(sonrs.fid, "1001")
+
+    def testNumeric(self):
+        markup = (
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20051004<TRNAMT>-21.52<FITID>1"
+            "</STMTTRN>"
+        )
+        builder = AggregateBuilder(numeric="scaled")
+        builder.feed(markup)
+        stmttrn = builder.close()
+        self.assertEqual(stmttrn.trnamt, -2152)
+        self.assertIsInstance(stmttrn.trnamt, MinorUnits)
+        self.assertEqual(self._build(markup).trnamt, decimal.Decimal("-21.52"))
+
+        with self.assertRaises(ValueError):
+            AggregateBuilder(numeric="fixed")
+
+    def testNumericScaledInvpos(self):
+        # Money is scaled; share quantities & prices keep all their places
+        markup = (
+            "<INVPOS><SECID><UNIQUEID>084670108<UNIQUEIDTYPE>CUSIP</SECID>"
+            "<HELDINACCT>CASH<POSTYPE>LONG<UNITS>0.0035<UNITPRICE>12.3456"
+            "<MKTVAL>0.04<DTPRICEASOF>20051004</INVPOS>"
+        )
+        builder = AggregateBuilder(numeric="scaled")
+        builder.feed(markup)
+        invpos = builder.close()
+        self.assertEqual(invpos.units, decimal.Decimal("0.0035"))
+        self.assertEqual(invpos.unitprice, decimal.Decimal("12.3456"))
+        self.assertEqual(invpos.mktval, 4)
+        self.assertIsInstance(invpos.mktval, MinorUnits)
+
+    def testNumericScaledSubcent(self):
+        markup = (
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20051004<TRNAMT>-0.0035<FITID>1"
+            "</STMTTRN>"
+        )
+        builder = AggregateBuilder(numeric="scaled")
+        with self.assertRaises(ofxtools.Types.OFXSpecError):
+            builder.feed(markup)
+            builder.close()
+
+    def testEnums(self):
+        markup = (
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20051004<TRNAMT>-21.52<FITID>1"
+            "</STMTTRN>"
+        )
+        builder = AggregateBuilder(enums=True)
+        builder.feed(markup)
+        stmttrn = builder.close()
+        self.assertIsInstance(stmttrn.trnamt, decimal.Decimal)
+        self.assertIsInstance(stmttrn.trntype, Enum)
+        self.assertEqual(stmttrn.trntype, "DEBIT")
+
+    def testNoValidation(self):
+        markup = (
+            "<STMTTRN><DTPOSTED>20051004<TRNTYPE>DEBIT<TRNAMT>-21.52<FITID>1"
+            "</STMTTRN>"
+        )
+        with self.assertRaises(OFXSpecError):
+            self._build(markup)
+        builder = AggregateBuilder(validate=False)
+        builder.feed(markup)
+        stmttrn = builder.close()
+        self.assertEqual(stmttrn.trntype, "DEBIT")
+        with self.assertRaises(OFXSpecError):
+            stmttrn.validate()
+
+
+class StreamingTreeBuilderTestCase(TestCase):
+    def test_boundary_start_tag(self):
+        markup = "<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><FITID>12"
+        self.assertEqual(
+            StreamingTreeBuilder.boundary(markup), markup.index("<FITID>")
+        )
+
+    def test_boundary_end_tag(self):
+        # Closing tags may belong to the preceding element; don't split there
+        markup = "<STMTTRN><TRNTYPE>DEBIT</TRNTYPE"
+        self.assertEqual(
+            StreamingTreeBuilder.boundary(markup), markup.index("<TRNTYPE>")
+        )
+
+    def test_boundary_trailing_bracket(self):
+        # A lone "<" might turn out to be the start of a closing tag
+        markup = "<STMTTRN><TRNTYPE>DEBIT<"
+        self.assertEqual(
+            StreamingTreeBuilder.boundary(markup), markup.index("<TRNTYPE>")
+        )
+
+    def test_boundary_cdata(self):
+        markup = "<MEMO><![CDATA[<b>bold</b>"
+        self.assertEqual(StreamingTreeBuilder.boundary(markup), 0)
+
+    def test_boundary_closed_cdata(self):
+        markup = "<MEMO><![CDATA[<b>bold</b>]]><NAME>"
+        self.assertEqual(
+            StreamingTreeBuilder.boundary(markup), markup.index("<NAME>")
+        )
+
+    def test_boundary_none(self):
+        self.assertEqual(StreamingTreeBuilder.boundary("DEBIT</TRNTYPE>"), 0)
+
+    def test_detach(self):
+        builder = StreamingTreeBuilder(["STMTTRN"])
+        builder.feed(
+            "<BANKTRANLIST><DTSTART>20051001<DTEND>20051028"
+            "<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20051004<TRNAMT>50.00"
+            "<FITID>0001</STMTTRN>"
+        )
+        self.assertEqual(len(builder.completed), 1)
+        stmttrn = builder.completed.popleft()
+        self.assertEqual(stmttrn.tag, "STMTTRN")
+        self.assertEqual(stmttrn.find("FITID").text, "0001")
+
+        builder.feed("</BANKTRANLIST>")
+        root = builder.close()
+        self.assertEqual([e.tag for e in root], ["DTSTART", "DTEND"])
+
+    def test_nested(self):
+        # Selected aggregates nested in other selected aggregates aren't
+        # detached separately
+        builder = StreamingTreeBuilder(["INVBUY", "INVTRAN"])
+        builder.feed(
+            "<BUYSTOCK><INVBUY><INVTRAN><FITID>1</INVTRAN>"
+            "<UNITS>100</INVBUY><BUYTYPE>BUY</BUYSTOCK>"
+        )
+        self.assertEqual(len(builder.completed), 1)
+        invbuy = builder.completed.popleft()
+        self.assertEqual(invbuy.tag, "INVBUY")
+        self.assertEqual(invbuy[0].tag, "INVTRAN")
+
+
+class SelectiveTreeBuilderTestCase(TestCase):
+    markup = (
+        "<OFX><SIGNONMSGSRSV1><SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS>"
+        "<DTSERVER>20051029101003<LANGUAGE>ENG</SONRS></SIGNONMSGSRSV1>"
+        "<BANKMSGSRSV1><STMTTRNRS><TRNUID>1001<STATUS><CODE>0<SEVERITY>INFO"
+        "</STATUS><STMTRS><CURDEF>USD<BANKTRANLIST><DTSTART>20050101"
+        "<DTEND>20051028<STMTTRN><TRNTYPE>CHECK</STMTTRN></BANKTRANLIST>"
+        "<LEDGERBAL><BALAMT>200.29<DTASOF>20051029</LEDGERBAL></STMTRS>"
+        "</STMTTRNRS></BANKMSGSRSV1></OFX>"
+    )
+
+    def _build(self, include):
+        builder = SelectiveTreeBuilder(include)
+        builder.feed(self.markup)
+        return builder.close()
+
+    def test_select(self):
+        root = self._build(["BANKMSGSRSV1/STMTTRNRS/STMTRS/LEDGERBAL"])
+        self.assertEqual(
+            tostring(root),
+            b"<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><LEDGERBAL>"
+            b"<BALAMT>200.29</BALAMT><DTASOF>20051029</DTASOF>"
+            b"</LEDGERBAL></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>",
+        )
+
+    def test_select_root_tag(self):
+        # Leading root tag is optional
+        self.assertEqual(
+            tostring(self._build(["OFX/SIGNONMSGSRSV1/SONRS/LANGUAGE"])),
+            b"<OFX><SIGNONMSGSRSV1><SONRS><LANGUAGE>ENG</LANGUAGE></SONRS>"
+            b"</SIGNONMSGSRSV1></OFX>",
+        )
+
+    def test_select_multiple(self):
+        root = self._build(["*/SONRS/STATUS", "BANKMSGSRSV1/*/TRNUID"])
+        self.assertEqual(
+            tostring(root),
+            b"<OFX><SIGNONMSGSRSV1><SONRS><STATUS><CODE>0</CODE>"
+            b"<SEVERITY>INFO</SEVERITY></STATUS></SONRS></SIGNONMSGSRSV1>"
+            b"<BANKMSGSRSV1><STMTTRNRS><TRNUID>1001</TRNUID></STMTTRNRS>"
+            b"</BANKMSGSRSV1></OFX>",
+        )
+
+    def test_select_none(self):
+        self.assertEqual(tostring(self._build(["BOGUS"])), b"<OFX />")
+
+
 class OFXTreeTestCase(TestCase):
     def setUp(self):
         self.tree = OFXTree()
@@ -511,6 +847,125 @@ class OFXTreeTestCase(TestCase):
         #  mockTreeBuilderInstance.close.assert_called_once()
         self.assertEqual(self.tree._root, sentinel.root)
 
+    def test_parse_xml(self):
+        # OFXv2 bodies are parsed as XML, producing the same tree as TreeBuilder
+        header = str(make_header(version=220))
+        body = (
+            "<OFX>\n  <SIGNONMSGSRSV1>\n    <SONRS>\n      <STATUS>\n"
+            "        <CODE>0</CODE>\n        <SEVERITY>INFO</SEVERITY>\n"
+            "        <MESSAGE>Smith &amp; Wesson &lt;3</MESSAGE>\n      </STATUS>\n"
+            "      <DTSERVER>20051029101003</DTSERVER>\n"
+            "      <LANGUAGE>ENG</LANGUAGE>\n      <FI></FI>\n    </SONRS>\n"
+            "  </SIGNONMSGSRSV1>\n</OFX>\n"
+        )
+        source = (header + body).encode("utf8")
+
+        with patch("ofxtools.Parser.TreeBuilder") as MockTreeBuilder:
+            root = self.tree.parse(BytesIO(source))
+            MockTreeBuilder.assert_not_called()
+
+        builder = TreeBuilder()
+        builder.feed(body)
+        expected = builder.close()
+        self.assertEqual(tostring(root), tostring(expected))
+
+    def test_parse_xml_fallback(self):
+        # OFXv2 bodies that aren't well-formed XML fall back to TreeBuilder
+        header = str(make_header(version=220))
+        for body in (
+            "<OFX><SIGNONMSGSRSV1><SONRS><DTSERVER>20051029101003"
+            "</SONRS></SIGNONMSGSRSV1></OFX>",
+            "<OFX><SIGNONMSGSRSV1><SONRS><MESSAGE><![CDATA[&amp;]]></MESSAGE>"
+            "</SONRS></SIGNONMSGSRSV1></OFX>",
+        ):
+            source = (header + body).encode("utf8")
+            with patch("ofxtools.Parser.TreeBuilder") as MockTreeBuilder:
+                builder = MockTreeBuilder.return_value
+                builder.close.return_value = sentinel.root
+                root = self.tree.parse(BytesIO(source))
+                builder.feed.assert_called_once_with(body)
+                self.assertEqual(root, sentinel.root)
+
+    def test_parse_xml_entities(self):
+        # Entities and character references convert the same on both paths
+        header = str(make_header(version=220))
+        body = (
+            "<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST><STMTTRN>"
+            "<TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20200101</DTPOSTED>"
+            "<TRNAMT>-1.00</TRNAMT><FITID>1</FITID>"
+            "<NAME>&quot;Macy&#39;s&quot; &amp; Co</NAME>"
+            "<MEMO>Caf&#xE9; &apos;&lt;3&apos; &amp;#39;</MEMO>"
+            "</STMTTRN></BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>"
+        )
+        source = (header + body).encode("utf8")
+
+        with patch("ofxtools.Parser.TreeBuilder") as MockTreeBuilder:
+            xmlroot = self.tree.parse(BytesIO(source))
+            MockTreeBuilder.assert_not_called()
+        sgmlroot = OFXTree().parse(BytesIO(source), parser=TreeBuilder())
+
+        for root in (xmlroot, sgmlroot):
+            stmttrn = Aggregate.from_etree(root.find(".//STMTTRN"))
+            self.assertEqual(stmttrn.name, '"Macy\'s" & Co')
+            self.assertEqual(stmttrn.memo, "Caf\xe9 '<3' &#39;")
+
+    def test_parse_xml_tail(self):
+        # Tail text is still reported by TreeBuilder
+        header = str(make_header(version=220))
+        body = "<OFX><SIGNONMSGSRSV1></SIGNONMSGSRSV1>garbage</OFX>"
+        with self.assertRaises(ParseError):
+            self.tree.parse(BytesIO((header + body).encode("utf8")))
+
+    def test_parse_bytes(self):
+        # OFXTree.parse_bytes() accepts bytes-like objects, or file names
+        # which it memory-maps
+        header = str(make_header(version=102))
+        body = (
+            "<OFX><SIGNONMSGSRSV1><SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS>"
+            "<DTSERVER>20051029101003<LANGUAGE>ENG</SONRS></SIGNONMSGSRSV1></OFX>"
+        )
+        source = (header + body).encode("ascii")
+
+        builder = TreeBuilder()
+        builder.feed(body)
+        expected = tostring(builder.close())
+
+        root = self.tree.parse_bytes(source)
+        self.assertEqual(self.tree.header.version, 102)
+        self.assertEqual(tostring(root), expected)
+
+        with NamedTemporaryFile() as file:
+            file.write(source)
+            file.flush()
+            tree = OFXTree()
+            root = tree.parse_bytes(file.name, parser=SGMLTreeBuilder())
+            self.assertEqual(tree.header.version, 102)
+            self.assertEqual(tostring(root), expected)
+
+    def test_parse_include(self):
+        header = str(make_header(version=220))
+        body = SelectiveTreeBuilderTestCase.markup
+        source = (header + body).encode("utf8")
+        self.tree.parse(BytesIO(source), include=["SECLISTMSGSRSV1", "*/*/*/LEDGERBAL"])
+        self.assertEqual(self.tree.find(".//STMTRS")[0].tag, "LEDGERBAL")
+        self.assertIsNone(self.tree.find("SIGNONMSGSRSV1"))
+
+        # Required elements outside the selection are missing; not validated
+        ofx = self.tree.convert()
+        self.assertEqual(ofx.statements[0].balamt, decimal.Decimal("200.29"))
+        self.assertIsNone(ofx.signonmsgsrsv1)
+        self.assertEqual(repr(ofx), "<OFX len(statements)=1 len(securities)=0>")
+        with self.assertRaises(ValueError):
+            self.tree.convert(validate=True)
+
+        with self.assertRaises(ValueError):
+            self.tree.parse(BytesIO(source), parser=TreeBuilder(), include=["OFX"])
+
+        # Parsing without ``include`` resets it
+        self.tree.parse_bytes(source)
+        with self.assertRaises(ValueError):
+            self.tree.convert()
+
     def test_read_filename(self):
         with patch("builtins.open") as fake_open:
             with patch("ofxtools.Parser.parse_header") as fake_parse_header:
@@ -573,6 +1028,44 @@ class OFXTreeTestCase(TestCase):
         with self.assertRaises(FileNotFoundError):
             self.tree._read(source)
 
+    def test_iterparse(self):
+        header = (
+            "OFXHEADER:100\r\nDATA:OFXSGML\r\nVERSION:102\r\nSECURITY:NONE\r\n"
+            "ENCODING:USASCII\r\nCHARSET:NONE\r\nCOMPRESSION:NONE\r\n"
+            "OLDFILEUID:NONE\r\nNEWFILEUID:NONE\r\n\r\n"
+        )
+        stmttrn = (
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20051004<TRNAMT>-{0}.00"
+            "<FITID>{0}<NAME><![CDATA[<Payee> & Co.]]></STMTTRN>\r\n"
+        )
+        body = (
+            "<BANKTRANLIST><DTSTART>20051001<DTEND>20051028"
+            + "".join(stmttrn.format(n) for n in range(1, 21))
+            + "</BANKTRANLIST>"
+        )
+        source = (header + body).encode("ascii")
+
+        for chunksize in (1, 7, 2**16):
+            tree = OFXTree()
+            stmttrns = list(tree.iterparse(BytesIO(source), ["STMTTRN"], chunksize))
+            self.assertEqual(tree.header.version, 102)
+            self.assertEqual(
+                [tx.fitid for tx in stmttrns], [str(n) for n in range(1, 21)]
+            )
+            self.assertEqual(stmttrns[-1].trnamt, -20)
+            self.assertEqual(stmttrns[-1].name, "<Payee> & Co.")
+
+            # The rest of the tree remains after the generator is exhausted
+            root = tree.getroot()
+            self.assertEqual(root.tag, "BANKTRANLIST")
+            self.assertEqual([e.tag for e in root], ["DTSTART", "DTEND"])
+
+    def test_iterparse_not_bytes(self):
+        source = NamedTemporaryFile(mode="w+")
+        with self.assertRaises(ValueError):
+            list(self.tree.iterparse(source, ["STMTTRN"]))
+        source.close()
+
     def test_convert(self):
         # Fake the result of OFXTree.parse()
         self.tree._root = Element("FAKE")
@@ -583,6 +1076,64 @@ class OFXTreeTestCase(TestCase):
             MockAggregate.from_etree.assert_called_once_with(self.tree._root)
             self.assertEqual(ofx, MockAggregate.from_etree())
 
+    def test_convert_numeric(self):
+        self.tree._root = Element("CURRENCY")
+        SubElement(self.tree._root, "CURRATE").text = "1.5"
+        SubElement(self.tree._root, "CURSYM").text = "EUR"
+        self.assertEqual(self.tree.convert().currate, decimal.Decimal("1.5"))
+        currate = self.tree.convert(numeric="float").currate
+        self.assertIsInstance(currate, float)
+        self.assertEqual(currate, 1.5)
+        # Exchange rates aren't scaled
+        self.assertEqual(
+            self.tree.convert(numeric="scaled").currate, decimal.Decimal("1.5")
+        )
+        with self.assertRaises(ValueError):
+            self.tree.convert(numeric="fixed")
+
+    def test_convert_enums(self):
+        self.tree._root = Element("CURRENCY")
+        SubElement(self.tree._root, "CURRATE").text = "1.5"
+        SubElement(self.tree._root, "CURSYM").text = "EUR"
+        self.assertIs(type(self.tree.convert().cursym), str)
+        cursym = self.tree.convert(enums=True).cursym
+        self.assertIsInstance(cursym, Enum)
+        self.assertEqual(cursym, "EUR")
+
+    def test_convert_no_validation(self):
+        self.tree._root = Element("CURRENCY")
+        SubElement(self.tree._root, "CURRATE").text = "1.5"
+        SubElement(self.tree._root, "CURSYM").text = "XYZ"
+        with self.assertRaises(ValueError):
+            self.tree.convert()
+        currency = self.tree.convert(validate=False)
+        self.assertEqual(currency.cursym, "XYZ")
+        with self.assertRaises(ValueError):
+            currency.validate()
+
+    def test_convert_lazy(self):
+        self.tree._root = Element("STMTRS")
+        SubElement(self.tree._root, "CURDEF").text = "USD"
+        acctfrom = SubElement(self.tree._root, "BANKACCTFROM")
+        SubElement(acctfrom, "BANKID").text = "111000614"
+        SubElement(acctfrom, "ACCTID").text = "123456789123456789"
+        SubElement(acctfrom, "ACCTTYPE").text = "CHECKING"
+        tranlist = SubElement(self.tree._root, "BANKTRANLIST")
+        SubElement(tranlist, "DTSTART").text = "20050101"
+        SubElement(tranlist, "DTEND").text = "2005"
+        ledgerbal = SubElement(self.tree._root, "LEDGERBAL")
+        SubElement(ledgerbal, "BALAMT").text = "150.65"
+        SubElement(ledgerbal, "DTASOF").text = "20051029"
+
+        with self.assertRaises(ValueError):
+            self.tree.convert()
+        stmtrs = self.tree.convert(numeric="float", lazy=True)
+        self.assertEqual(stmtrs.ledgerbal.balamt, 150.65)
+        self.assertEqual(stmtrs.acctid, "123456789123456789")
+        # Invalid BANKTRANLIST isn't converted until it's read
+        with self.assertRaises(ValueError):
+            stmtrs.banktranlist
+
     def test_convert_unparsed(self):
         # Calling OFXTree.convert() without first calling OFXTree.parse()
         # raises ValueError
@@ -590,5 +1141,60 @@ class OFXTreeTestCase(TestCase):
             self.tree.convert()
 
 
+class ParseManyTestCase(TestCase):
+    @property
+    def sources(self):
+        header = str(make_header(version=102))
+        body = (
+            "<OFX><SIGNONMSGSRSV1><SONRS><STATUS><CODE>0<SEVERITY>INFO</STATUS>"
+            "<DTSERVER>{}<LANGUAGE>ENG</SONRS></SIGNONMSGSRSV1></OFX>"
+        )
+        return [
+            (header + body.format("20051029101003")).encode("ascii"),
+            b"garbage",
+            (header + body.format("2005")).encode("ascii"),
+            (header + body.format("20051030101003")).encode("ascii"),
+        ]
+
+    def check_results(self, results):
+        sources = self.sources
+        self.assertEqual([r.source for r in results], sources)
+        for result in results:
+            self.assertIsInstance(result, ParseResult)
+        first, garbage, invalid, last = results
+        self.assertEqual(first.ofx.signonmsgsrsv1.sonrs.dtserver.day, 29)
+        self.assertIsNone(first.error)
+        self.assertIsNone(garbage.ofx)
+        self.assertIsInstance(garbage.error, OFXHeaderError)
+        self.assertIsNone(invalid.ofx)
+        self.assertIsInstance(invalid.error, ValueError)
+        self.assertEqual(last.ofx.signonmsgsrsv1.sonrs.dtserver.day, 30)
+
+    def test_parse_many(self):
+        self.check_results(list(parse_many(self.sources, workers=2)))
+
+    def test_parse_many_chunks(self):
+        results = list(parse_many(self.sources, workers=2, chunksize=3, ordered=False))
+        results.sort(key=lambda r: self.sources.index(r.source))
+        self.check_results(results)
+
+    def test_parse_many_in_process(self):
+        self.check_results(list(parse_many(self.sources, workers=1, chunksize=2)))
+
+    def test_parse_many_kwargs(self):
+        results = list(
+            parse_many(
+                self.sources,
+                workers=1,
+                include=["SIGNONMSGSRSV1/SONRS/LANGUAGE"],
+                enums=True,
+            )
+        )
+        language = results[0].ofx.signonmsgsrsv1.sonrs.language
+        self.assertIsInstance(language, Enum)
+        self.assertIsNone(results[0].ofx.signonmsgsrsv1.sonrs.dtserver)
+        self.assertIsNone(results[2].error)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,8 @@
 # stdlib imports
 import unittest
 import decimal
+import copy
+import pickle
 import datetime
 import warnings
 from typing import Optional
@@ -37,6 +39,69 @@ class ElementTestCase(unittest.TestCase):
         rep = repr(instance)
         self.assertEqual(rep, "<Element required=True>")
 
+    def testDispatch(self):
+        """
+        Per-instance dispatchers give the same results as ``singledispatchmethod``
+        """
+        for t, values in (
+            (ofxtools.Types.Bool(), [True, "Y", None]),
+            (ofxtools.Types.String(32), ["foo", None]),
+            (ofxtools.Types.OneOf("A", "B"), ["A", ""]),
+            (ofxtools.Types.Integer(), [1, "1", True, decimal.Decimal("1")]),
+            (ofxtools.Types.Decimal(2), ["1.5", decimal.Decimal("3")]),
+            (ofxtools.Types.DateTime(), ["20051029101003", None]),
+            (ofxtools.Types.Time(), ["101003"]),
+        ):
+            convert = vars(type(t))["convert"].__get__(t)
+            unconvert = vars(type(t))["unconvert"].__get__(t)
+            for value in values:
+                with self.subTest(type=type(t).__name__, value=value):
+                    self.assertIsInstance(t.convert, ofxtools.Types._Dispatcher)
+                    converted = t.convert(value)
+                    self.assertEqual(converted, convert(value))
+                    self.assertEqual(t.unconvert(converted), unconvert(converted))
+
+    def testDispatchCopy(self):
+        """Copies' dispatchers are bound to the copy"""
+        t = ofxtools.Types.String(2)
+        for clone in (copy.copy(t), copy.deepcopy(t), pickle.loads(pickle.dumps(t))):
+            self.assertIs(clone.convert.element, clone)
+            self.assertIs(clone.unconvert.element, clone)
+            clone.length = 4
+            self.assertEqual(clone.convert("abcd"), "abcd")
+            with self.assertRaises(OFXSpecError):
+                t.convert("abcd")
+
+    def testDispatchTable(self):
+        """
+        Dispatchers pick the implementation registered for each value type,
+        memoizing those found for unregistered subclasses
+        """
+
+        class Text(str):
+            pass
+
+        t = ofxtools.Types.Decimal(places=2)
+        impls = vars(ofxtools.Types.Decimal)
+        table = t.convert.table
+        self.assertIs(table[str], impls["_convert_str"])
+        self.assertIs(table[decimal.Decimal], impls["_convert_decimal"])
+        self.assertIs(table[ofxtools.Types.MinorUnits], impls["_convert_minorunits"])
+        self.assertIs(table[type(None)], impls["_convert_none"])
+
+        self.assertNotIn(Text, table)
+        self.assertEqual(t.convert(Text("1.5")), decimal.Decimal("1.5"))
+        self.assertIs(table[Text], impls["_convert_str"])
+
+        # Unregistered types fall back to the default implementation
+        self.assertEqual(t.convert(3), decimal.Decimal(3))
+        self.assertIs(table[int], impls["convert"].dispatcher.dispatch(object))
+
+        unconvert = t.unconvert.table
+        minorunits = ofxtools.Types.MinorUnits
+        self.assertIs(unconvert[decimal.Decimal], impls["_unconvert_decimal"])
+        self.assertIs(unconvert[minorunits], impls["_unconvert_minorunits"])
+
 
 class Base:
     """Common tests for Element subclasses"""
@@ -152,12 +217,32 @@ class StringTestCase(unittest.TestCase, Base):
             '"No soup for you!"', t.convert("&quot;No soup for you!&quot;")
         )
 
+        # Character references, same as the XML parser
+        self.assertEqual("Macy's", t.convert("Macy&#39;s"))
+        self.assertEqual("Macy's", t.convert("Macy&#x27;s"))
+        self.assertEqual("Caf\xe9", t.convert("Caf&#233;"))
+
+        # Unescaped in a single pass, as the inverse of saxutils.escape()
+        self.assertEqual("&#39;", t.convert("&amp;#39;"))
+        self.assertEqual("&lt;", t.convert("&amp;lt;"))
+
+        # Leave alone anything that isn't a known entity / valid character
+        self.assertEqual("&copy; &#1114112; &", t.convert("&copy; &#1114112; &"))
+
     def test_max_length(self):
         t = self.type_(5)
         self.assertEqual("foo", t.convert("foo"))
         with self.assertRaises(OFXSpecError):
             t.convert("foobar")
 
+    def test_validation_disabled(self):
+        t = self.type_(5, required=True)
+        with ofxtools.Types.validation(False):
+            self.assertEqual(t.convert("foobar"), "foobar")
+            self.assertIsNone(t.convert(""))
+        with self.assertRaises(OFXSpecError):
+            t.convert("foobar")
+
     def test_empty_string(self):
         # Empty string interpreted as None
         t = self.type_(required=True)
@@ -217,6 +302,17 @@ class NagstringTestCase(StringTestCase):
             self.assertEqual(len(w), 1)
             self.assertEqual(w[0].category, OFXTypeWarning)
 
+    def test_validation_disabled(self):
+        t = self.type_(5, required=True)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            with ofxtools.Types.validation(False):
+                self.assertEqual(t.convert("foobar"), "foobar")
+                self.assertIsNone(t.convert(""))
+            self.assertEqual(len(w), 0)
+            t.convert("foobar")
+            self.assertEqual(len(w), 1)
+
     def test_unconvert(self):
         t = self.type_()
         # Pass string
@@ -280,6 +376,43 @@ class OneOfTestCase(unittest.TestCase, Base):
         value = "1"
         self.assertEqual(t.convert(t.unconvert(value)), value)
 
+    def test_interned(self):
+        t = self.type_("DEBIT", "CREDIT")
+        # Converted values are the canonical instances passed to ``__init__()``
+        value = "".join(["DE", "BIT"])
+        self.assertIsNot(value, t.valid[0])
+        self.assertIs(t.convert(value), t.valid[0])
+        self.assertIs(t.unconvert(value), t.valid[0])
+        # Unhashable values are invalid, not TypeError
+        with self.assertRaises(OFXSpecError):
+            t.convert(["DEBIT"])
+
+    def test_enum(self):
+        t = self.type_("DEBIT", "CREDIT")
+        self.assertEqual([m.value for m in t.enum], ["DEBIT", "CREDIT"])
+        self.assertIs(t.enum, t.enum)
+        with ofxtools.Types.enum_members():
+            value = t.convert("CREDIT")
+            self.assertIs(value, t.enum.CREDIT)
+            self.assertIs(t.convert(t.enum.DEBIT), t.enum.DEBIT)
+            self.assertIsNone(t.convert(""))
+            with self.assertRaises(OFXSpecError):
+                t.convert("3")
+        self.assertEqual(value, "CREDIT")
+        unconverted = t.unconvert(value)
+        self.assertEqual(unconverted, "CREDIT")
+        self.assertIs(type(unconverted), str)
+        # Plain ``str`` outside ``enum_members()``
+        self.assertIs(type(t.convert("CREDIT")), str)
+
+    def test_validation_disabled(self):
+        t = self.type_("DEBIT", "CREDIT", required=True)
+        with ofxtools.Types.validation(False):
+            self.assertEqual(t.convert("3"), "3")
+            self.assertIsNone(t.convert(None))
+        with self.assertRaises(OFXSpecError):
+            t.convert("3")
+
 
 class IntegerTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.Integer
@@ -409,6 +542,76 @@ class DecimalTestCase(unittest.TestCase, Base):
         value = decimal.Decimal("21.52")
         self.assertEqual(t.convert(t.unconvert(value)), value)
 
+    def test_numeric_mode_float(self):
+        t = self.type_()
+        with ofxtools.Types.numeric_mode("float"):
+            value = t.convert("21.52")
+            self.assertIsInstance(value, float)
+            self.assertEqual(value, 21.52)
+            self.assertEqual(t.convert("1,23"), 1.23)
+            self.assertIs(t.convert(value), value)
+            with self.assertRaises(ValueError):
+                t.convert("foobar")
+        self.assertEqual(t.unconvert(value), "21.52")
+        self.assertEqual(self.type_(4).unconvert(0.1), "0.1000")
+        # Mode is restored on exit
+        self.assertIsInstance(t.convert("21.52"), decimal.Decimal)
+
+    def test_numeric_mode_scaled(self):
+        t = self.type_(places=2)
+        with ofxtools.Types.numeric_mode("scaled"):
+            for value, cents in (
+                ("21.52", 2152),
+                ("-21.5", -2150),
+                ("+100", 10000),
+                ("1,23", 123),
+                (".5", 50),
+                ("0.120", 12),
+                ("1E2", 10000),
+                (" 1.00 ", 100),
+            ):
+                with self.subTest(value=value):
+                    converted = t.convert(value)
+                    self.assertIsInstance(converted, ofxtools.Types.MinorUnits)
+                    self.assertEqual(converted, cents)
+            self.assertEqual(self.type_(4).convert("1.5"), 15000)
+            with self.assertRaises(decimal.InvalidOperation):
+                t.convert("foobar")
+        self.assertEqual(t.convert("21.52"), decimal.Decimal("21.52"))
+        self.assertEqual(t.unconvert(ofxtools.Types.MinorUnits(2152)), "21.52")
+        with self.assertRaises(TypeError):
+            self.type_().unconvert(ofxtools.Types.MinorUnits(2152))
+        self.assertEqual(t.unconvert(ofxtools.Types.MinorUnits(-5)), "-0.05")
+        self.assertEqual(
+            self.type_(4).unconvert(ofxtools.Types.MinorUnits(15000)), "1.5000"
+        )
+        # MinorUnits pass through ``convert()`` in any mode
+        self.assertEqual(t.convert(ofxtools.Types.MinorUnits(2152)), 2152)
+
+    def test_numeric_mode_scaled_inexact(self):
+        # Sub-minor-unit values can't be scaled; don't round them away
+        t = self.type_(places=2)
+        with ofxtools.Types.numeric_mode("scaled"):
+            for value in ("0.0035", "12.3456", "0.125"):
+                with self.subTest(value=value):
+                    with self.assertRaises(ofxtools.Types.OFXSpecError):
+                        t.convert(value)
+
+    def test_numeric_mode_scaled_undeclared(self):
+        # Elements not declaring places (e.g. UNITPRICE) are converted exactly
+        t = self.type_()
+        with ofxtools.Types.numeric_mode("scaled"):
+            for value in ("12.3456", "0.0035", "100"):
+                with self.subTest(value=value):
+                    converted = t.convert(value)
+                    self.assertNotIsInstance(converted, ofxtools.Types.MinorUnits)
+                    self.assertEqual(converted, decimal.Decimal(value))
+
+    def test_numeric_mode_illegal(self):
+        with self.assertRaises(ValueError):
+            with ofxtools.Types.numeric_mode("fixed"):
+                pass
+
 
 class TestingTimezone(datetime.tzinfo):
     """Timezone info class for testing purposes"""
@@ -462,6 +665,54 @@ class DateTimeTestCase(unittest.TestCase, Base):
         check = datetime.datetime(2011, 11, 17, 9, 30, 45, 150000, tzinfo=UTC)
         self.assertEqual(check, t.convert("20111117033045.150[-:CST]"))
 
+    def test_convert_offsets(self):
+        t = self.type_()
+        check = datetime.datetime(2011, 11, 17, 7, 0, 45, 150000, tzinfo=UTC)
+        self.assertEqual(check, t.convert("20111117033045.150[-3.30:NST]"))
+        self.assertEqual(check, t.convert("20111117033045.150[-3:30]"))
+        check = datetime.datetime(2011, 11, 16, 22, 0, 45, 150000, tzinfo=UTC)
+        self.assertEqual(check, t.convert("20111117033045.150[+5.30:IST]"))
+        check = datetime.datetime(2011, 11, 17, 3, 30, 45, 150000, tzinfo=UTC)
+        self.assertEqual(check, t.convert("20111117033045.150[0]"))
+
+    def test_split_fixed(self):
+        # Fast path agrees with ``regex`` for the shapes it accepts...
+        for value in (
+            "20111117",
+            "20111117033045",
+            "20111117033045.150",
+            "20111117033045[-6]",
+            "20111117033045.150[+0:UTC]",
+            "20111117033045.150[-3.30:NST]",
+            "20111117033045.150[+14]",
+        ):
+            fields = self.type_._split_fixed(value)
+            self.assertIsNotNone(fields)
+            self.assertEqual(fields, self.type_._split_regex(value))
+
+        # ...and leaves the others to it
+        for value in (
+            "20111117033045.150[-:CST]",
+            "20111117033045.150[-3:30]",
+            "20111117033045.150[-0500]",
+            "20111117.150",
+            "20111317",
+            "2011111703304\u0663",
+        ):
+            self.assertIsNone(self.type_._split_fixed(value))
+
+    def test_convert_cached(self):
+        t = self.type_()
+        value = "20111117033045.150[-6:CST]"
+        self.assertIs(t.convert(value), t.convert(value))
+        self.assertIs(t.convert(value), self.type_().convert(value))
+
+        # Conversion doesn't touch the (shared) unconvert() dispatch registry
+        dispatcher = vars(self.type_)["unconvert"].dispatcher
+        registry = dict(dispatcher.registry)
+        t.convert("20200101")
+        self.assertEqual(dict(dispatcher.registry), registry)
+
     def test_convert_illegal(self):
         t = self.type_()
         # Don't accept timezone-naive datetime
@@ -489,6 +740,19 @@ class DateTimeTestCase(unittest.TestCase, Base):
         with self.assertRaises(ValueError):
             t.convert("20111117033045.150[-:GMT]")
 
+    def test_convert_out_of_range(self):
+        # Fields matching the OFX format that don't make a valid datetime
+        t = self.type_()
+        for value in (
+            "20200101235960",
+            "20200101235960.000[-5:EST]",
+            "20200230",
+            "20190229120000",
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(OFXSpecError):
+                    t.convert(value)
+
     def test_unconvert(self):
         t = self.type_()
         check = datetime.datetime(2007, 1, 1, tzinfo=UTC)
@@ -613,7 +877,7 @@ class TimeTestCase(unittest.TestCase, Base):
         with self.assertRaises(ValueError):
             t.convert("036045.150[-:CST]")
 
-        with self.assertRaises(ValueError):
+        with self.assertRaises(OFXSpecError):
             t.convert("033060.150[-:CST]")
 
         # Don't accept integer